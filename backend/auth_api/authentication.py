@@ -0,0 +1,62 @@
+from django.conf import settings
+from django.core.cache import cache
+from django.utils.translation import gettext_lazy as _
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+
+USER_SNAPSHOT_CACHE_KEY = "user_snapshot:{}"
+USER_SNAPSHOT_FIELDS = ("id", "is_active", "is_staff", "is_superuser", "is_agent")
+
+
+def invalidate_user_snapshot(user_id):
+    """Drop the cached snapshot, called whenever the user is saved or deleted."""
+    cache.delete(USER_SNAPSHOT_CACHE_KEY.format(user_id))
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """
+    JWTAuthentication without the user query on every request. The fields
+    permissions need are cached for USER_SNAPSHOT_CACHE_TTL, any other field
+    is deferred and loaded on first access.
+    """
+
+    def get_user(self, validated_token):
+        if api_settings.CHECK_REVOKE_TOKEN:
+            # Needs the password hash, which is never cached
+            return super().get_user(validated_token)
+
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError as e:
+            raise InvalidToken(
+                _("Token contained no recognizable user identification")
+            ) from e
+
+        key = USER_SNAPSHOT_CACHE_KEY.format(user_id)
+        snapshot = cache.get(key)
+        if snapshot is None:
+            snapshot = (
+                self.user_model.objects.filter(**{api_settings.USER_ID_FIELD: user_id})
+                .values(*USER_SNAPSHOT_FIELDS)
+                .first()
+            )
+            if snapshot is None:
+                raise AuthenticationFailed(_("User not found"), code="user_not_found")
+            cache.set(key, snapshot, settings.USER_SNAPSHOT_CACHE_TTL)
+
+        # from_db takes the values in model field order
+        field_names = [
+            field.attname
+            for field in self.user_model._meta.concrete_fields
+            if field.attname in snapshot
+        ]
+        user = self.user_model.from_db(
+            "default", field_names, [snapshot[name] for name in field_names]
+        )
+
+        if api_settings.CHECK_USER_IS_ACTIVE and not user.is_active:
+            raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+
+        return user
@@ -0,0 +1,143 @@
+import time
+import numpy as np
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import check_password, identify_hasher
+from django.db import connection
+from rest_framework.test import APIRequestFactory
+from backend.query_inspection import QueryRecorder
+from .tokens import RoleRefreshToken
+from .views import LoginView, RefreshTokenView
+
+BENCH_EMAIL = "bench-login@example.com"
+BENCH_PASSWORD = "Bench@Login123"
+
+
+def percentiles(values):
+    """p50 / p95 / max of a list of seconds, in milliseconds."""
+    values = np.array(values) * 1000
+    return {
+        "p50_ms": round(float(np.percentile(values, 50)), 2),
+        "p95_ms": round(float(np.percentile(values, 95)), 2),
+        "max_ms": round(float(values.max()), 2),
+    }
+
+
+def benchmark_user():
+    """A fresh active user to log in as, hashed with the current hasher."""
+    get_user_model().objects.filter(email=BENCH_EMAIL).delete()
+    return get_user_model().objects.create_user(
+        email=BENCH_EMAIL, password=BENCH_PASSWORD
+    )
+
+
+def time_hashes(encoded, count):
+    """Seconds of each check_password call on its own."""
+    timings = []
+    for _ in range(count):
+        start = time.perf_counter()
+        check_password(BENCH_PASSWORD, encoded)
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def time_logins(count):
+    """Seconds of each login through LoginView, and the queries they ran."""
+    # Throttling would cut the run short, the login itself is what is measured
+    view = LoginView.as_view(throttle_classes=[])
+    factory = APIRequestFactory()
+    recorder = QueryRecorder()
+    timings = []
+
+    with connection.execute_wrapper(recorder):
+        for _ in range(count):
+            request = factory.post(
+                "/auth/login/",
+                {"email": BENCH_EMAIL, "password": BENCH_PASSWORD},
+                format="json",
+            )
+            start = time.perf_counter()
+            response = view(request)
+            timings.append(time.perf_counter() - start)
+
+            if response.status_code != 200:
+                raise RuntimeError(f"Login failed: {response.data}")
+
+    return timings, recorder.count
+
+
+def time_refreshes(user, count):
+    """
+    Seconds of each refresh through RefreshTokenView, and the queries they
+    ran. Every refresh rotates the token the previous one returned.
+    """
+    view = RefreshTokenView.as_view()
+    factory = APIRequestFactory()
+    recorder = QueryRecorder()
+    refresh = str(RoleRefreshToken.for_user(user))
+    timings = []
+
+    with connection.execute_wrapper(recorder):
+        for _ in range(count):
+            request = factory.post(
+                "/auth/refresh-token/", {"refresh": refresh}, format="json"
+            )
+            start = time.perf_counter()
+            response = view(request)
+            timings.append(time.perf_counter() - start)
+
+            if response.status_code != 200:
+                raise RuntimeError(f"Refresh failed: {response.data}")
+            refresh = response.data["refresh_token"]
+
+    return timings, recorder.count
+
+
+def run_benchmark(logins, refreshes=0, warmup=3):
+    """
+    Logs in sequentially in this process, i.e. one sync worker, and returns
+    logins per second next to the cost of one password hash. A login costing
+    about one hash means the hash is the only expensive step left.
+    With refreshes, times that many chained token refreshes as well.
+    """
+    user = benchmark_user()
+    try:
+        hasher = identify_hasher(user.password)
+        time_logins(warmup)
+
+        hashes = time_hashes(user.password, min(logins, 20))
+        start = time.perf_counter()
+        timings, queries = time_logins(logins)
+        elapsed = time.perf_counter() - start
+
+        hash_p50 = float(np.percentile(hashes, 50))
+        login_p50 = float(np.percentile(timings, 50))
+        result = {
+            "config": {
+                "logins": logins,
+                "refreshes": refreshes,
+                "hasher": hasher.algorithm,
+                "iterations": hasher.decode(user.password).get("iterations"),
+            },
+            "logins_per_s": round(logins / elapsed, 2),
+            "login": percentiles(timings),
+            "password_hash": percentiles(hashes),
+            "hashes_per_login": round(login_p50 / hash_p50, 2),
+            "db_queries_per_login": round(queries / logins, 2),
+        }
+
+        if refreshes:
+            time_refreshes(user, warmup)
+            start = time.perf_counter()
+            timings, queries = time_refreshes(user, refreshes)
+            elapsed = time.perf_counter() - start
+            result.update(
+                {
+                    "refreshes_per_s": round(refreshes / elapsed, 2),
+                    "refresh": percentiles(timings),
+                    "db_queries_per_refresh": round(queries / refreshes, 2),
+                }
+            )
+
+        return result
+    finally:
+        user.delete()
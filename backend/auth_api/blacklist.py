@@ -0,0 +1,91 @@
+import time
+from django.conf import settings
+from django.core.cache import caches
+from django.utils.timezone import now
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.token_blacklist.models import (
+    BlacklistedToken,
+    OutstandingToken,
+)
+from rest_framework_simplejwt.tokens import Token
+
+BLACKLIST_CACHE_KEY = "jwt_blacklist:{}"
+
+
+def blacklist_cache():
+    return caches[settings.TOKEN_BLACKLIST_CACHE]
+
+
+def blacklist_jti(jti, exp):
+    """
+    Revoke a JTI until its token expires, after that it is rejected anyway.
+    False when it was already revoked, SET NX makes rotation single use.
+    """
+    ttl = max(int(exp - time.time()), 1)
+    return blacklist_cache().add(BLACKLIST_CACHE_KEY.format(jti), 1, ttl)
+
+
+def is_blacklisted(jti):
+    return blacklist_cache().get(BLACKLIST_CACHE_KEY.format(jti)) is not None
+
+
+class RedisBlacklistMixin:
+    """
+    Keeps revoked JTIs in the cache (Redis in production) instead of the
+    OutstandingToken / BlacklistedToken tables, refresh and logout run no query.
+    """
+
+    # BlacklistMixin is skipped, its methods query the blacklist tables
+    def verify(self, *args, **kwargs):
+        self.check_blacklist()
+        Token.verify(self, *args, **kwargs)
+
+    def check_blacklist(self):
+        if is_blacklisted(self.payload[api_settings.JTI_CLAIM]):
+            raise TokenError(_("Token is blacklisted"))
+
+    def blacklist(self):
+        if not blacklist_jti(self.payload[api_settings.JTI_CLAIM], self["exp"]):
+            raise TokenError(_("Token is blacklisted"))
+
+    def outstand(self):
+        """Issued tokens are no longer tracked, only revoked ones."""
+        return None
+
+    @classmethod
+    def for_user(cls, user):
+        return Token.for_user.__func__(cls, user)
+
+
+def migrate_sql_blacklist(batch_size):
+    """Copy the unexpired JTIs of the SQL blacklist into the cache."""
+    copied = 0
+    rows = (
+        BlacklistedToken.objects.filter(token__expires_at__gt=now())
+        .values_list("token__jti", "token__expires_at")
+        .iterator(chunk_size=batch_size)
+    )
+    for jti, expires_at in rows:
+        blacklist_jti(jti, expires_at.timestamp())
+        copied += 1
+    return copied
+
+
+def prune_sql_tokens(batch_size, expired_only=True):
+    """
+    Delete OutstandingToken rows (their BlacklistedToken rows cascade) in
+    batches, so the tables are never locked for long.
+    """
+    tokens = OutstandingToken.objects.order_by("id")
+    if expired_only:
+        tokens = tokens.filter(expires_at__lte=now())
+
+    deleted = 0
+    while True:
+        batch = list(tokens.values_list("id", flat=True)[:batch_size])
+        if not batch:
+            return deleted
+        OutstandingToken.objects.filter(id__in=batch).delete()
+        deleted += len(batch)
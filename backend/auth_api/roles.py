@@ -0,0 +1,57 @@
+from django.conf import settings
+from django.contrib.auth.models import Group
+from django.core.cache import cache
+from django.db.models import Case, OuterRef, Subquery, Value, When
+
+# Group names in the order a user's role is picked from them
+USER_ROLES = ("Default", "Agent", "Admin", "Superuser")
+USER_ROLE_CACHE_KEY = "user_role:{}"
+
+
+def with_user_role(queryset):
+    """Annotate user_role, so the role comes with the user in one query."""
+    role_order = Case(
+        *[When(name=role, then=Value(i)) for i, role in enumerate(USER_ROLES)]
+    )
+    roles = (
+        Group.objects.filter(user=OuterRef("pk"), name__in=USER_ROLES)
+        .order_by(role_order)
+        .values("name")[:1]
+    )
+    return queryset.annotate(user_role=Subquery(roles))
+
+
+def get_user_role(user):
+    """
+    Get user role, the first of USER_ROLES the user has a group for.
+    Annotated users need no query, others hit the role cache first.
+    """
+    if "user_role" not in user.__dict__:
+        key = USER_ROLE_CACHE_KEY.format(user.pk)
+        role = cache.get(key)
+        if role is not None:
+            return role
+
+        user_groups = set(user.groups.values_list("name", flat=True))
+        user.user_role = next(
+            (user_role for user_role in USER_ROLES if user_role in user_groups), None
+        )
+
+    role = user.user_role or "UnAuthorized"
+    cache.set(USER_ROLE_CACHE_KEY.format(user.pk), role, settings.USER_ROLE_CACHE_TTL)
+    return role
+
+
+def invalidate_user_role(user_id):
+    """Drop the cached role, called whenever the user's groups change."""
+    cache.delete(USER_ROLE_CACHE_KEY.format(user_id))
+
+
+def role_claims(user):
+    """Claims downstream services authorize with instead of a user lookup."""
+    return {
+        "role": get_user_role(user),
+        "is_agent": user.is_agent,
+        "is_staff": user.is_staff,
+        "is_superuser": user.is_superuser,
+    }
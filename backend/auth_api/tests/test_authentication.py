@@ -0,0 +1,82 @@
+from django.urls import reverse
+from django.core.cache import cache
+from django.contrib.auth import get_user_model
+from rest_framework import status
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework.test import APITestCase, APIClient
+from rest_framework_simplejwt.tokens import AccessToken
+from auth_api.authentication import CachedJWTAuthentication
+
+User = get_user_model()
+USER_DETAIL_URL = lambda pk: reverse("user-detail", kwargs={"pk": pk})
+
+
+class CachedJWTAuthenticationTests(APITestCase):
+    """Tests for the cached user snapshot of CachedJWTAuthentication."""
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email="test@example.com",
+            username="testuser",
+            password="StrongPassword123!",
+            is_agent=True,
+        )
+        self.token = AccessToken.for_user(self.user)
+        self.authentication = CachedJWTAuthentication()
+        self.client = APIClient()
+        cache.clear()
+
+    def tearDown(self):
+        cache.clear()
+        super().tearDown()
+
+    def test_snapshot_is_cached(self):
+        """Test that only the first authentication queries the user."""
+        with self.assertNumQueries(1):
+            self.authentication.get_user(self.token)
+
+        with self.assertNumQueries(0):
+            user = self.authentication.get_user(self.token)
+
+        self.assertEqual(user, self.user)
+        self.assertTrue(user.is_agent)
+        self.assertFalse(user.is_staff)
+
+    def test_other_fields_load_on_access(self):
+        """Test that fields outside the snapshot are loaded when read."""
+        self.authentication.get_user(self.token)
+        user = self.authentication.get_user(self.token)
+
+        with self.assertNumQueries(1):
+            self.assertEqual(user.email, self.user.email)
+
+    def test_deactivation_applies_to_next_request(self):
+        """Test that saving an inactive user rejects their cached token."""
+        self.authentication.get_user(self.token)
+
+        self.user.is_active = False
+        self.user.save()
+
+        with self.assertRaises(AuthenticationFailed):
+            self.authentication.get_user(self.token)
+
+    def test_deleted_user_is_rejected(self):
+        """Test that a deleted user's cached snapshot is dropped."""
+        self.authentication.get_user(self.token)
+        self.user.delete()
+
+        with self.assertRaises(AuthenticationFailed):
+            self.authentication.get_user(self.token)
+
+    def test_warm_request_skips_user_query(self):
+        """Test that a request with a cached snapshot runs one query less."""
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {self.token}")
+
+        with self.assertNumQueries(2):
+            response = self.client.get(USER_DETAIL_URL(self.user.pk))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        with self.assertNumQueries(1):
+            response = self.client.get(USER_DETAIL_URL(self.user.pk))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["email"], self.user.email)
@@ -0,0 +1,54 @@
+import json
+from io import StringIO
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from rest_framework.test import APITestCase
+from auth_api.benchmark import BENCH_EMAIL, percentiles
+
+
+class BenchmarkLoginTests(APITestCase):
+    """Tests for the benchmark_login command."""
+
+    def run_benchmark(self, *args):
+        out = StringIO()
+        call_command("benchmark_login", *args, stdout=out)
+        return json.loads(out.getvalue())
+
+    def test_reports_logins_per_second_and_hash_cost(self):
+        """Test that a run reports throughput, latency and queries per login."""
+        result = self.run_benchmark("--logins", "2", "--refreshes", "0")
+
+        self.assertEqual(result["config"]["logins"], 2)
+        self.assertGreater(result["logins_per_s"], 0)
+        self.assertIsNotNone(result["login"]["p95_ms"])
+        self.assertIsNotNone(result["password_hash"]["p50_ms"])
+        self.assertEqual(result["db_queries_per_login"], 1)
+
+    def test_reports_refreshes_per_second(self):
+        """Test that a run with refreshes reports their throughput and queries."""
+        result = self.run_benchmark("--logins", "1", "--refreshes", "3")
+
+        self.assertEqual(result["config"]["refreshes"], 3)
+        self.assertGreater(result["refreshes_per_s"], 0)
+        self.assertIsNotNone(result["refresh"]["p95_ms"])
+        self.assertEqual(result["db_queries_per_refresh"], 1)
+
+    def test_benchmark_user_is_removed(self):
+        """Test that the benchmark user is deleted after the run."""
+        self.run_benchmark("--logins", "1", "--refreshes", "1")
+        self.assertFalse(get_user_model().objects.filter(email=BENCH_EMAIL).exists())
+
+    def test_rejects_zero_logins(self):
+        """Test that fewer than one login is rejected."""
+        with self.assertRaises(CommandError):
+            self.run_benchmark("--logins", "0")
+
+    def test_rejects_negative_refreshes(self):
+        """Test that a negative refresh count is rejected."""
+        with self.assertRaises(CommandError):
+            self.run_benchmark("--logins", "1", "--refreshes", "-1")
+
+    def test_percentiles(self):
+        """Test that percentiles are reported in milliseconds."""
+        self.assertEqual(percentiles([0.1, 0.2, 0.3])["p50_ms"], 200.0)
@@ -0,0 +1,141 @@
+from datetime import timedelta
+from io import StringIO
+from django.urls import reverse
+from django.core.cache import cache
+from django.core.management import call_command
+from django.contrib.auth import get_user_model
+from django.utils.timezone import now
+from rest_framework import status
+from rest_framework.test import APITestCase, APIClient
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.token_blacklist.models import (
+    BlacklistedToken,
+    OutstandingToken,
+)
+from auth_api.blacklist import BLACKLIST_CACHE_KEY, blacklist_cache, is_blacklisted
+from auth_api.tokens import RoleRefreshToken
+
+User = get_user_model()
+TEST_PASSWORD = "StrongPassword123!"
+
+
+class CacheBlacklistTests(APITestCase):
+    """Tests for the cache backed refresh token blacklist."""
+
+    def setUp(self):
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            email="test@example.com", password=TEST_PASSWORD
+        )
+        self.refresh = self.client.post(
+            reverse("login"),
+            {"email": self.user.email, "password": TEST_PASSWORD},
+            format="json",
+        ).data["refresh_token"]
+
+    def tearDown(self):
+        cache.clear()
+        blacklist_cache().clear()
+        super().tearDown()
+
+    def _refresh(self, token):
+        return self.client.post(
+            reverse("refresh-token"), {"refresh": token}, format="json"
+        )
+
+    def test_rotation_revokes_old_token_without_rows(self):
+        """Test that a rotated refresh token is rejected and no rows are written."""
+        response = self._refresh(self.refresh)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        reused = self._refresh(self.refresh)
+        self.assertEqual(reused.status_code, status.HTTP_401_UNAUTHORIZED)
+
+        self.assertFalse(OutstandingToken.objects.exists())
+        self.assertFalse(BlacklistedToken.objects.exists())
+
+    def test_logout_revokes_until_expiry(self):
+        """Test that logging out keeps the JTI revoked for the token's lifetime."""
+        with self.assertNumQueries(0):
+            response = self.client.post(
+                reverse("logout"), {"refresh": self.refresh}, format="json"
+            )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        token = RoleRefreshToken(self.refresh, verify=False)
+        self.assertTrue(is_blacklisted(token["jti"]))
+        # LocMemCache keeps the expiry timestamp of each key
+        revoked = blacklist_cache()
+        key = revoked.make_key(BLACKLIST_CACHE_KEY.format(token["jti"]))
+        expires_at = revoked._expire_info[key]  # pylint: disable=W0212
+        self.assertAlmostEqual(expires_at, token["exp"], delta=5)
+
+    def test_blacklisting_twice_fails(self):
+        """Test that only one of two concurrent rotations can revoke a token."""
+        first = RoleRefreshToken(self.refresh)
+        second = RoleRefreshToken(self.refresh)
+
+        first.blacklist()
+        with self.assertRaises(TokenError):
+            second.blacklist()
+
+    def test_clearing_default_cache_keeps_revocations(self):
+        """Test that flushing the default cache does not un-revoke a token."""
+        RoleRefreshToken(self.refresh).blacklist()
+
+        cache.clear()
+
+        reused = self._refresh(self.refresh)
+        self.assertEqual(reused.status_code, status.HTTP_401_UNAUTHORIZED)
+
+
+class PruneTokenBlacklistTests(APITestCase):
+    """Tests for the prune_token_blacklist command."""
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email="test@example.com", password=TEST_PASSWORD
+        )
+        self.expired = [self._token(f"expired-{i}", -1) for i in range(3)]
+        self.valid = [self._token(f"valid-{i}", 1) for i in range(2)]
+        for token in (self.expired[0], self.valid[0]):
+            BlacklistedToken.objects.create(token=token)
+
+    def tearDown(self):
+        blacklist_cache().clear()
+        super().tearDown()
+
+    def _token(self, jti, days):
+        return OutstandingToken.objects.create(
+            user=self.user,
+            jti=jti,
+            token=jti,
+            created_at=now(),
+            expires_at=now() + timedelta(days=days),
+        )
+
+    def _prune(self, *args):
+        out = StringIO()
+        call_command("prune_token_blacklist", *args, stdout=out)
+        return out.getvalue()
+
+    def test_prunes_expired_rows_in_batches(self):
+        """Test that only expired rows are deleted, batch by batch."""
+        output = self._prune("--batch-size", "2")
+
+        self.assertIn("Deleted 3 token rows", output)
+        self.assertEqual(
+            set(OutstandingToken.objects.values_list("jti", flat=True)),
+            {"valid-0", "valid-1"},
+        )
+        self.assertEqual(BlacklistedToken.objects.count(), 1)
+
+    def test_migrate_moves_blacklist_to_cache(self):
+        """Test that --migrate copies unexpired revocations and empties the tables."""
+        output = self._prune("--migrate")
+
+        self.assertIn("Copied 1 blacklisted JTIs", output)
+        self.assertTrue(is_blacklisted("valid-0"))
+        self.assertFalse(is_blacklisted("expired-0"))
+        self.assertFalse(OutstandingToken.objects.exists())
+        self.assertFalse(BlacklistedToken.objects.exists())
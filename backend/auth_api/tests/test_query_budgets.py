@@ -0,0 +1,175 @@
+from django.urls import reverse
+from django.core.cache import cache
+from django.contrib.auth import get_user_model
+from rest_framework import status
+from rest_framework.test import APITestCase, APIClient
+from rest_framework_simplejwt.tokens import RefreshToken
+from backend.query_inspection import QueryBudgetMixin
+from core_db.models import Agent
+
+User = get_user_model()
+TEST_PASSWORD = "StrongPassword123!"
+USER_LIST_URL = reverse("user-list")
+USER_DETAIL_URL = lambda pk: reverse("user-detail", kwargs={"pk": pk})
+AGENT_LIST_URL = reverse("agent-list")
+AGENT_DETAIL_URL = lambda pk: reverse("agent-detail", kwargs={"pk": pk})
+
+
+# Budgets are the queries of each endpoint today, including the user lookup
+# of JWT authentication on a cold snapshot cache, so requests carry a real
+# access token.
+class AuthQueryBudgetTests(QueryBudgetMixin, APITestCase):
+    """Query budgets of the login, token and user endpoints."""
+
+    def setUp(self):
+        self.superuser = User.objects.create_superuser(
+            email="super@test.com", username="superadmin", password=TEST_PASSWORD
+        )
+        self.user = User.objects.create_user(
+            email="normal@test.com", username="normaluser", password=TEST_PASSWORD
+        )
+        # Several agents, so per-row queries would show up as repeats
+        for i in range(5):
+            agent_user = User.objects.create_user(
+                email=f"agent{i}@test.com",
+                username=f"agentuser{i}",
+                password=TEST_PASSWORD,
+                is_agent=True,
+            )
+            Agent.objects.create(user=agent_user, company_name=f"Realty {i}")
+        self.agent_user = agent_user
+
+        self.client = APIClient()
+
+    def tearDown(self):
+        cache.clear()
+        super().tearDown()
+
+    def _authenticate(self, user):
+        token = RefreshToken.for_user(user).access_token
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+
+    def _login(self, user):
+        return self.client.post(
+            reverse("login"),
+            {"email": user.email, "password": TEST_PASSWORD},
+            format="json",
+        )
+
+    def test_login_budget(self):
+        """Test that logging in stays within its query budget."""
+        with self.assertQueryBudget(1):
+            response = self._login(self.agent_user)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_refresh_budget(self):
+        """Test that refreshing a token stays within its query budget."""
+        refresh = self._login(self.agent_user).data["refresh_token"]
+
+        with self.assertQueryBudget(1):
+            response = self.client.post(
+                reverse("refresh-token"), {"refresh": refresh}, format="json"
+            )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_logout_budget(self):
+        """Test that logging out stays within its query budget."""
+        refresh = self._login(self.user).data["refresh_token"]
+        self._authenticate(self.user)
+
+        with self.assertQueryBudget(0):
+            response = self.client.post(
+                reverse("logout"), {"refresh": refresh}, format="json"
+            )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_user_list_budget(self):
+        """Test that listing users stays within its query budget."""
+        self._authenticate(self.superuser)
+        with self.assertQueryBudget(3, max_repeats=1):
+            response = self.client.get(USER_LIST_URL)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_user_retrieve_budget(self):
+        """Test that retrieving a user stays within its query budget."""
+        self._authenticate(self.user)
+        with self.assertQueryBudget(2):
+            response = self.client.get(USER_DETAIL_URL(self.user.pk))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_user_create_budget(self):
+        """Test that registering a user stays within its query budget."""
+        data = {
+            "email": "newuser@test.com",
+            "username": "newuser123",
+            "password": "NewP@ss123!",
+            "c_password": "NewP@ss123!",
+            "first_name": "New",
+            "last_name": "User",
+        }
+        with self.assertQueryBudget(12):
+            response = self.client.post(USER_LIST_URL, data, format="json")
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+    def test_user_update_budget(self):
+        """Test that updating a user stays within its query budget."""
+        self._authenticate(self.user)
+        with self.assertQueryBudget(6):
+            response = self.client.patch(
+                USER_DETAIL_URL(self.user.pk), {"first_name": "Renamed"}, format="json"
+            )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_user_destroy_budget(self):
+        """Test that deleting a user stays within its query budget."""
+        self._authenticate(self.superuser)
+        with self.assertQueryBudget(12):
+            response = self.client.delete(USER_DETAIL_URL(self.user.pk))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_agent_list_budget(self):
+        """Test that listing agents stays within its query budget."""
+        self._authenticate(self.user)
+        with self.assertQueryBudget(1, max_repeats=1):
+            response = self.client.get(AGENT_LIST_URL)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_agent_retrieve_budget(self):
+        """Test that retrieving an agent stays within its query budget."""
+        self._authenticate(self.user)
+        with self.assertQueryBudget(2):
+            response = self.client.get(AGENT_DETAIL_URL(self.agent_user.pk))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_agent_create_budget(self):
+        """Test that registering an agent stays within its query budget."""
+        data = {
+            "email": "newagent@test.com",
+            "username": "newagent123",
+            "password": "NewP@ss123!",
+            "c_password": "NewP@ss123!",
+            "first_name": "New",
+            "last_name": "Agent",
+            "company_name": "Test Agency Inc.",
+        }
+        with self.assertQueryBudget(21):
+            response = self.client.post(AGENT_LIST_URL, data, format="json")
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+    def test_agent_update_budget(self):
+        """Test that updating an agent stays within its query budget."""
+        self._authenticate(self.agent_user)
+        with self.assertQueryBudget(10):
+            response = self.client.patch(
+                AGENT_DETAIL_URL(self.agent_user.pk),
+                {"first_name": "Renamed", "bio": "Lofts and condos"},
+                format="json",
+            )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_agent_destroy_budget(self):
+        """Test that deleting an agent stays within its query budget."""
+        self._authenticate(self.superuser)
+        with self.assertQueryBudget(14):
+            response = self.client.delete(AGENT_DETAIL_URL(self.agent_user.pk))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
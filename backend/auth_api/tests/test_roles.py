@@ -0,0 +1,92 @@
+from django.urls import reverse
+from django.core.cache import cache
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Group
+from rest_framework import status
+from rest_framework.test import APITestCase, APIClient
+from rest_framework_simplejwt.tokens import AccessToken
+from auth_api.roles import USER_ROLE_CACHE_KEY, get_user_role
+
+User = get_user_model()
+TEST_PASSWORD = "StrongPassword123!"
+
+
+class RoleClaimsTests(APITestCase):
+    """Tests for the role claims in tokens and the cached role."""
+
+    def setUp(self):
+        self.client = APIClient()
+        self.agent_user = User.objects.create_user(
+            email="agent@test.com",
+            username="agentuser",
+            password=TEST_PASSWORD,
+            is_agent=True,
+        )
+        cache.clear()
+
+    def tearDown(self):
+        cache.clear()
+        super().tearDown()
+
+    def _login(self):
+        return self.client.post(
+            reverse("login"),
+            {"email": self.agent_user.email, "password": TEST_PASSWORD},
+            format="json",
+        )
+
+    def test_access_token_carries_role_claims(self):
+        """Test that the login access token carries the role claims."""
+        response = self._login()
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        access = AccessToken(response.data["access_token"])
+        self.assertEqual(access["role"], "Agent")
+        self.assertTrue(access["is_agent"])
+        self.assertFalse(access["is_staff"])
+        self.assertFalse(access["is_superuser"])
+
+    def test_refresh_restamps_changed_role(self):
+        """Test that a refreshed access token carries the current role."""
+        refresh = self._login().data["refresh_token"]
+
+        self.agent_user.groups.clear()
+        self.agent_user.groups.add(Group.objects.get_or_create(name="Admin")[0])
+
+        response = self.client.post(
+            reverse("refresh-token"), {"refresh": refresh}, format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["user_role"], "Admin")
+        self.assertEqual(AccessToken(response.data["access_token"])["role"], "Admin")
+
+    def test_role_is_cached(self):
+        """Test that a resolved role is served from the cache."""
+        self.assertEqual(get_user_role(self.agent_user), "Agent")
+
+        user = User.objects.get(pk=self.agent_user.pk)
+        with self.assertNumQueries(0):
+            self.assertEqual(get_user_role(user), "Agent")
+
+    def test_group_changes_invalidate_role(self):
+        """Test that adding, removing and clearing groups drops the cached role."""
+        key = USER_ROLE_CACHE_KEY.format(self.agent_user.pk)
+        agent_group = Group.objects.get(name="Agent")
+
+        for change in (
+            lambda: self.agent_user.groups.remove(agent_group),
+            lambda: self.agent_user.groups.add(agent_group),
+            lambda: self.agent_user.groups.clear(),
+            lambda: agent_group.user_set.add(self.agent_user),
+            lambda: agent_group.user_set.clear(),
+        ):
+            get_user_role(self.agent_user)
+            self.assertIsNotNone(cache.get(key))
+            change()
+            self.assertIsNone(cache.get(key))
+            self.agent_user = User.objects.get(pk=self.agent_user.pk)
+
+    def test_user_without_groups_is_unauthorized(self):
+        """Test that a user without a role group gets the UnAuthorized role."""
+        self.agent_user.groups.clear()
+        self.assertEqual(get_user_role(self.agent_user), "UnAuthorized")
@@ -0,0 +1,117 @@
+import hashlib
+from unittest.mock import patch
+from django.urls import reverse
+from django.contrib.auth import get_user_model
+from django.test import override_settings
+from redis.exceptions import ConnectionError as RedisConnectionError
+from rest_framework import status
+from rest_framework.test import APITestCase, APIClient
+
+User = get_user_model()
+TEST_PASSWORD = "StrongPassword123!"
+LOGIN_URL = reverse("login")
+USER_LIST_URL = reverse("user-list")
+AGENT_LIST_URL = reverse("agent-list")
+LOCMEM_CACHE = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+
+
+@override_settings(THROTTLE_ENABLED=True)
+@patch("backend.throttling.get_redis_connection")
+class ThrottlingTests(APITestCase):
+    """Tests for the Redis GCRA throttles of login and sign-up."""
+
+    def setUp(self):
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            email="test@example.com", password=TEST_PASSWORD
+        )
+
+    def _login(self, email="test@example.com"):
+        return self.client.post(
+            LOGIN_URL, {"email": email, "password": TEST_PASSWORD}, format="json"
+        )
+
+    def test_login_checks_ip_and_email_rates(self, get_redis_connection):
+        """Test that a login runs the script once per IP and once per email."""
+        evalsha = get_redis_connection.return_value.evalsha
+        evalsha.return_value = 0
+
+        self._login(" Test@Example.com ")
+
+        (ip_call, email_call) = evalsha.call_args_list
+        email_hash = hashlib.sha256(b"test@example.com").hexdigest()
+        self.assertTrue(ip_call.args[2].endswith("throttle_login_ip_127.0.0.1"))
+        self.assertTrue(
+            email_call.args[2].endswith(f"throttle_login_email_{email_hash}")
+        )
+        # 20/min: one request every 3 s, a minute of burst
+        self.assertEqual(list(ip_call.args[3:]), [3000, 60000])
+        self.assertEqual(list(email_call.args[3:]), [12000, 60000])
+
+    def test_throttled_login_sets_retry_after(self, get_redis_connection):
+        """Test that a throttled login returns 429 with Retry-After in seconds."""
+        evalsha = get_redis_connection.return_value.evalsha
+        evalsha.side_effect = [0, 2500]
+
+        response = self._login()
+
+        self.assertEqual(response.status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+        self.assertEqual(response["Retry-After"], "3")
+        self.assertIn("3 seconds", response.json()["errors"])
+
+    def test_client_ip_is_read_from_forwarded_header(self, get_redis_connection):
+        """Test that the IP forwarded by the frontend server is the identity."""
+        evalsha = get_redis_connection.return_value.evalsha
+        evalsha.return_value = 0
+
+        self.client.post(
+            LOGIN_URL,
+            {"email": self.user.email, "password": TEST_PASSWORD},
+            format="json",
+            HTTP_X_FORWARDED_FOR="203.0.113.7",
+        )
+
+        ip_key = evalsha.call_args_list[0].args[2]
+        self.assertTrue(ip_key.endswith("throttle_login_ip_203.0.113.7"))
+
+    def test_only_sign_up_is_throttled(self, get_redis_connection):
+        """Test that user and agent creation are throttled but reads are not."""
+        evalsha = get_redis_connection.return_value.evalsha
+        evalsha.return_value = 1000
+
+        for url in (USER_LIST_URL, AGENT_LIST_URL):
+            response = self.client.post(url, {}, format="json")
+            self.assertEqual(response.status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+
+        evalsha.reset_mock()
+        self.client.force_authenticate(user=self.user)
+        response = self.client.get(reverse("user-detail", args=[self.user.id]))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        evalsha.assert_not_called()
+
+    def test_redis_errors_let_requests_through(self, get_redis_connection):
+        """Test that an unreachable Redis does not block logins."""
+        evalsha = get_redis_connection.return_value.evalsha
+        evalsha.side_effect = RedisConnectionError("Connection refused")
+
+        with self.assertLogs("backend.throttling", level="WARNING"):
+            response = self._login()
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    @override_settings(CACHES=LOCMEM_CACHE)
+    def test_per_process_cache_is_not_used(self, get_redis_connection):
+        """Test that without Redis nothing is throttled."""
+        get_redis_connection.side_effect = NotImplementedError
+
+        for _ in range(6):
+            self.assertEqual(self._login().status_code, status.HTTP_200_OK)
+
+    @override_settings(THROTTLE_ENABLED=False)
+    def test_disabled_throttling_skips_redis(self, get_redis_connection):
+        """Test that THROTTLE_ENABLED=False never touches Redis."""
+        response = self._login()
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        get_redis_connection.assert_not_called()
@@ -1,5 +1,6 @@
 import os
 import jwt
+from unittest.mock import patch
 from rest_framework import status
 from rest_framework_simplejwt.tokens import RefreshToken
 from rest_framework.test import APITestCase
@@ -7,7 +8,9 @@ from rest_framework.test import APIClient
 from django.urls import reverse
 from django.core.cache import cache
 from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import check_password
 from core_db.models import Agent
+from auth_api.tokens import RoleRefreshToken
 
 from freezegun import freeze_time
 from datetime import timedelta, datetime
@@ -121,6 +124,31 @@ class LoginViewIntegrationTests(APITestCase):
             response.json(), {"errors": "Account is deactivated. Contact your admin"}
         )
 
+    def test_06_login_hashes_password_once(self):
+        """Tests that a login verifies the password with a single hash."""
+
+        with patch(
+            "django.contrib.auth.base_user.check_password", wraps=check_password
+        ) as hashed:
+            response = self.client.post(self.url, self.valid_payload, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(hashed.call_count, 1)
+
+    def test_07_login_tokens_belong_to_user(self):
+        """Tests that the minted token pair is issued for the logged in user."""
+
+        response = self.client.post(self.url, self.valid_payload, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        refresh = RefreshToken(response.data["refresh_token"])
+        self.assertEqual(str(refresh["user_id"]), str(self.agent_user.id))
+
+        refresh_response = self.client.post(
+            reverse("refresh-token"), {"refresh": str(refresh)}, format="json"
+        )
+        self.assertEqual(refresh_response.status_code, status.HTTP_200_OK)
+
 
 class RefreshTokenViewIntegrationTests(APITestCase):
     """Integration Test suite for RefreshTokenView."""
@@ -196,7 +224,7 @@ class RefreshTokenViewIntegrationTests(APITestCase):
     def test_04_refresh_token_that_is_blacklisted(self):
         """Tests failure when the refresh token has already been blacklisted (e.g., after logout)."""
         # 1. Blacklist the token (simulate a prior logout)
-        refresh_token_obj = RefreshToken(self.initial_refresh_token)
+        refresh_token_obj = RoleRefreshToken(self.initial_refresh_token)
         refresh_token_obj.blacklist()
 
         # 2. Attempt to refresh with the blacklisted token
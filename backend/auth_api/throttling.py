@@ -0,0 +1,19 @@
+import hashlib
+from backend.throttling import ScopedRateThrottle
+
+
+class LoginEmailRateThrottle(ScopedRateThrottle):
+    """
+    Limits logins per account, whichever IPs they come from.
+    The email is hashed so addresses do not end up in Redis keys.
+    """
+
+    scope_suffix = "email"
+
+    def get_cache_key(self, request, view):
+        email = request.data.get("email") if hasattr(request.data, "get") else None
+        if not isinstance(email, str) or not email.strip():
+            return None
+
+        ident = hashlib.sha256(email.strip().lower().encode()).hexdigest()
+        return self.cache_format % {"scope": self.scope, "ident": ident}
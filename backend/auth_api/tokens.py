@@ -0,0 +1,34 @@
+from rest_framework_simplejwt.serializers import (
+    TokenBlacklistSerializer,
+    TokenObtainPairSerializer,
+    TokenRefreshSerializer,
+)
+from rest_framework_simplejwt.tokens import RefreshToken
+from .blacklist import RedisBlacklistMixin
+from .roles import role_claims
+
+
+class RoleRefreshToken(RedisBlacklistMixin, RefreshToken):
+    """
+    Refresh token carrying the role claims, its access tokens copy them.
+    Revocation lives in the cache, see RedisBlacklistMixin.
+    """
+
+    @classmethod
+    def for_user(cls, user):
+        token = super().for_user(user)
+        for claim, value in role_claims(user).items():
+            token[claim] = value
+        return token
+
+
+class RoleTokenObtainPairSerializer(TokenObtainPairSerializer):  # pylint: disable=W0223
+    token_class = RoleRefreshToken
+
+
+class RoleTokenRefreshSerializer(TokenRefreshSerializer):  # pylint: disable=W0223
+    token_class = RoleRefreshToken
+
+
+class RoleTokenBlacklistSerializer(TokenBlacklistSerializer):  # pylint: disable=W0223
+    token_class = RoleRefreshToken
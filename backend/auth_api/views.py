@@ -8,12 +8,12 @@ from rest_framework import status
 from rest_framework.viewsets import ModelViewSet
 from rest_framework.generics import get_object_or_404
 from rest_framework.response import Response
-from rest_framework_simplejwt.tokens import RefreshToken
 from rest_framework_simplejwt.views import TokenObtainPairView, TokenRefreshView
 from rest_framework_simplejwt.exceptions import TokenError
-from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.settings import api_settings
 from django.conf import settings
 from django.contrib.auth import get_user_model
+from django.contrib.auth.models import update_last_login
 from django.utils.timezone import now
 from django.db.models import Q
 from django_filters.rest_framework import DjangoFilterBackend
@@ -25,6 +25,7 @@ from drf_spectacular.utils import (
 from core_db.models import Agent, AIReport, ChatMessage, ChatSession
 from backend.renderers import ViewRenderer
 from backend.mixins import http_method_mixin
+from backend.throttling import IPRateThrottle
 from backend.schema_serializers import (
     LoginRequestSerializer,
     LoginResponseSerializer,
@@ -36,7 +37,11 @@ from backend.schema_serializers import (
     AgentCreateRequestSerializer,
     AgentUpdateRequestSerializer,
 )
+from .authentication import CachedJWTAuthentication
 from .paginations import UserPagination
+from .roles import get_user_role, with_user_role
+from .throttling import LoginEmailRateThrottle
+from .tokens import RoleRefreshToken
 from .filters import UserFilter
 from .serializers import (
     UserSerializer,
@@ -134,35 +139,8 @@ def check_update_request_data(user_instance, request):
     return current_user
 
 
-def get_user_role(user):
-    """Get user role."""
-    user_groups = user.groups.all()
-
-    if user_groups.filter(name="Default").exists():
-        user_role = "Default"
-    elif user_groups.filter(name="Agent").exists():
-        user_role = "Agent"
-    elif user_groups.filter(name="Admin").exists():
-        user_role = "Admin"
-    elif user_groups.filter(name="Superuser").exists():
-        user_role = "Superuser"
-    else:
-        user_role = "UnAuthorized"
-
-    return user_role
-
-
-def check_user_validity(email):
-    """Check if user is valid using email."""
-    user = get_user_model().objects.filter(email=email).first()
-
-    # Check if user exists
-    if not user:
-        return Response(
-            {"error": "Invalid credentials"}, status=status.HTTP_400_BAD_REQUEST
-        )
-
-    # Check if user is active
+def check_user_active(user):
+    """Check if the user is active."""
     if not user.is_active:
         return Response(
             {"error": "Account is deactivated. Contact your admin"},
@@ -172,24 +150,18 @@ def check_user_validity(email):
     return user
 
 
-def check_user_id(user_id):
-    """Check if user id is valid."""
-    try:
-        user_id = int(user_id)
-    except Exception as e:  # pylint: disable=W0718
-        print(e)
-        return Response(
-            {"error": "Invalid Session"}, status=status.HTTP_400_BAD_REQUEST
-        )
-
-    user = get_user_model().objects.filter(id=user_id).first()
+def check_user_validity(email):
+    """Check if user is valid using email."""
+    user = with_user_role(get_user_model().objects.filter(email=email)).first()
 
+    # Check if user exists
     if not user:
         return Response(
-            {"error": "Invalid Session"}, status=status.HTTP_400_BAD_REQUEST
+            {"error": "Invalid credentials"}, status=status.HTTP_400_BAD_REQUEST
         )
 
-    return check_user_validity(user.email)
+    # Check if user is active
+    return check_user_active(user)
 
 
 @extend_schema(
@@ -212,6 +184,13 @@ def check_user_id(user_id):
                 "missing email/password, or other pre-auth failures."
             ),
         ),
+        status.HTTP_429_TOO_MANY_REQUESTS: OpenApiResponse(
+            response=ErrorResponseSerializer,
+            description=(
+                "Too many logins from this IP or for this account. "
+                "Retry-After holds the seconds to wait."
+            ),
+        ),
         status.HTTP_500_INTERNAL_SERVER_ERROR: OpenApiResponse(
             response=ErrorResponseSerializer,
             description="Internal Server Error.",
@@ -282,6 +261,8 @@ class LoginView(TokenObtainPairView):
     """Login View."""
 
     renderer_classes = [ViewRenderer]
+    throttle_classes = [IPRateThrottle, LoginEmailRateThrottle]
+    throttle_scope = "login"
 
     def post(self, request, *args, **kwargs):  # pylint: disable=R0911
         """Post a request to login. Returns an OTP to the registered email."""
@@ -300,27 +281,28 @@ class LoginView(TokenObtainPairView):
             if isinstance(user, Response):
                 return user
 
+            # The only password hash of a login, the tokens are minted for
+            # the verified user instead of authenticating again
             if not user.check_password(password):
                 return Response(
                     {"error": "Invalid credentials"}, status=status.HTTP_400_BAD_REQUEST
                 )
 
-            response = super().post(request, *args, **kwargs)
-
-            response.data["access_token_expiry"] = (
-                now() + timedelta(hours=1)
-            ).isoformat()
-
-            user_role = get_user_role(user)
+            refresh = self.get_serializer_class().get_token(user)
 
-            response.data["user_role"] = user_role
-            response.data["user_id"] = user.id
-            response.data["access_token"] = response.data["access"]
-            response.data["refresh_token"] = response.data["refresh"]
-            response.data.pop("access")
-            response.data.pop("refresh")
+            if api_settings.UPDATE_LAST_LOGIN:
+                update_last_login(None, user)
 
-            return response
+            return Response(
+                {
+                    "access_token_expiry": (now() + timedelta(hours=1)).isoformat(),
+                    "user_role": get_user_role(user),
+                    "user_id": user.id,
+                    "access_token": str(refresh.access_token),
+                    "refresh_token": str(refresh),
+                },
+                status=status.HTTP_200_OK,
+            )
         except Exception as e:  # pylint: disable=W0718
             return Response(
                 {"error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR
@@ -379,7 +361,7 @@ class LogoutView(APIView):
                     {"error": "Tokens are required"}, status=status.HTTP_400_BAD_REQUEST
                 )
 
-            token = RefreshToken(refresh_token)
+            token = RoleRefreshToken(refresh_token)
             token.blacklist()
 
             return Response(
@@ -498,49 +480,44 @@ class RefreshTokenView(TokenRefreshView):
                     {"error": "Tokens are required"}, status=status.HTTP_400_BAD_REQUEST
                 )
 
-            response = super().post(request, *args, **kwargs)
-            response.data["access_token_expiry"] = (
-                now() + timedelta(hours=1)
-            ).isoformat()
-
-            # Extract the access token and refresh token
-            refresh_token = response.data.get("refresh")
-            access_token = response.data.get("access")
-
-            if not refresh_token or not access_token:
-                return Response(
-                    {"error": "Invalid tokens"}, status=status.HTTP_400_BAD_REQUEST
-                )
+            # Verified once: signature, expiry and the cache blacklist
+            token_class = self.get_serializer_class().token_class
+            refresh = token_class(refresh_token)
 
-            # Decode the access token to extract user details
-            decoded_token = RefreshToken(refresh_token)
-            user_id = decoded_token.get("user_id", None)
+            user_id = refresh.get(api_settings.USER_ID_CLAIM, None)
             if not user_id:
                 return Response(
                     {"error": "Invalid tokens"},
                     status=status.HTTP_400_BAD_REQUEST,
                 )
 
-            # Check user validity
-            user = check_user_id(user_id)
+            # The only query of a refresh, the role comes with the user
+            user = with_user_role(get_user_model().objects.filter(pk=user_id)).first()
 
-            if isinstance(user, Response):
-                return user
-
-            user_role = get_user_role(user)
+            if user is None or not user.is_active:
+                return Response(
+                    {"error": "Invalid refresh token"},
+                    status=status.HTTP_401_UNAUTHORIZED,
+                )
 
-            response.data["user_role"] = user_role
-            response.data["user_id"] = user.id
-            response.data["access_token"] = response.data["access"]
-            response.data["refresh_token"] = response.data["refresh"]
-            response.data.pop("access")
-            response.data.pop("refresh")
+            # Rotation, raises if a concurrent refresh already used the token
+            refresh.blacklist()
+            rotated = token_class.for_user(user)
 
-            return response
+            return Response(
+                {
+                    "access_token_expiry": (now() + timedelta(hours=1)).isoformat(),
+                    "user_role": get_user_role(user),
+                    "user_id": user.id,
+                    "access_token": str(rotated.access_token),
+                    "refresh_token": str(rotated),
+                },
+                status=status.HTTP_200_OK,
+            )
 
-        except TokenError as e:
+        except TokenError:
             return Response(
-                {"error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR
+                {"error": "Invalid refresh token"}, status=status.HTTP_401_UNAUTHORIZED
             )
         except Exception as e:  # pylint: disable=W0718
             # return Response({"error": str(e)}, status=status.HTTP_401_UNAUTHORIZED)
@@ -556,11 +533,19 @@ class UserViewSet(ModelViewSet):
     queryset = get_user_model().objects.all()  # get all the users
     renderer_classes = [ViewRenderer]
     serializer_class = UserSerializer  # User Serializer initialized
-    authentication_classes = [JWTAuthentication]  # Using jwtoken
+    authentication_classes = [CachedJWTAuthentication]  # Using jwtoken
     filter_backends = [DjangoFilterBackend]
     filterset_class = UserFilter
     pagination_class = UserPagination
     http_method_names = ["get", "post", "patch", "delete"]
+    throttle_classes = [IPRateThrottle]
+    throttle_scope = "signup"
+
+    def get_throttles(self):
+        """Only sign-ups are throttled, they hash a password."""
+        if self.action == "create":
+            return super().get_throttles()
+        return []
 
     def get_serializer_class(self):
         """Assign serializer based on action."""
@@ -821,23 +806,23 @@ class UserViewSet(ModelViewSet):
         if isinstance(check_integrity, Response):
             return check_integrity
 
-        response = super().update(request, *args, **kwargs)
-
-        if response.status_code == status.HTTP_200_OK:
-            user.refresh_from_db()
-            retrieve_serializer = UserRetrieveSerializer(
-                user,
-                context=self.get_serializer_context(),
-            )
-            return Response(
-                {
-                    "success": "User profile updated successfully.",
-                    "data": retrieve_serializer.data,
-                },
-                status=status.HTTP_200_OK,
-            )
+        # Updates the fetched user in place instead of fetching it twice more
+        partial = kwargs.pop("partial", False)
+        serializer = self.get_serializer(user, data=request.data, partial=partial)
+        serializer.is_valid(raise_exception=True)
+        self.perform_update(serializer)
 
-        return response
+        retrieve_serializer = UserRetrieveSerializer(
+            user,
+            context=self.get_serializer_context(),
+        )
+        return Response(
+            {
+                "success": "User profile updated successfully.",
+                "data": retrieve_serializer.data,
+            },
+            status=status.HTTP_200_OK,
+        )
 
     @extend_schema(
         summary="Update User Profile (Partial)",
@@ -1049,15 +1034,12 @@ class UserViewSet(ModelViewSet):
         reports.delete()
 
         email = user_to_delete.email
-        response = super().destroy(request, *args, **kwargs)
+        self.perform_destroy(user_to_delete)
 
-        if response.status_code == status.HTTP_204_NO_CONTENT:
-            return Response(
-                {"success": f"User {email} deleted successfully."},
-                status=status.HTTP_200_OK,
-            )
-
-        return response
+        return Response(
+            {"success": f"User {email} deleted successfully."},
+            status=status.HTTP_200_OK,
+        )
 
 
 class AgentViewSet(ModelViewSet):
@@ -1066,9 +1048,17 @@ class AgentViewSet(ModelViewSet):
     queryset = get_user_model().objects.all()
     serializer_class = AgentSerializer
     renderer_classes = [ViewRenderer]
-    authentication_classes = [JWTAuthentication]  # Using jwtoken
+    authentication_classes = [CachedJWTAuthentication]  # Using jwtoken
     pagination_class = UserPagination
     http_method_names = ["get", "post", "patch", "delete"]
+    throttle_classes = [IPRateThrottle]
+    throttle_scope = "signup"
+
+    def get_throttles(self):
+        """Only sign-ups are throttled, they hash a password."""
+        if self.action == "create":
+            return super().get_throttles()
+        return []
 
     def get_permissions(self):
         """Assign permissions based on action."""
@@ -1690,16 +1680,13 @@ class AgentViewSet(ModelViewSet):
             )
 
         email = user_to_delete.email
-        response = super().destroy(request, *args, **kwargs)
+        self.perform_destroy(agent_to_delete)
         user_to_delete.delete()
 
         if old_agent_image and os.path.exists(old_agent_image):
             os.remove(old_agent_image)
 
-        if response.status_code == status.HTTP_204_NO_CONTENT:
-            return Response(
-                {"success": f"Agent {email} deleted successfully."},
-                status=status.HTTP_200_OK,
-            )
-
-        return response
+        return Response(
+            {"success": f"Agent {email} deleted successfully."},
+            status=status.HTTP_200_OK,
+        )
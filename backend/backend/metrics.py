@@ -0,0 +1,126 @@
+import os
+import time
+from django.conf import settings
+from django.db import connection
+from django.http import HttpResponse, HttpResponseForbidden
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+
+# With PROMETHEUS_MULTIPROC_DIR set (see run.sh) every gunicorn worker writes
+# its samples to mmap files there and /metrics merges them
+REQUEST_LATENCY = Histogram(
+    "django_http_request_duration_seconds",
+    "Request latency by route and method.",
+    ["route", "method"],
+    buckets=(0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30),
+)
+REQUESTS = Counter(
+    "django_http_requests",
+    "Responses by route, method and status code.",
+    ["route", "method", "status"],
+)
+DB_QUERIES = Histogram(
+    "django_http_db_queries",
+    "Database queries per request.",
+    ["route"],
+    buckets=(0, 1, 2, 5, 10, 20, 50, 100),
+)
+DB_TIME = Histogram(
+    "django_http_db_duration_seconds",
+    "Database time per request.",
+    ["route"],
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1),
+)
+RESPONSE_SIZE = Histogram(
+    "django_http_response_size_bytes",
+    "Response body size by route.",
+    ["route"],
+    buckets=(256, 1024, 4096, 16384, 65536, 262144, 1048576),
+)
+IN_FLIGHT = Gauge(
+    "django_http_requests_in_flight",
+    "Requests being processed, compare with workers x threads for saturation.",
+    multiprocess_mode="livesum",
+)
+
+
+class QueryTimer:
+    """Database execute wrapper counting the queries and time of one request."""
+
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+
+    def __call__(
+        self, execute, sql, params, many, context
+    ):  # pylint: disable=R0913, R0917
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.count += 1
+            self.duration += time.perf_counter() - start
+
+
+def route_name(request):
+    """URL name of the matched route, bounded so label cardinality stays low."""
+    match = getattr(request, "resolver_match", None)
+    if match is None:
+        return "unmatched"
+    return match.view_name or match.route
+
+
+class PrometheusMetricsMiddleware:
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if request.path == settings.METRICS_PATH:
+            return self.get_response(request)
+
+        timer = QueryTimer()
+        IN_FLIGHT.inc()
+        start = time.perf_counter()
+        try:
+            with connection.execute_wrapper(timer):
+                response = self.get_response(request)
+        finally:
+            IN_FLIGHT.dec()
+
+        route = route_name(request)
+        REQUEST_LATENCY.labels(route, request.method).observe(
+            time.perf_counter() - start
+        )
+        REQUESTS.labels(route, request.method, response.status_code).inc()
+        DB_QUERIES.labels(route).observe(timer.count)
+        DB_TIME.labels(route).observe(timer.duration)
+        if not response.streaming:
+            RESPONSE_SIZE.labels(route).observe(len(response.content))
+
+        return response
+
+
+def metrics_view(request):
+    """Prometheus exposition of every worker's metrics."""
+    token = settings.METRICS_TOKEN
+    if not token:
+        # Closed unless a scrape token is configured
+        return HttpResponseForbidden("Metrics are disabled.")
+    if request.headers.get("Authorization") != f"Bearer {token}":
+        return HttpResponseForbidden("Invalid metrics token.")
+
+    if os.getenv("PROMETHEUS_MULTIPROC_DIR"):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+
+    return HttpResponse(generate_latest(registry), content_type=CONTENT_TYPE_LATEST)
@@ -11,8 +11,10 @@ https://docs.djangoproject.com/en/5.2/ref/settings/
 """
 
 import os
+import sys
 from pathlib import Path
 from datetime import timedelta
+from django.core.exceptions import ImproperlyConfigured
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
@@ -66,6 +68,7 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    "backend.metrics.PrometheusMetricsMiddleware",
     "corsheaders.middleware.CorsMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
@@ -180,10 +183,53 @@ FILE_UPLOAD_MAX_MEMORY_SIZE = 5 * 1024 * 1024
 
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
+# Cache
+# Shared Redis (db 3, backend_ai uses db 1 for its cache and db 2 for the
+# Celery broker and results). Role, snapshot and blacklist
+# invalidation only reaches the other workers through it, so the per process
+# cache is limited to development and the test suite
+TESTING = "test" in sys.argv
+if os.getenv("REDIS_HOST"):
+    REDIS_URL = f"redis://{os.getenv('REDIS_HOST')}:{os.getenv('REDIS_PORT', '6379')}"
+    CACHES = {
+        "default": {
+            "BACKEND": "django_redis.cache.RedisCache",
+            "LOCATION": f"{REDIS_URL}/3",
+            "OPTIONS": {
+                "CLIENT_CLASS": "django_redis.client.DefaultClient",
+            },
+        },
+        # Own db (4) so flushing the default cache never drops revocations
+        "token_blacklist": {
+            "BACKEND": "django_redis.cache.RedisCache",
+            "LOCATION": f"{REDIS_URL}/4",
+            "OPTIONS": {
+                "CLIENT_CLASS": "django_redis.client.DefaultClient",
+            },
+        },
+    }
+elif DJANGO_ENV == "development" or TESTING:
+    CACHES = {
+        "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+        "token_blacklist": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "token-blacklist",
+        },
+    }
+else:
+    raise ImproperlyConfigured(
+        "REDIS_HOST is required outside development, the role and user "
+        "snapshot caches must be shared by every worker."
+    )
+
+USER_ROLE_CACHE_TTL = 60 * 60  # Backstop, group changes invalidate the role
+# Saves and deletes invalidate it, the TTL bounds queryset.update() changes
+USER_SNAPSHOT_CACHE_TTL = 60
+
 REST_FRAMEWORK = {
     "DEFAULT_SCHEMA_CLASS": ("drf_spectacular.openapi.AutoSchema"),
     "DEFAULT_AUTHENTICATION_CLASSES": (
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
+        "auth_api.authentication.CachedJWTAuthentication",
     ),
     "DEFAULT_PERMISSION_CLASSES": (
         "rest_framework.permissions.IsAuthenticated",
@@ -191,8 +237,27 @@ REST_FRAMEWORK = {
     ),
     "DEFAULT_FILTER_BACKENDS": ("django_filters.rest_framework.DjangoFilterBackend",),
     "ORDERING_PARAM": "ordering",
+    # Per scope, see backend.throttling. Logins and sign-ups each hash a
+    # password (PBKDF2), the login email rate caps guessing on one account
+    "DEFAULT_THROTTLE_RATES": {
+        "login_ip": "20/min",
+        "login_email": "5/min",
+        "signup_ip": "10/hour",
+    },
+    # Assumes the API is only reachable through the Next.js server, which
+    # sends one X-Forwarded-For entry (the client IP it trusts, see
+    # TRUSTED_PROXY in frontend/src/libs/apiClient.js). Exposing the API
+    # directly or adding a proxy in front of it means changing this count
+    "NUM_PROXIES": 1,
 }
 
+# Throttling
+# GCRA state lives in THROTTLE_CACHE, it must be Redis to be shared by workers.
+# Off for the test suite, which logs in far more often than any rate allows,
+# and with THROTTLE_ENABLED=False for load tests
+THROTTLE_ENABLED = os.getenv("THROTTLE_ENABLED", "True") == "True" and not TESTING
+THROTTLE_CACHE = "default"
+
 # Simple JWT Settings
 
 REST_USE_JWT = True
@@ -211,8 +276,31 @@ SIMPLE_JWT = {
     "USER_ID_CLAIM": "user_id",
     "ROTATE_REFRESH_TOKENS": True,
     "BLACKLIST_AFTER_ROTATION": True,
+    # Role, is_agent, is_staff and is_superuser claims for other services
+    "TOKEN_OBTAIN_SERIALIZER": "auth_api.tokens.RoleTokenObtainPairSerializer",
+    # Revoked JTIs live in TOKEN_BLACKLIST_CACHE, not in the blacklist tables
+    "TOKEN_REFRESH_SERIALIZER": "auth_api.tokens.RoleTokenRefreshSerializer",
+    "TOKEN_BLACKLIST_SERIALIZER": "auth_api.tokens.RoleTokenBlacklistSerializer",
 }
 
+# Must be shared by every worker (Redis), locmem only suits a single process.
+# Revocations made before the switch are copied over at deploy time by
+# "manage.py prune_token_blacklist --migrate" (see run.sh)
+TOKEN_BLACKLIST_CACHE = "token_blacklist"
+PER_PROCESS_CACHES = (
+    "django.core.cache.backends.locmem.LocMemCache",
+    "django.core.cache.backends.dummy.DummyCache",
+)
+if (
+    CACHES[TOKEN_BLACKLIST_CACHE]["BACKEND"] in PER_PROCESS_CACHES
+    and DJANGO_ENV != "development"
+    and not TESTING
+):
+    raise ImproperlyConfigured(
+        "TOKEN_BLACKLIST_CACHE must be shared by every worker, a revoked "
+        "token would still be accepted by the others."
+    )
+
 SPECTACULAR_SETTINGS = {
     "TITLE": "Real Estate API",
     "DESCRIPTION": "API for Real Estate",
@@ -266,6 +354,18 @@ SECURE_PROXY_SSL_HEADER = (
     "https",
 )  # Only if Nginx is reverse proxied
 
+# Prometheus Metrics
+# Scraped from /metrics, multiprocess safe when PROMETHEUS_MULTIPROC_DIR is set
+METRICS_PATH = "/metrics"
+METRICS_TOKEN = os.getenv("METRICS_TOKEN", "")  # Bearer token, empty = closed
+
+# Query Inspection
+# Dev only: X-DB-Query-Count / X-DB-Query-Time headers and N+1 warnings
+QUERY_INSPECTION = os.getenv("QUERY_INSPECTION", "False") == "True"
+QUERY_REPEAT_THRESHOLD = 3  # Same query shape this often in one request
+if QUERY_INSPECTION:
+    MIDDLEWARE.insert(1, "backend.query_inspection.QueryInspectionMiddleware")
+
 # Monitoring
 
 # LOGGING = {
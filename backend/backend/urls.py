@@ -24,8 +24,10 @@ from drf_spectacular.views import (
     SpectacularSwaggerView,
     SpectacularRedocView,
 )
+from backend.metrics import metrics_view
 
 urlpatterns = [
+    path("metrics", metrics_view, name="metrics"),
     path("admin/", admin.site.urls),
     path("server-api/auth-api/", include("auth_api.urls")),
     path("server-api/property-api/", include("property_api.urls")),
@@ -0,0 +1,56 @@
+import json
+import subprocess
+from pathlib import Path
+from django.core.management.base import BaseCommand, CommandError
+from auth_api.benchmark import run_benchmark
+
+
+def current_commit():
+    """Commit the benchmark ran on, so runs can be compared across commits."""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+            timeout=5,
+        ).stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+class Command(BaseCommand):
+    help = (
+        "Logs a benchmark user in sequentially through LoginView and refreshes "
+        "its tokens through RefreshTokenView. Prints logins and refreshes/sec of "
+        "one worker, their latency and queries, and the cost of one password "
+        "hash as JSON."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--logins", type=int, default=50, help="Logins to time.")
+        parser.add_argument(
+            "--refreshes", type=int, default=200, help="Token refreshes to time."
+        )
+        parser.add_argument("--output", help="Write the JSON here instead of stdout.")
+
+    def handle(self, *args, **options):
+        if options["logins"] < 1 or options["refreshes"] < 0:
+            raise CommandError(
+                "--logins must be at least 1 and --refreshes at least 0."
+            )
+
+        result = run_benchmark(options["logins"], options["refreshes"])
+        result = {"commit": current_commit(), **result}
+        output = json.dumps(result, indent=2)
+
+        if options["output"]:
+            Path(options["output"]).write_text(output + "\n")
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"✅ {result['logins_per_s']} logins/s per worker, "
+                    f"written to {options['output']}"
+                )
+            )
+        else:
+            self.stdout.write(output)
@@ -0,0 +1,34 @@
+from django.core.management.base import BaseCommand, CommandError
+from auth_api.blacklist import migrate_sql_blacklist, prune_sql_tokens
+
+
+class Command(BaseCommand):
+    help = (
+        "Deletes expired rows of the SQL token blacklist tables in batches. "
+        "With --migrate, first copies the unexpired blacklisted JTIs to the "
+        "cache blacklist and then empties the tables, which are no longer read. "
+        "run.sh runs it with --migrate on every production deploy, it needs "
+        "the shared TOKEN_BLACKLIST_CACHE to be reachable."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size", type=int, default=5000, help="Rows per delete."
+        )
+        parser.add_argument(
+            "--migrate",
+            action="store_true",
+            help="Move the blacklist to the cache and delete every row.",
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        if batch_size < 1:
+            raise CommandError("--batch-size must be at least 1.")
+
+        if options["migrate"]:
+            copied = migrate_sql_blacklist(batch_size)
+            self.stdout.write(f"Copied {copied} blacklisted JTIs to the cache.")
+
+        deleted = prune_sql_tokens(batch_size, expired_only=not options["migrate"])
+        self.stdout.write(self.style.SUCCESS(f"✅ Deleted {deleted} token rows."))
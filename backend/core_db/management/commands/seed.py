@@ -1,5 +1,7 @@
+import time
 import random
 
+import numpy as np
 from core_db.factories import (
     FIXED_PASSWORD,
     AgentFactory,
@@ -9,21 +11,69 @@ from core_db.factories import (
     UserFactory,
 )
 from core_db.models import Agent, Property, User
+from core_db.seeding import (
+    clear_tables,
+    seed_agents,
+    seed_properties,
+    seed_users,
+)
 from django.contrib.auth.models import Group
 from django.core.management.base import BaseCommand
 
 
 class Command(BaseCommand):
-    help = "Seeds the database with test data according to specific constraints."
+    help = (
+        "Seeds the database with test data according to specific constraints. "
+        "Any of --users/--agents/--properties seeds at that scale instead, "
+        "with bulk inserts."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--users", type=int, help="Default users to bulk seed.")
+        parser.add_argument(
+            "--agents", type=int, help="Agents (with their users) to bulk seed."
+        )
+        parser.add_argument("--properties", type=int, help="Properties to bulk seed.")
+        parser.add_argument(
+            "--seed", type=int, default=0, help="Random seed of the bulk data."
+        )
+
+    def seed_at_scale(self, options, agent_user):
+        """Bulk users, agents and properties with realistic distributions."""
+        rng = np.random.default_rng(options["seed"])
+        users = 10 if options["users"] is None else options["users"]
+        agents = 10 if options["agents"] is None else options["agents"]
+        properties = 125 if options["properties"] is None else options["properties"]
+
+        for label, count, seed in (
+            ("users", users, seed_users),
+            ("agents", agents, seed_agents),
+            ("properties", properties, seed_properties),
+        ):
+            self.stdout.write(f"\nBulk seeding {count} {label}...")
+            started = time.perf_counter()
+
+            def progress(label, done, total, started=started):
+                rate = done / max(time.perf_counter() - started, 1e-9)
+                self.stdout.write(f"{label}: {done}/{total} ({rate:,.0f} rows/s)")
+
+            seed(count, rng, progress=progress)
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"✅ {User.objects.count()} users, {Agent.objects.count()} agents, "
+                f"{Property.objects.count()} properties "
+                f"({Property.objects.filter(agent__user=agent_user).count()} "
+                f"for {agent_user.email})."
+            )
+        )
+        self.stdout.write(f"Remember the fixed password is: {FIXED_PASSWORD}")
 
     def handle(self, *args, **options):
         self.stdout.write(self.style.WARNING("--- Starting Database Seeding ---"))
 
         self.stdout.write("Clearing old data...")
-        Property.objects.all().delete()
-        Agent.objects.all().delete()
-        User.objects.all().delete()
-        Group.objects.all().delete()
+        clear_tables(Property, Agent, User, Group)
         self.stdout.write(self.style.NOTICE("Clean up complete."))
 
         # --- GROUP CREATION ---
@@ -64,6 +114,10 @@ class Command(BaseCommand):
         agent1.user.groups.add(agent_group)
         self.stdout.write(self.style.SUCCESS(f"✅ Agent user: agentuser@example.com"))
 
+        if any(options[name] is not None for name in ("users", "agents", "properties")):
+            self.seed_at_scale(options, agent_user)
+            return
+
         # Create Basic Users (10)
         self.stdout.write("\nCreating 10 basic users...")
         basic_users = UserFactory.create_batch(10)
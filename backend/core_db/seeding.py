@@ -0,0 +1,242 @@
+from functools import lru_cache
+import numpy as np
+from django.contrib.auth.models import Group
+from django.db import connection, transaction
+from django.utils.text import slugify
+from .factories import AGENT_IMAGE_PATH, PASSWORD_HASH, PROPERTY_IMAGE_PATH
+from .models import User, Agent, Property
+
+BATCH_SIZE = 5000
+
+# City, state, share of the listings and median price per sqft.
+# Shares roughly follow metro size, prices the 2025 medians.
+CITIES = [
+    ("New York", "New York", 12, 620),
+    ("Los Angeles", "California", 10, 560),
+    ("Chicago", "Illinois", 7, 230),
+    ("Houston", "Texas", 7, 170),
+    ("Dallas", "Texas", 5, 200),
+    ("Phoenix", "Arizona", 5, 260),
+    ("Philadelphia", "Pennsylvania", 5, 220),
+    ("Miami", "Florida", 5, 480),
+    ("San Antonio", "Texas", 4, 160),
+    ("San Diego", "California", 4, 600),
+    ("Austin", "Texas", 4, 330),
+    ("Seattle", "Washington", 4, 520),
+    ("Denver", "Colorado", 4, 340),
+    ("Boston", "Massachusetts", 4, 650),
+    ("Atlanta", "Georgia", 4, 250),
+    ("Jacksonville", "Florida", 3, 190),
+    ("Columbus", "Ohio", 3, 180),
+    ("Portland", "Oregon", 3, 330),
+    ("Nashville", "Tennessee", 3, 300),
+    ("Springfield", "Illinois", 2, 110),
+]
+STREETS = [
+    "Oak St",
+    "Maple Dr",
+    "Elm Ave",
+    "Cedar Ct",
+    "Birch Ln",
+    "Walnut Way",
+    "Hickory Rd",
+    "Aspen Pl",
+    "Willow Blvd",
+    "Spruce St",
+    "Lakeview Dr",
+    "Park Ave",
+]
+AREAS = [
+    "Downtown",
+    "Midtown",
+    "Uptown",
+    "Riverside",
+    "Westside",
+    "Eastside",
+    "Old Town",
+]
+ADJECTIVES = ["Modern", "Charming", "Spacious", "Sunny", "Renovated", "Cozy", "Elegant"]
+HOME_TYPES = ["House", "Condo", "Townhouse", "Bungalow", "Apartment", "Loft"]
+FIRST_NAMES = ["James", "Maria", "Robert", "Linda", "Michael", "Sarah", "David", "Emma"]
+LAST_NAMES = ["Smith", "Johnson", "Garcia", "Miller", "Davis", "Lopez", "Wilson", "Lee"]
+COMPANIES = ["Realty", "Homes", "Properties", "Estates", "Realty Group", "Brokers"]
+
+BEDS = np.arange(1, 7)
+BEDS_P = np.array([8, 20, 35, 24, 9, 4]) / 100
+
+
+def clear_tables(*models):
+    """
+    Empties the tables. TRUNCATE on PostgreSQL, millions of rows would take
+    the ORM ages to collect for the cascade.
+    """
+    if connection.vendor == "postgresql":
+        tables = ", ".join(
+            connection.ops.quote_name(model._meta.db_table) for model in models
+        )
+        with connection.cursor() as cursor:
+            cursor.execute(f"TRUNCATE {tables} RESTART IDENTITY CASCADE")
+        return
+
+    for model in models:
+        model.objects.all().delete()
+
+
+def batches(count, batch_size=BATCH_SIZE):
+    """(start, size) of every batch."""
+    for start in range(0, count, batch_size):
+        yield start, min(batch_size, count - start)
+
+
+@lru_cache(maxsize=None)
+def cached_slugify(value):
+    return slugify(value)
+
+
+def add_to_group(users, group_name):
+    """Group membership for bulk created users, which skip the signals."""
+    group, _ = Group.objects.get_or_create(name=group_name)
+    Membership = User.groups.through
+    Membership.objects.bulk_create(
+        [Membership(user_id=user.id, group_id=group.id) for user in users],
+        batch_size=BATCH_SIZE,
+    )
+
+
+def user_rows(rng, prefix, start, size, is_agent=False):
+    first_names = rng.choice(FIRST_NAMES, size)
+    last_names = rng.choice(LAST_NAMES, size)
+    users = []
+    for i in range(size):
+        email = f"{prefix}{start + i + 1}@example.com"
+        users.append(
+            User(
+                email=email,
+                username=email,
+                first_name=first_names[i],
+                last_name=last_names[i],
+                is_agent=is_agent,
+                password=PASSWORD_HASH,
+                slug=cached_slugify(email),
+            )
+        )
+    return users
+
+
+def seed_users(count, rng, progress=None):
+    """Default users user<n>@example.com, all with the fixed password."""
+    for start, size in batches(count):
+        with transaction.atomic():
+            users = User.objects.bulk_create(user_rows(rng, "user", start, size))
+            add_to_group(users, "Default")
+        if progress:
+            progress("Users", start + size, count)
+
+
+def seed_agents(count, rng, progress=None):
+    """Agent users agent<n>@example.com with their agent profiles."""
+    for start, size in batches(count):
+        with transaction.atomic():
+            users = User.objects.bulk_create(
+                user_rows(rng, "agent", start, size, is_agent=True)
+            )
+            add_to_group(users, "Agent")
+            companies = rng.choice(COMPANIES, size)
+            Agent.objects.bulk_create(
+                [
+                    Agent(
+                        user=user,
+                        company_name=f"{user.last_name} {companies[i]}",
+                        bio=f"{user.first_name} has been selling homes for years.",
+                        image_url=AGENT_IMAGE_PATH,
+                    )
+                    for i, user in enumerate(users)
+                ]
+            )
+        if progress:
+            progress("Agents", start + size, count)
+
+
+def property_columns(rng, size):
+    """
+    Vectorized listing attributes. Area grows with the bedrooms, price is
+    area x the city's price per sqft with log-normal noise.
+    """
+    shares = np.array([city[2] for city in CITIES], dtype=float)
+    cities = rng.choice(len(CITIES), size, p=shares / shares.sum())
+    price_per_sqft = np.array([city[3] for city in CITIES])[cities]
+
+    beds = rng.choice(BEDS, size, p=BEDS_P)
+    baths = np.clip(beds - rng.choice([0, 1, 2], size, p=[0.3, 0.55, 0.15]), 1, None)
+    area_sqft = np.round((350 + beds * 420) * rng.lognormal(0, 0.2, size), -1).astype(
+        int
+    )
+    price = np.round(area_sqft * price_per_sqft * rng.lognormal(0, 0.2, size), -3)
+
+    return {
+        "city": cities,
+        "beds": beds,
+        "baths": baths,
+        "area_sqft": area_sqft,
+        "price": price.astype(int),
+        "adjective": rng.choice(ADJECTIVES, size),
+        "home_type": rng.choice(HOME_TYPES, size),
+        "street": rng.choice(STREETS, size),
+        "area": rng.choice(AREAS, size),
+        "flat": rng.integers(1, 30, size),
+        "house": rng.integers(1, 2000, size),
+    }
+
+
+def build_property(columns, i, agent_id, number):
+    """Listing of row i of the property columns, number makes the slug unique."""
+    city, state, _, _ = CITIES[columns["city"][i]]
+    beds = int(columns["beds"][i])
+    baths = int(columns["baths"][i])
+    area_sqft = int(columns["area_sqft"][i])
+    home_type = columns["home_type"][i]
+    title = f"{columns['adjective'][i]} {beds}-Bed {home_type} in {city}"
+    return Property(
+        agent_id=agent_id,
+        title=title,
+        description=(
+            f"{home_type} with {beds} bedrooms and {baths} bathrooms, "
+            f"{area_sqft:,} sqft."
+        ),
+        beds=beds,
+        baths=baths,
+        price=int(columns["price"][i]),
+        area_sqft=area_sqft,
+        address=(
+            f"flat_no={columns['flat'][i]}, house_no={columns['house'][i]}, "
+            f"street={columns['street'][i]}, area={columns['area'][i]}, "
+            f"city={city}, state={state}, country=United States"
+        ),
+        slug=f"{cached_slugify(title)}-{number}",
+        image_url=PROPERTY_IMAGE_PATH,
+    )
+
+
+def seed_properties(count, rng, progress=None):
+    """
+    Listings spread over every agent, a few agents hold many of them
+    (Pareto weights) like on a real marketplace.
+    """
+    agent_ids = np.array(Agent.objects.values_list("id", flat=True))
+    if agent_ids.size == 0:
+        raise ValueError("Properties need at least one agent.")
+    weights = rng.pareto(1.5, len(agent_ids)) + 1
+    weights /= weights.sum()
+
+    for start, size in batches(count):
+        columns = property_columns(rng, size)
+        agents = rng.choice(agent_ids, size, p=weights)
+        properties = [
+            build_property(columns, i, int(agents[i]), start + i + 1)
+            for i in range(size)
+        ]
+
+        with transaction.atomic():
+            Property.objects.bulk_create(properties)
+        if progress:
+            progress("Properties", start + size, count)
@@ -1,9 +1,11 @@
 """Signals used before or after saving a model"""
 
-from django.db.models.signals import pre_save, post_save
+from django.db.models.signals import m2m_changed, pre_save, post_delete, post_save
 from django.contrib.auth.models import Group
 from django.dispatch import receiver
 from django.utils.text import slugify
+from auth_api.authentication import invalidate_user_snapshot
+from auth_api.roles import invalidate_user_role
 from .models import User, Property, Agent
 
 
@@ -65,4 +67,39 @@ def set_is_agent_true_for_agent(
             user_instance.save()
 
 
+@receiver(m2m_changed, sender=User.groups.through)
+def invalidate_role_on_group_change(
+    sender, instance, action, reverse, pk_set, **kwargs
+):  # pylint: disable=unused-argument
+    """Drop the cached role of every user whose groups changed"""
+    if not reverse:
+        if action in ("post_add", "post_remove", "post_clear"):
+            invalidate_user_role(instance.pk)
+        return
+
+    # group.user_set changes, the users are only known before a clear
+    if action == "pre_clear":
+        pk_set = instance.user_set.values_list("pk", flat=True)
+    elif action not in ("post_add", "post_remove"):
+        return
+    for user_id in pk_set:
+        invalidate_user_role(user_id)
+
+
+@receiver(post_delete, sender=User)
+def invalidate_role_on_delete(
+    sender, instance, **kwargs
+):  # pylint: disable=unused-argument
+    invalidate_user_role(instance.pk)
+    invalidate_user_snapshot(instance.pk)
+
+
+@receiver(post_save, sender=User)
+def invalidate_snapshot_on_save(
+    sender, instance, **kwargs
+):  # pylint: disable=unused-argument
+    """Deactivation and permission changes apply to the next request"""
+    invalidate_user_snapshot(instance.pk)
+
+
 # future changes can include stopping the loop of saving in post save without using created
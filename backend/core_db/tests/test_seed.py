@@ -0,0 +1,60 @@
+from io import StringIO
+from django.contrib.auth.models import Group
+from django.core.management import call_command
+from django.test import TestCase
+from core_db.models import User, Agent, Property
+
+
+class BulkSeedTest(TestCase):
+    def seed(self, *args):
+        call_command("seed", *args, stdout=StringIO())
+
+    def test_bulk_seed_counts(self):
+        """Test that the scale options seed exactly that many rows."""
+        self.seed("--users", "30", "--agents", "5", "--properties", "120")
+
+        self.assertEqual(Property.objects.count(), 120)
+        # Fixed agent user plus the bulk agents
+        self.assertEqual(Agent.objects.count(), 6)
+        self.assertEqual(User.objects.filter(email__startswith="user").count(), 30)
+        self.assertTrue(User.objects.filter(email="defaultuser@example.com").exists())
+
+    def test_bulk_users_can_log_in_and_have_groups(self):
+        """Test that bulk users get the fixed password and their group."""
+        self.seed("--users", "3", "--agents", "2", "--properties", "10")
+
+        user = User.objects.get(email="user1@example.com")
+        agent = User.objects.get(email="agent1@example.com")
+        self.assertTrue(user.check_password("Django@123"))
+        self.assertEqual(user.slug, "user1examplecom")
+        self.assertTrue(agent.is_agent)
+        self.assertEqual(
+            Group.objects.get(name="Agent").user_set.filter(id=agent.id).count(), 1
+        )
+        self.assertEqual(
+            Group.objects.get(name="Default").user_set.filter(id=user.id).count(), 1
+        )
+
+    def test_bulk_properties_are_realistic(self):
+        """Test that listings have the address format and plausible values."""
+        self.seed("--properties", "200")
+
+        self.assertEqual(
+            Property.objects.values("slug").distinct().count(),
+            Property.objects.count(),
+        )
+        for prop in Property.objects.all()[:50]:
+            self.assertIn(", city=", prop.address)
+            self.assertIn(", state=", prop.address)
+            self.assertGreater(prop.price, 50000)
+            self.assertGreater(prop.area_sqft, 300)
+            self.assertLessEqual(prop.baths, prop.beds)
+
+    def test_same_seed_same_data(self):
+        """Test that a seed value reproduces the dataset."""
+        self.seed("--properties", "20", "--seed", "7")
+        first = list(Property.objects.order_by("id").values_list("title", "price"))
+        self.seed("--properties", "20", "--seed", "7")
+        second = list(Property.objects.order_by("id").values_list("title", "price"))
+
+        self.assertEqual(first, second)
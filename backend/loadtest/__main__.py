@@ -0,0 +1,154 @@
+import sys
+import json
+import asyncio
+import argparse
+import subprocess
+from pathlib import Path
+from .runner import DEFAULT_CREDENTIALS, run_load
+from .scenarios import DEFAULT_MIX, SCENARIOS
+
+# Usage, from backend/ against a locally running server started with
+# THROTTLE_ENABLED=False, the virtual users share one IP and would be throttled:
+#   python -m loadtest --mix browse=8,agent=2 --duration 60
+# Scaling runs re-seed before every size, {size} is filled in:
+#   python -m loadtest --sizes 10000,100000,1000000 \
+#       --seed-cmd "python manage.py seed --properties {size}"
+
+
+def parse_mix(value):
+    """browse=8,agent=2 -> {"browse": 8, "agent": 2}"""
+    mix = {}
+    for part in value.split(","):
+        name, _, users = part.partition("=")
+        if name not in SCENARIOS:
+            raise argparse.ArgumentTypeError(
+                f"Unknown scenario {name!r}, choose from {sorted(SCENARIOS)}."
+            )
+        mix[name] = int(users or 1)
+    return mix
+
+
+def parse_credentials(value):
+    email, _, password = value.partition(":")
+    if not password:
+        raise argparse.ArgumentTypeError("Expected email:password.")
+    return email, password
+
+
+def parse_sizes(value):
+    return [int(size) for size in value.split(",")]
+
+
+def current_commit():
+    """Commit the load test ran on, so runs can be compared across commits."""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+            timeout=5,
+        ).stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog="python -m loadtest",
+        description=(
+            "Load test of the property list / retrieve / my-listings and "
+            "login / refresh endpoints with realistic traffic mixes."
+        ),
+    )
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument(
+        "--mix",
+        type=parse_mix,
+        default=DEFAULT_MIX,
+        help="Virtual users per scenario, e.g. browse=8,agent=2,auth=1.",
+    )
+    parser.add_argument("--duration", type=float, default=60, help="Seconds per run.")
+    parser.add_argument(
+        "--think-time",
+        type=float,
+        default=0.0,
+        help="Mean pause between a user's requests, 0 for a closed loop.",
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--timeout", type=float, default=30)
+    parser.add_argument(
+        "--sizes",
+        type=parse_sizes,
+        help="Dataset sizes to run at, e.g. 10000,100000,1000000.",
+    )
+    parser.add_argument(
+        "--seed-cmd",
+        help="Shell command seeding the database before each size.",
+    )
+    parser.add_argument(
+        "--default-user",
+        type=parse_credentials,
+        default=DEFAULT_CREDENTIALS["default"],
+        help="email:password of the browsing user.",
+    )
+    parser.add_argument(
+        "--agent-user",
+        type=parse_credentials,
+        default=DEFAULT_CREDENTIALS["agent"],
+        help="email:password of the agent user.",
+    )
+    parser.add_argument("--output", help="Write the JSON here instead of stdout.")
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    credentials = {"default": args.default_user, "agent": args.agent_user}
+    runs = []
+
+    for size in args.sizes or [None]:
+        if size is not None and args.seed_cmd:
+            print(f"Seeding {size} properties...", file=sys.stderr)
+            subprocess.run(args.seed_cmd.format(size=size), shell=True, check=True)
+
+        try:
+            result = asyncio.run(
+                run_load(
+                    args.base_url,
+                    args.mix,
+                    args.duration,
+                    think_time=args.think_time,
+                    credentials=credentials,
+                    seed=args.seed,
+                    dataset_size=size,
+                    timeout=args.timeout,
+                )
+            )
+        except ValueError as e:
+            print(f"Load test failed: {e}", file=sys.stderr)
+            return 1
+
+        if size is not None and result["dataset"]["count"] != size:
+            print(
+                f"Expected {size} properties, found {result['dataset']['count']}.",
+                file=sys.stderr,
+            )
+        print(
+            f"{result['dataset']['count']} properties: "
+            f"{result['throughput_rps']} req/s, "
+            f"{result['error_rate']:.2%} errors",
+            file=sys.stderr,
+        )
+        runs.append(result)
+
+    output = json.dumps({"commit": current_commit(), "runs": runs}, indent=2)
+    if args.output:
+        Path(args.output).write_text(output + "\n")
+    else:
+        print(output)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,244 @@
+import time
+import random
+import asyncio
+import statistics
+import httpx
+from .scenarios import LOGIN, PROPERTIES, REFRESH, SCENARIOS
+
+# Same buckets as django_http_request_duration_seconds, so a run can be lined
+# up with what /metrics saw on the server
+BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+FIXED_PASSWORD = "Django@123"
+DEFAULT_CREDENTIALS = {
+    "default": ("defaultuser@example.com", FIXED_PASSWORD),
+    "agent": ("agentuser@example.com", FIXED_PASSWORD),
+}
+
+
+def latency_percentiles(latencies):
+    """p50 / p95 / p99 / max of a list of seconds, in milliseconds."""
+    values = sorted(latencies)
+    if len(values) > 1:
+        cuts = statistics.quantiles(values, n=100, method="inclusive")
+        p50, p95, p99 = cuts[49], cuts[94], cuts[98]
+    else:
+        p50 = p95 = p99 = values[0]
+    return {
+        "p50_ms": round(p50 * 1000, 1),
+        "p95_ms": round(p95 * 1000, 1),
+        "p99_ms": round(p99 * 1000, 1),
+        "max_ms": round(values[-1] * 1000, 1),
+    }
+
+
+def histogram(latencies):
+    """Cumulative bucket counts, Prometheus style."""
+    buckets = {str(bound): 0 for bound in BUCKETS}
+    for latency in latencies:
+        for bound in BUCKETS:
+            if latency <= bound:
+                buckets[str(bound)] += 1
+    buckets["+Inf"] = len(latencies)
+    return buckets
+
+
+def is_error(status):
+    """Anything but a 2xx, including transport errors recorded by name."""
+    return not (isinstance(status, int) and 200 <= status < 300)
+
+
+class Stats:
+    """Latencies and status codes per endpoint."""
+
+    def __init__(self):
+        self.latencies = {}
+        self.statuses = {}
+
+    def record(self, name, seconds, status):
+        self.latencies.setdefault(name, []).append(seconds)
+        counts = self.statuses.setdefault(name, {})
+        counts[status] = counts.get(status, 0) + 1
+
+    def summary(self, elapsed):
+        endpoints = {}
+        for name in sorted(self.latencies):
+            latencies = self.latencies[name]
+            statuses = self.statuses[name]
+            errors = sum(
+                count for status, count in statuses.items() if is_error(status)
+            )
+            endpoints[name] = {
+                "requests": len(latencies),
+                "throughput_rps": round(len(latencies) / elapsed, 2),
+                "error_rate": round(errors / len(latencies), 4),
+                "statuses": {str(status): count for status, count in statuses.items()},
+                **latency_percentiles(latencies),
+                "histogram": histogram(latencies),
+            }
+
+        requests = sum(endpoint["requests"] for endpoint in endpoints.values())
+        errors = sum(
+            count
+            for statuses in self.statuses.values()
+            for status, count in statuses.items()
+            if is_error(status)
+        )
+        return {
+            "requests": requests,
+            "throughput_rps": round(requests / elapsed, 2),
+            "error_rate": round(errors / requests, 4) if requests else 0.0,
+            "endpoints": endpoints,
+        }
+
+
+class Session:
+    """One virtual user: its tokens plus the shared client, dataset and stats."""
+
+    def __init__(self, client, credentials, dataset, stats):
+        self.client = client
+        self.credentials = credentials
+        self.dataset = dataset
+        self.stats = stats
+        self.access_token = None
+        self.refresh_token = None
+
+    async def call(self, name, method, path, auth=True, **kwargs):
+        """Sends one request, recording its latency and status."""
+        headers = {}
+        if auth and self.access_token:
+            headers["Authorization"] = f"Bearer {self.access_token}"
+
+        start = time.perf_counter()
+        try:
+            response = await self.client.request(
+                method, path, headers=headers, **kwargs
+            )
+        except httpx.HTTPError as e:
+            self.stats.record(name, time.perf_counter() - start, type(e).__name__)
+            return None
+
+        self.stats.record(name, time.perf_counter() - start, response.status_code)
+        return response
+
+    def update_tokens(self, response):
+        if response is not None and response.status_code == 200:
+            data = response.json()
+            self.access_token = data["access_token"]
+            self.refresh_token = data["refresh_token"]
+
+    async def login(self):
+        email, password = self.credentials
+        response = await self.call(
+            "auth.login",
+            "POST",
+            LOGIN,
+            auth=False,
+            json={"email": email, "password": password},
+        )
+        self.update_tokens(response)
+
+    async def refresh(self):
+        """Refresh tokens rotate, so the new pair replaces the old one."""
+        if not self.refresh_token:
+            await self.login()
+            return
+
+        response = await self.call(
+            "auth.refresh",
+            "POST",
+            REFRESH,
+            auth=False,
+            json={"refresh": self.refresh_token},
+        )
+        self.update_tokens(response)
+
+
+async def discover_dataset(client, credentials):
+    """Size and id range of the seeded properties, newest first in the list."""
+    session = Session(client, credentials, None, Stats())
+    await session.login()
+    if not session.access_token:
+        raise ValueError(f"Could not log in as {credentials[0]}.")
+
+    newest = await session.call("discover", "GET", PROPERTIES, params={"page_size": 1})
+    count = newest.json()["count"]
+    if not count:
+        raise ValueError("No properties seeded.")
+
+    oldest = await session.call(
+        "discover", "GET", PROPERTIES, params={"page_size": 1, "page": count}
+    )
+    return {
+        "count": count,
+        "min_id": oldest.json()["results"][0]["id"],
+        "max_id": newest.json()["results"][0]["id"],
+    }
+
+
+async def virtual_user(
+    session, scenario, rng, deadline, think_time
+):  # pylint: disable=R0913, R0917
+    """Logs in and keeps running weighted scenario steps until the deadline."""
+    weights, steps = zip(*scenario["steps"])
+    await session.login()
+
+    while time.perf_counter() < deadline:
+        step = rng.choices(steps, weights)[0]
+        await step(session, rng)
+        # Even a closed loop yields, so one fast user cannot starve the rest
+        await asyncio.sleep(rng.expovariate(1 / think_time) if think_time else 0)
+
+
+async def run_load(
+    base_url,
+    mix,
+    duration,
+    think_time=0.0,
+    credentials=None,
+    seed=0,
+    dataset_size=None,
+    timeout=30,
+    transport=None,
+):  # pylint: disable=R0913, R0914
+    """
+    Runs the scenario mix against base_url for duration seconds.
+    Returns throughput, error rates and latency percentiles / histograms per
+    endpoint as a JSON-serializable dict.
+    """
+    credentials = credentials or DEFAULT_CREDENTIALS
+    users = sum(mix.values())
+    limits = httpx.Limits(max_connections=users, max_keepalive_connections=users)
+
+    async with httpx.AsyncClient(
+        base_url=base_url, timeout=timeout, limits=limits, transport=transport
+    ) as client:
+        dataset = await discover_dataset(client, credentials["agent"])
+        stats = Stats()
+        start = time.perf_counter()
+        deadline = start + duration
+
+        virtual_users = []
+        for name, count in mix.items():
+            scenario = SCENARIOS[name]
+            for i in range(count):
+                session = Session(client, credentials[scenario["role"]], dataset, stats)
+                rng = random.Random(f"{seed}-{name}-{i}")
+                virtual_users.append(
+                    virtual_user(session, scenario, rng, deadline, think_time)
+                )
+
+        await asyncio.gather(*virtual_users)
+        elapsed = time.perf_counter() - start
+
+    return {
+        "config": {
+            "base_url": base_url,
+            "mix": mix,
+            "duration_s": duration,
+            "think_time_s": think_time,
+            "seed": seed,
+        },
+        "dataset": {"expected_size": dataset_size, **dataset},
+        "elapsed_s": round(elapsed, 2),
+        **stats.summary(elapsed),
+    }
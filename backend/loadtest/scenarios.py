@@ -0,0 +1,104 @@
+import math
+
+# Traffic mixes of the main backend's hot endpoints. Every virtual user runs
+# one scenario: it logs in as the scenario's role, then keeps picking weighted
+# steps. Steps are coroutines of (session, rng) and go through session.call so
+# every request is timed and counted.
+PROPERTIES = "/server-api/property-api/properties/"
+MY_LISTINGS = "/server-api/property-api/properties/my-listings/"
+LOGIN = "/server-api/auth-api/login/"
+REFRESH = "/server-api/auth-api/refresh-token/"
+
+PAGE_SIZE = 12
+# Share of list requests going past the first pages, these are the OFFSET
+# scans that get slower as the table grows
+DEEP_PAGE_RATE = 0.1
+SEARCH_TERMS = ["California", "Texas", "New York", "Florida", "Park", "Lake", "Port"]
+BEDS = ["1", "2", "3", "4", "5", "8+"]
+
+
+def list_page(session, rng):
+    """Mostly the first pages, now and then anywhere in the dataset."""
+    pages = max(1, math.ceil(session.dataset["count"] / PAGE_SIZE))
+    if rng.random() < DEEP_PAGE_RATE:
+        return rng.randint(1, pages)
+    return rng.randint(1, min(3, pages))
+
+
+def property_filters(rng):
+    """A search form submission, one to three filters."""
+    filters = {}
+    for name in rng.sample(["search", "beds", "price", "area_sqft"], rng.randint(1, 3)):
+        if name == "search":
+            filters["search"] = rng.choice(SEARCH_TERMS)
+        elif name == "beds":
+            filters["beds"] = rng.choice(BEDS)
+        elif name == "price":
+            low = rng.randrange(150000, 1500000, 50000)
+            filters.update(price_min=low, price_max=low + rng.choice([100000, 250000]))
+        else:
+            low = rng.randrange(500, 4000, 250)
+            filters.update(area_sqft_min=low, area_sqft_max=low + 1000)
+    return filters
+
+
+async def list_properties(session, rng):
+    await session.call(
+        "properties.list", "GET", PROPERTIES, params={"page": list_page(session, rng)}
+    )
+
+
+async def filter_properties(session, rng):
+    await session.call(
+        "properties.list_filtered", "GET", PROPERTIES, params=property_filters(rng)
+    )
+
+
+async def retrieve_property(session, rng):
+    property_id = rng.randint(session.dataset["min_id"], session.dataset["max_id"])
+    await session.call("properties.retrieve", "GET", f"{PROPERTIES}{property_id}/")
+
+
+async def my_listings(session, rng):
+    await session.call(
+        "properties.my_listings", "GET", MY_LISTINGS, params={"page": rng.randint(1, 3)}
+    )
+
+
+async def login(session, rng):  # pylint: disable=W0613
+    await session.login()
+
+
+async def refresh(session, rng):  # pylint: disable=W0613
+    await session.refresh()
+
+
+SCENARIOS = {
+    "browse": {
+        "role": "default",
+        "steps": [
+            (55, list_properties),
+            (25, filter_properties),
+            (15, retrieve_property),
+            (4, refresh),
+            (1, login),
+        ],
+    },
+    "agent": {
+        "role": "agent",
+        "steps": [
+            (40, my_listings),
+            (25, retrieve_property),
+            (20, list_properties),
+            (10, filter_properties),
+            (5, refresh),
+        ],
+    },
+    "auth": {
+        "role": "default",
+        "steps": [(50, login), (50, refresh)],
+    },
+}
+
+# Virtual users per scenario for the default mix
+DEFAULT_MIX = {"browse": 8, "agent": 2}
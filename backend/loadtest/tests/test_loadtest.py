@@ -0,0 +1,144 @@
+import json
+import math
+import asyncio
+import itertools
+import httpx
+from django.test import SimpleTestCase
+from loadtest.__main__ import parse_mix
+from loadtest.runner import histogram, latency_percentiles, run_load
+from loadtest.scenarios import LOGIN, MY_LISTINGS, PAGE_SIZE, PROPERTIES, REFRESH
+
+MIN_ID, MAX_ID = 101, 150
+
+
+class FakeBackend:
+    """Just enough of the API for the scenarios, with rotating refresh tokens."""
+
+    def __init__(self, broken_ids=()):
+        self.tokens = itertools.count()
+        self.refresh_tokens = set()
+        self.broken_ids = set(broken_ids)
+        self.queries = []
+
+    def tokens_response(self):
+        refresh = f"refresh-{next(self.tokens)}"
+        self.refresh_tokens.add(refresh)
+        return httpx.Response(
+            200, json={"access_token": "access", "refresh_token": refresh}
+        )
+
+    def __call__(self, request):
+        path = request.url.path
+        self.queries.append(str(request.url))
+
+        if path == LOGIN:
+            return self.tokens_response()
+        if path == REFRESH:
+            refresh = json.loads(request.content)["refresh"]
+            if refresh not in self.refresh_tokens:
+                return httpx.Response(401, json={"errors": "Token is blacklisted"})
+            self.refresh_tokens.remove(refresh)
+            return self.tokens_response()
+
+        if request.headers.get("Authorization") != "Bearer access":
+            return httpx.Response(401, json={"errors": "You are not authenticated."})
+        if path in (PROPERTIES, MY_LISTINGS):
+            page = int(request.url.params.get("page", 1))
+            page_size = int(request.url.params.get("page_size", PAGE_SIZE))
+            if page > math.ceil((MAX_ID - MIN_ID + 1) / page_size):
+                return httpx.Response(404, json={"errors": "Invalid page."})
+            newest = page == 1 or page_size != 1
+            return httpx.Response(
+                200,
+                json={
+                    "count": MAX_ID - MIN_ID + 1,
+                    "results": [{"id": MAX_ID if newest else MIN_ID}],
+                },
+            )
+
+        property_id = int(path.rstrip("/").rsplit("/", 1)[1])
+        if property_id in self.broken_ids or not MIN_ID <= property_id <= MAX_ID:
+            return httpx.Response(500, json={"errors": "Server error"})
+        return httpx.Response(200, json={"id": property_id})
+
+
+class LoadTestTest(SimpleTestCase):
+    def run_load(self, backend, mix):
+        return asyncio.run(
+            run_load(
+                "http://testserver",
+                mix,
+                duration=0.1,
+                dataset_size=50,
+                transport=httpx.MockTransport(backend),
+            )
+        )
+
+    def test_run_reports_every_endpoint_of_the_mix(self):
+        """Test that a run reports throughput and latency per endpoint."""
+        result = self.run_load(FakeBackend(), {"browse": 2, "agent": 1})
+
+        self.assertEqual(
+            result["dataset"],
+            {"expected_size": 50, "count": 50, "min_id": MIN_ID, "max_id": MAX_ID},
+        )
+        self.assertGreater(result["throughput_rps"], 0)
+        self.assertEqual(result["error_rate"], 0.0)
+        for name in (
+            "properties.list",
+            "properties.list_filtered",
+            "properties.retrieve",
+            "properties.my_listings",
+            "auth.login",
+        ):
+            endpoint = result["endpoints"][name]
+            self.assertGreater(endpoint["requests"], 0)
+            self.assertEqual(endpoint["histogram"]["+Inf"], endpoint["requests"])
+            self.assertLessEqual(endpoint["p50_ms"], endpoint["p99_ms"])
+
+    def test_refresh_uses_the_rotated_token(self):
+        """Test that refreshes keep working after the refresh token rotated."""
+        result = self.run_load(FakeBackend(), {"auth": 2})
+
+        refresh = result["endpoints"]["auth.refresh"]
+        self.assertGreater(refresh["requests"], 1)
+        self.assertEqual(refresh["statuses"], {"200": refresh["requests"]})
+
+    def test_failed_requests_count_as_errors(self):
+        """Test that non-2xx responses show up in the error rates."""
+        backend = FakeBackend(broken_ids=range(MIN_ID, MAX_ID + 1))
+        result = self.run_load(backend, {"agent": 1})
+
+        retrieve = result["endpoints"]["properties.retrieve"]
+        self.assertEqual(retrieve["error_rate"], 1.0)
+        self.assertEqual(retrieve["statuses"], {"500": retrieve["requests"]})
+        self.assertGreater(result["error_rate"], 0)
+        self.assertLess(result["error_rate"], 1)
+
+    def test_deep_pages_stay_inside_the_dataset(self):
+        """Test that list pages are drawn from the seeded dataset size."""
+        backend = FakeBackend()
+        result = self.run_load(backend, {"browse": 2})
+
+        pages = math.ceil((MAX_ID - MIN_ID + 1) / PAGE_SIZE)
+        self.assertGreater(result["endpoints"]["properties.list"]["requests"], 0)
+        self.assertEqual(result["endpoints"]["properties.list"]["error_rate"], 0.0)
+        self.assertIn(f"page={pages}", " ".join(backend.queries))
+
+    def test_histogram_and_percentiles(self):
+        """Test that histograms are cumulative and percentiles in milliseconds."""
+        latencies = [0.005, 0.02, 0.2, 3.0]
+
+        buckets = histogram(latencies)
+        self.assertEqual(buckets["0.01"], 1)
+        self.assertEqual(buckets["0.25"], 3)
+        self.assertEqual(buckets["30"], 4)
+        self.assertEqual(buckets["+Inf"], 4)
+        self.assertEqual(latency_percentiles(latencies)["max_ms"], 3000.0)
+        self.assertEqual(latency_percentiles([0.1])["p95_ms"], 100.0)
+
+    def test_parse_mix(self):
+        """Test that the mix option maps scenarios to virtual users."""
+        self.assertEqual(parse_mix("browse=8,auth=1"), {"browse": 8, "auth": 1})
+        with self.assertRaises(Exception):
+            parse_mix("unknown=1")
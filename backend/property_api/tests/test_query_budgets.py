@@ -0,0 +1,118 @@
+from django.urls import reverse
+from django.contrib.auth import get_user_model
+from rest_framework import status
+from rest_framework.test import APITestCase, APIClient
+from rest_framework_simplejwt.tokens import RefreshToken
+from backend.query_inspection import QueryBudgetMixin
+from core_db.models import Agent, Property
+
+User = get_user_model()
+
+PROPERTY_LIST_URL = reverse("property-list")
+PROPERTY_DETAIL_URL = lambda pk: reverse("property-detail", kwargs={"pk": pk})
+MY_LISTING_URL = reverse("property-my-listings")
+
+
+# Budgets are the queries of each endpoint today, including the user lookup
+# of JWT authentication on a cold snapshot cache, so requests carry a real
+# access token.
+class PropertyQueryBudgetTests(QueryBudgetMixin, APITestCase):
+    """Query budgets of the PropertyViewSet endpoints."""
+
+    def setUp(self):
+        self.agent_user = User.objects.create_user(
+            email="agent@test.com",
+            username="agentuser",
+            password="StrongP@ss123",
+            is_agent=True,
+        )
+        self.agent_profile = Agent.objects.create(
+            user=self.agent_user, company_name="Test Realty Group"
+        )
+        self.normal_user = User.objects.create_user(
+            email="normal@test.com", username="normal", password="StrongP@ss123"
+        )
+        # A full page, so per-property queries would show up as repeats
+        self.properties = [
+            Property.objects.create(
+                title=f"Property {i}",
+                description="Description",
+                price=100000 + (i * 10000),
+                beds=(i % 5) + 1,
+                baths=(i % 3) + 1,
+                area_sqft=1000 + (i * 100),
+                address=f"{i} Main St, Springfield, IL",
+                agent=self.agent_profile,
+            )
+            for i in range(15)
+        ]
+
+        self.client = APIClient()
+
+    def _authenticate(self, user):
+        token = RefreshToken.for_user(user).access_token
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+
+    def test_list_budget(self):
+        """Test that listing properties stays within its query budget."""
+        self._authenticate(self.normal_user)
+        with self.assertQueryBudget(3, max_repeats=1):
+            response = self.client.get(PROPERTY_LIST_URL)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_filtered_list_budget(self):
+        """Test that filtering properties stays within its query budget."""
+        self._authenticate(self.normal_user)
+        with self.assertQueryBudget(3, max_repeats=1):
+            response = self.client.get(
+                PROPERTY_LIST_URL, {"price_min": 120000, "beds": 2}
+            )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_retrieve_budget(self):
+        """Test that retrieving a property stays within its query budget."""
+        self._authenticate(self.normal_user)
+        with self.assertQueryBudget(2):
+            response = self.client.get(PROPERTY_DETAIL_URL(self.properties[0].pk))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_my_listings_budget(self):
+        """Test that an agent's listings stay within their query budget."""
+        self._authenticate(self.agent_user)
+        with self.assertQueryBudget(3, max_repeats=1):
+            response = self.client.get(MY_LISTING_URL)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_create_budget(self):
+        """Test that creating a property stays within its query budget."""
+        self._authenticate(self.agent_user)
+        data = {
+            "title": "luxury apartment",
+            "description": "A grand view of the city.",
+            "beds": 3,
+            "baths": 2,
+            "price": 500000.00,
+            "area_sqft": 2000,
+            "address": "123 Sky Tower",
+        }
+        with self.assertQueryBudget(8):
+            response = self.client.post(PROPERTY_LIST_URL, data, format="json")
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+    def test_update_budget(self):
+        """Test that updating a property stays within its query budget."""
+        self._authenticate(self.agent_user)
+        with self.assertQueryBudget(5):
+            response = self.client.patch(
+                PROPERTY_DETAIL_URL(self.properties[0].pk),
+                {"price": 260000.00},
+                format="json",
+            )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_destroy_budget(self):
+        """Test that deleting a property stays within its query budget."""
+        self._authenticate(self.agent_user)
+        with self.assertQueryBudget(6):
+            response = self.client.delete(PROPERTY_DETAIL_URL(self.properties[0].pk))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
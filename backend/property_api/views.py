@@ -289,18 +289,17 @@ class PropertyViewSet(ModelViewSet):
         request_data["agent"] = agent.id
         serializer = self.get_serializer(data=request_data)
         serializer.is_valid(raise_exception=True)
-        self.perform_create(serializer)
-        property_obj = serializer.instance
 
         if property_image:
+            self.perform_create(serializer)
             property_image_serializer = PropertyImageSerializer(
-                property_obj, data={"image_url": property_image}
+                serializer.instance, data={"image_url": property_image}
             )
             property_image_serializer.is_valid(raise_exception=True)
             property_image_serializer.save()
         else:
-            property_obj.image_url = default_property_image
-            property_obj.save()
+            # Saved with the default image, not saved a second time for it
+            serializer.save(image_url=default_property_image)
         return Response(
             {"success": "Property created successfully."},
             status=status.HTTP_201_CREATED,
@@ -362,7 +361,7 @@ class PropertyViewSet(ModelViewSet):
         serializer.is_valid(raise_exception=True)
         self.perform_update(serializer)
 
-        property_instance.refresh_from_db()
+        # Updated in place, keeping the agent and user it was fetched with
         response_serializer = PropertyRetrieveSerializer(
             property_instance,
             context=self.get_serializer_context(),
@@ -606,15 +605,12 @@ class PropertyViewSet(ModelViewSet):
                 settings.MEDIA_ROOT, property_instance.image_url.name
             )
 
-        response = super().destroy(request, *args, **kwargs)
+        self.perform_destroy(property_instance)
 
         if old_property_image and os.path.exists(old_property_image):
             os.remove(old_property_image)
 
-        if response.status_code == status.HTTP_204_NO_CONTENT:
-            return Response(
-                {"success": f"Property {title} deleted successfully."},
-                status=status.HTTP_200_OK,
-            )
-
-        return response
+        return Response(
+            {"success": f"Property {title} deleted successfully."},
+            status=status.HTTP_200_OK,
+        )
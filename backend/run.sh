@@ -43,8 +43,16 @@ infisical run --path="/Real-Estate/backend" -- sh -c '
 
   # Check environment and start appropriate server
   if [ "$DJANGO_ENV" = "production" ]; then
+    # Revocations still in the SQL blacklist move to the cache blacklist,
+    # a no-op once the tables are empty
+    echo "Moving the SQL token blacklist to the cache..."
+    python manage.py prune_token_blacklist --migrate
+
     # Start Gunicorn in production mode
     echo "Starting Gunicorn production server..."
+    # Per-worker metric files for /metrics, cleared so restarts start from zero
+    export PROMETHEUS_MULTIPROC_DIR=/tmp/prometheus
+    rm -rf "$PROMETHEUS_MULTIPROC_DIR" && mkdir -p "$PROMETHEUS_MULTIPROC_DIR"
     gunicorn backend.wsgi:application --bind 0.0.0.0:8000 --workers=4 --threads=2 --timeout=120
   else
     # Start Django development server
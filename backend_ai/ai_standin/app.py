@@ -0,0 +1,190 @@
+import os
+import math
+import time
+import json
+import random
+import asyncio
+import uuid
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+from .data import count_tokens, completion_content, search_results
+
+# Local stand-in for the Groq (OpenAI compatible) and Tavily APIs.
+# Point GROQ_BASE_URL at http://<host>:8010/openai/v1 and TAVILY_BASE_URL at
+# http://<host>:8010 to run the live pipeline without any provider calls.
+# Latencies are log-normal from a p50 / p95 pair, 429s are drawn per request.
+PROFILE = {
+    "llm_p50_ms": float(os.getenv("STANDIN_LLM_P50_MS", "800")),
+    "llm_p95_ms": float(os.getenv("STANDIN_LLM_P95_MS", "2500")),
+    "search_p50_ms": float(os.getenv("STANDIN_SEARCH_P50_MS", "1200")),
+    "search_p95_ms": float(os.getenv("STANDIN_SEARCH_P95_MS", "3000")),
+    "rate_limit_rate": float(os.getenv("STANDIN_RATE_LIMIT_RATE", "0.05")),
+    "stream_tokens_per_s": float(os.getenv("STANDIN_STREAM_TOKENS_PER_S", "250")),
+    "search_credits": int(os.getenv("STANDIN_SEARCH_CREDITS", "2")),
+}
+STREAM_CHUNK_CHARS = 16
+
+app = FastAPI(title="AI Provider Stand-in")
+rng = random.Random(os.getenv("STANDIN_SEED"))
+stats = {"completions": 0, "searches": 0, "rate_limited": 0}
+
+
+def sample_latency(p50_ms, p95_ms):
+    """Seconds drawn from a log-normal with the given median and p95."""
+    if p50_ms <= 0:
+        return 0.0
+    sigma = math.log(max(p95_ms, p50_ms) / p50_ms) / 1.645
+    return rng.lognormvariate(math.log(p50_ms), sigma) / 1000
+
+
+def rate_limited():
+    """429 in the shape Groq returns it, None when the request goes through."""
+    if rng.random() >= PROFILE["rate_limit_rate"]:
+        return None
+
+    stats["rate_limited"] += 1
+    return JSONResponse(
+        status_code=429,
+        headers={"retry-after": "1"},
+        content={
+            "error": {
+                "message": "Rate limit reached, please try again in 1s.",
+                "type": "tokens",
+                "code": "rate_limit_exceeded",
+            }
+        },
+    )
+
+
+def usage(messages, content):
+    prompt_tokens = sum(count_tokens(m.get("content") or "") for m in messages)
+    completion_tokens = count_tokens(content)
+    return {
+        "prompt_tokens": prompt_tokens,
+        "completion_tokens": completion_tokens,
+        "total_tokens": prompt_tokens + completion_tokens,
+    }
+
+
+def completion_chunk(completion_id, model, delta, finish_reason=None, **extra):
+    return {
+        "id": completion_id,
+        "object": "chat.completion.chunk",
+        "created": int(time.time()),
+        "model": model,
+        "choices": (
+            [{"index": 0, "delta": delta, "finish_reason": finish_reason}]
+            if delta is not None
+            else []
+        ),
+        **extra,
+    }
+
+
+async def stream_completion(completion_id, model, messages, content, body):
+    """Server-sent chunks paced at the configured tokens per second."""
+    delay = STREAM_CHUNK_CHARS / 4 / PROFILE["stream_tokens_per_s"]
+
+    yield "data: " + json.dumps(
+        completion_chunk(completion_id, model, {"role": "assistant", "content": ""})
+    ) + "\n\n"
+
+    for i in range(0, len(content), STREAM_CHUNK_CHARS):
+        await asyncio.sleep(delay)
+        piece = content[i : i + STREAM_CHUNK_CHARS]
+        yield "data: " + json.dumps(
+            completion_chunk(completion_id, model, {"content": piece})
+        ) + "\n\n"
+
+    yield "data: " + json.dumps(
+        completion_chunk(completion_id, model, {}, finish_reason="stop")
+    ) + "\n\n"
+
+    if (body.get("stream_options") or {}).get("include_usage"):
+        yield "data: " + json.dumps(
+            completion_chunk(completion_id, model, None, usage=usage(messages, content))
+        ) + "\n\n"
+
+    yield "data: [DONE]\n\n"
+
+
+@app.post("/openai/v1/chat/completions")
+async def chat_completions(request: Request):
+    body = await request.json()
+    model = body.get("model", "")
+    messages = body.get("messages", [])
+
+    await asyncio.sleep(sample_latency(PROFILE["llm_p50_ms"], PROFILE["llm_p95_ms"]))
+    limited = rate_limited()
+    if limited:
+        return limited
+
+    stats["completions"] += 1
+    content = completion_content(model, messages)
+    completion_id = f"chatcmpl-{uuid.uuid4().hex}"
+
+    if body.get("stream"):
+        return StreamingResponse(
+            stream_completion(completion_id, model, messages, content, body),
+            media_type="text/event-stream",
+        )
+
+    return {
+        "id": completion_id,
+        "object": "chat.completion",
+        "created": int(time.time()),
+        "model": model,
+        "choices": [
+            {
+                "index": 0,
+                "message": {"role": "assistant", "content": content},
+                "finish_reason": "stop",
+            }
+        ],
+        "usage": usage(messages, content),
+    }
+
+
+@app.post("/search")
+async def search(request: Request):
+    body = await request.json()
+    query = body.get("query", "")
+    max_results = min(int(body.get("max_results") or 5), 20)
+
+    latency = sample_latency(PROFILE["search_p50_ms"], PROFILE["search_p95_ms"])
+    await asyncio.sleep(latency)
+    limited = rate_limited()
+    if limited:
+        return limited
+
+    stats["searches"] += 1
+    response = {
+        "query": query,
+        "answer": None,
+        "images": [],
+        "results": search_results(query, max_results),
+        "response_time": round(latency, 2),
+    }
+    if body.get("include_usage"):
+        response["usage"] = {"credits": PROFILE["search_credits"]}
+    return response
+
+
+@app.get("/standin/profile")
+async def get_profile():
+    return {"profile": PROFILE, "stats": stats}
+
+
+@app.put("/standin/profile")
+async def update_profile(request: Request):
+    """Changes latency / 429 settings between benchmark runs."""
+    updates = await request.json()
+    unknown = set(updates) - set(PROFILE)
+    if unknown:
+        return JSONResponse(
+            status_code=400, content={"error": f"Unknown settings: {sorted(unknown)}"}
+        )
+
+    PROFILE.update({key: type(PROFILE[key])(value) for key, value in updates.items()})
+    stats.update(completions=0, searches=0, rate_limited=0)
+    return {"profile": PROFILE, "stats": stats}
@@ -0,0 +1,190 @@
+import re
+import json
+import random
+import zlib
+from chat_api.parsers import parse_what_if_query
+from report_api.extractors import extract_listings
+
+# Canned but realistic payloads for the stand-in, derived from the request so
+# the real pipeline (dedupe, regex extraction, regression) has work to do
+CHARS_PER_TOKEN = 4
+
+STREETS = [
+    "Oak St",
+    "Maple Dr",
+    "Elm Ave",
+    "Cedar Ct",
+    "Birch Ln",
+    "Walnut Way",
+    "Hickory Rd",
+    "Aspen Pl",
+    "Willow Blvd",
+    "Spruce St",
+]
+SITES = [
+    (
+        "zillow.com",
+        "{address} ${price:,} {beds} bds · {baths} ba · {sqft:,} sqft - Sold",
+    ),
+    (
+        "redfin.com",
+        "SOLD {address} ${price:,} Last Sold Price {beds} Beds {baths} Baths "
+        "{sqft:,} Sq. Ft.",
+    ),
+    ("homes.com", "${price_k}K {beds} Beds {baths} Baths {sqft:,} Sq Ft {address}"),
+    (
+        "realtor.com",
+        "This {beds}-bedroom, {baths}-bathroom home at {address} spanning "
+        "{sqft:,} square feet sold for ${price:,}.",
+    ),
+]
+MARKET_NOTE = (
+    "The median sale price in {area} was ${median:,} last month, "
+    "homes sold after {days} days on average."
+)
+
+QUERY_NUMBER = {
+    "area_sqft": re.compile(r"(\d+)\s*sqft"),
+    "beds": re.compile(r"(\d+)\s*beds"),
+    "baths": re.compile(r"(\d+)\s*baths"),
+}
+QUERY_AREA = re.compile(r"(?:properties in|site:\S+)\s+(.+?)\s+(?:with|'recently)")
+RAW_DATA = re.compile(r"RAW DATA:\n(.*?)\n\nSTRICT RULES", re.S)
+PROPERTY_DETAILS = re.compile(
+    r"ORIGINAL PROPERTY DETAILS:\n(.*?)\n\nUSER QUERY: (.*?)\n\n", re.S
+)
+RATING = re.compile(r"COMPUTED RATING: ([\d.]+)")
+
+
+def count_tokens(text):
+    return -(-len(text) // CHARS_PER_TOKEN)
+
+
+def query_subject(query):
+    """Subject property of a tavily_search query."""
+    subject = {"area_sqft": 1500, "beds": 3, "baths": 2}
+    for field, pattern in QUERY_NUMBER.items():
+        match = pattern.search(query)
+        if match:
+            subject[field] = int(match.group(1))
+    match = QUERY_AREA.search(query)
+    subject["area"] = match.group(1) if match else "Springfield"
+    return subject
+
+
+def listing(rng, subject):
+    """One comparable sale around the subject property."""
+    sqft = max(400, int(subject["area_sqft"] * rng.uniform(0.75, 1.25)))
+    beds = max(1, subject["beds"] + rng.choice([-1, 0, 0, 0, 1]))
+    baths = max(1, subject["baths"] + rng.choice([-1, 0, 0, 1]))
+    price = int(sqft * rng.uniform(180, 320) / 1000) * 1000
+    address = f"{rng.randint(1, 999)} {rng.choice(STREETS)}"
+    return {
+        "address": address,
+        "sqft": sqft,
+        "beds": beds,
+        "baths": baths,
+        "price": price,
+        "price_k": price // 1000,
+    }
+
+
+def search_results(query, max_results):
+    """
+    Tavily search results for a query.
+    Seeded by the subject (not the query), so the forks of one report
+    overlap the way real search results do.
+    """
+    subject = query_subject(query)
+    seed = zlib.crc32(json.dumps(subject, sort_keys=True).encode())
+    pool_rng = random.Random(seed)
+    pool = [listing(pool_rng, subject) for _ in range(max_results * 2)]
+
+    rng = random.Random(zlib.crc32(query.encode()))
+    results = []
+    for i in range(max_results):
+        site, template = rng.choice(SITES)
+        cards = rng.sample(pool, k=rng.randint(1, 3))
+        content = "\n".join(template.format(**card) for card in cards)
+        if rng.random() < 0.3:
+            content += " " + MARKET_NOTE.format(
+                area=subject["area"],
+                median=int(subject["area_sqft"] * 250),
+                days=rng.randint(10, 60),
+            )
+        results.append(
+            {
+                "url": f"https://www.{site}/{subject['area'].replace(' ', '-').lower()}/{i}",
+                "title": f"Recently sold homes in {subject['area']}",
+                "content": content,
+                "score": round(rng.uniform(0.5, 0.99), 3),
+                "raw_content": None,
+            }
+        )
+    return results
+
+
+def extraction_content(prompt):
+    """groq_json_formatter answer: every listing found in the raw data."""
+    match = RAW_DATA.search(prompt)
+    properties, _ = extract_listings(match.group(1) if match else "")
+    return json.dumps({"properties": properties})
+
+
+def chat_extraction_content(prompt):
+    """chat_json_extractor_agent answer: the property after the what-if change."""
+    match = PROPERTY_DETAILS.search(prompt)
+    if not match:
+        return json.dumps({"error": "Invalid request. Please try again."})
+
+    details = json.loads(match.group(1))
+    updated = parse_what_if_query(details, match.group(2))
+    if updated is None:
+        return json.dumps({"error": "Invalid request. Please try again."})
+
+    updated.pop("title", None)
+    updated["error"] = None
+    return json.dumps(updated)
+
+
+def insight_content(prompt, reasoning):
+    """groq_ai_insight_prompt answer, Qwen streams a reasoning block first."""
+    match = RATING.search(prompt)
+    rating = match.group(1) if match else "3.0"
+    insight = {
+        "weighted_analysis": (
+            "+1.2 Competitive Price-to-Value Gap\n"
+            "+0.4 Bedroom Count In Line With Comparables\n"
+            "-0.3 Premium Pricing Relative To Square Footage"
+        ),
+        "investment_summary": (
+            f"The property earns a {rating} / 5 rating against recent comparable sales. "
+            "Pricing sits close to the neighbourhood median per square foot. "
+            "Layout and size match what buyers in the area pay for."
+        ),
+        "pros": [
+            "Priced near comparable sales per square foot",
+            "Bedroom and bathroom mix matches local demand",
+        ],
+        "cons": [
+            "Limited upside if the local market cools",
+            "Smaller lot than several comparables",
+        ],
+    }
+    content = json.dumps(insight)
+    if reasoning:
+        content = (
+            "<think>Comparing the rating breakdown with the comps.</think>" + content
+        )
+    return content
+
+
+def completion_content(model, messages):
+    """Canned completion for whichever agent sent the messages."""
+    prompt = "\n".join(message.get("content") or "" for message in messages)
+
+    if "Extract comparable properties" in prompt:
+        return extraction_content(prompt)
+    if "ORIGINAL PROPERTY DETAILS" in prompt:
+        return chat_extraction_content(prompt)
+    return insight_content(prompt, reasoning="qwen" in model)
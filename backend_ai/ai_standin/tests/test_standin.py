@@ -0,0 +1,117 @@
+from unittest.mock import patch
+import openai as openai_sdk
+from openai import OpenAI
+from fastapi.testclient import TestClient
+from django.test import SimpleTestCase, override_settings
+from ai_standin.app import app, PROFILE
+from report_api import agents
+from report_api.extractors import extract_listings
+from report_api.tasks import search_properties_live
+
+LOCMEM_CACHE = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+NO_LATENCY = {
+    "llm_p50_ms": 0,
+    "search_p50_ms": 0,
+    "rate_limit_rate": 0.0,
+    "stream_tokens_per_s": 1e9,
+}
+PROPERTY_DATA = {
+    "title": "Modern Condo",
+    "area": "Downtown",
+    "city": "Springfield",
+    "area_sqft": 1500,
+    "beds": 3,
+    "baths": 2,
+    "price": 450000.0,
+}
+
+
+def standin_openai(client):
+    return OpenAI(
+        api_key="test",
+        base_url="http://testserver/openai/v1",
+        http_client=client,
+        max_retries=0,
+    )
+
+
+@override_settings(CACHES=LOCMEM_CACHE)
+class AIStandinTest(SimpleTestCase):
+    def setUp(self):
+        self.client = TestClient(app)
+        profile = patch.dict(PROFILE, NO_LATENCY)
+        profile.start()
+        self.addCleanup(profile.stop)
+
+    def standin_search(self, query, max_results, **kwargs):
+        return self.client.post(
+            "/search", json={"query": query, "max_results": max_results, **kwargs}
+        ).json()
+
+    def test_search_returns_parseable_listings(self):
+        """Test that search results look like real listing snippets."""
+        result = self.standin_search(
+            "site:zillow.com Downtown Springfield 'recently sold' 1500 sqft "
+            "3 beds 2 baths with price",
+            5,
+            include_usage=True,
+        )
+
+        self.assertEqual(len(result["results"]), 5)
+        self.assertEqual(result["usage"]["credits"], PROFILE["search_credits"])
+        properties = [
+            item
+            for res in result["results"]
+            for item in extract_listings(res["content"])[0]
+        ]
+        self.assertTrue(properties)
+
+    def test_openai_client_extraction(self):
+        """Test that groq_json_formatter runs unchanged against the stand-in."""
+        with patch.object(agents, "openai", standin_openai(self.client)):
+            properties, usage = agents.groq_json_formatter(
+                "Source: https://www.zillow.com/x\nContent: 42 Oak St $452,000 "
+                "3 bds · 2 ba · 1,540 sqft",
+                "Downtown",
+                "Springfield",
+            )
+
+        self.assertEqual(
+            properties, [{"price": 452000, "area_sqft": 1540, "beds": 3, "baths": 2}]
+        )
+        self.assertGreater(usage.prompt_tokens, 0)
+
+    def test_streamed_insight(self):
+        """Test that streamed Qwen insights parse and report usage."""
+        deltas = []
+        with patch.object(agents, "openai", standin_openai(self.client)):
+            insight, usage = agents.groq_ai_insight_prompt(
+                [], PROPERTY_DATA, 3.5, {"price_score": 1.2}, "Qwen", deltas.append
+            )
+
+        self.assertIn("3.5 / 5", insight["investment_summary"])
+        self.assertTrue(deltas)
+        self.assertGreater(usage.completion_tokens, 0)
+
+    def test_rate_limits(self):
+        """Test that the configured 429 rate surfaces as a Groq rate limit."""
+        PROFILE["rate_limit_rate"] = 1.0
+
+        with self.assertRaises(openai_sdk.RateLimitError):
+            standin_openai(self.client).chat.completions.create(
+                model="llama-3.1-8b-instant",
+                messages=[{"role": "user", "content": "hi"}],
+            )
+
+    @patch("report_api.tasks.time.sleep")
+    def test_live_search_task(self, _sleep):
+        """Test that the live search fork returns comps from the stand-in."""
+        with patch.object(agents, "openai", standin_openai(self.client)), patch.object(
+            agents.tavily, "search", self.standin_search
+        ):
+            properties = search_properties_live.apply(
+                args=[None, PROPERTY_DATA, 10, 0]
+            ).get()
+
+        self.assertTrue(properties)
+        self.assertEqual(set(properties[0]), {"price", "area_sqft", "beds", "baths"})
@@ -0,0 +1,57 @@
+import json
+import zlib
+import hashlib
+from django.conf import settings
+from django.core.cache import cache
+from celery.utils.log import get_task_logger
+
+logger = get_task_logger(__name__)
+
+# Big task payloads are stored once in Redis (zlib compressed) under a content
+# key, only a small {"claim_check": key} reference travels through the broker
+CLAIM_CHECK_FIELD = "claim_check"
+
+
+class ClaimCheckExpired(LookupError):
+    """The referenced payload is no longer in Redis."""
+
+
+def is_claim_check(value):
+    """True if value is a reference returned by store_payload."""
+    return isinstance(value, dict) and list(value) == [CLAIM_CHECK_FIELD]
+
+
+def store_payload(data):
+    """
+    Stores data and returns a reference to it.
+    Payloads below CLAIM_CHECK_MIN_BYTES are returned unchanged, so are all
+    payloads when Redis is unavailable.
+    """
+    serialized = json.dumps(data, sort_keys=True, separators=(",", ":")).encode()
+
+    if len(serialized) < settings.CLAIM_CHECK_MIN_BYTES:
+        return data
+
+    key = f"claim_check_{hashlib.sha256(serialized).hexdigest()}"
+
+    try:
+        # SET NX, identical payloads are only stored once
+        if not cache.add(key, zlib.compress(serialized), settings.CLAIM_CHECK_TTL):
+            cache.touch(key, settings.CLAIM_CHECK_TTL)
+    except Exception as e:  # pylint: disable=W0718
+        logger.warning("Claim check store failed, sending payload inline: %s", e)
+        return data
+
+    return {CLAIM_CHECK_FIELD: key}
+
+
+def load_payload(value):
+    """Resolves a claim check reference, any other value is returned unchanged."""
+    if not is_claim_check(value):
+        return value
+
+    blob = cache.get(value[CLAIM_CHECK_FIELD])
+    if blob is None:
+        raise ClaimCheckExpired(f"Payload {value[CLAIM_CHECK_FIELD]} expired")
+
+    return json.loads(zlib.decompress(blob))
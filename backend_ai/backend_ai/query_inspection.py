@@ -0,0 +1,99 @@
+import re
+import logging
+from collections import Counter
+from contextlib import contextmanager
+from django.conf import settings
+from django.db import connection
+from backend_ai.metrics import QueryTimer
+
+logger = logging.getLogger(__name__)
+
+# Parameters are passed separately, so the SQL is already the query's shape.
+# Only IN lists vary in length and are collapsed.
+IN_LIST = re.compile(r"IN \((?:%s, )*%s\)")
+
+
+def query_shape(sql):
+    """The query with its IN lists collapsed, one shape repeating is an N+1."""
+    return IN_LIST.sub("IN (...)", sql)
+
+
+class QueryRecorder(QueryTimer):
+    """Database execute wrapper keeping the count, time and shapes of queries."""
+
+    def __init__(self):
+        super().__init__()
+        self.shapes = Counter()
+
+    def __call__(
+        self, execute, sql, params, many, context
+    ):  # pylint: disable=R0913, R0917
+        self.shapes[query_shape(sql)] += 1
+        return super().__call__(execute, sql, params, many, context)
+
+    def repeated(self, threshold):
+        """(shape, count) of the shapes run at least threshold times."""
+        return [
+            (shape, count)
+            for shape, count in self.shapes.most_common()
+            if count >= threshold
+        ]
+
+    def report(self):
+        return "\n".join(
+            f"  {count} x {shape}" for shape, count in self.shapes.most_common()
+        )
+
+
+class QueryInspectionMiddleware:
+    """
+    Dev middleware (QUERY_INSPECTION=True) adding X-DB-Query-Count and
+    X-DB-Query-Time (ms) headers and logging repeated query shapes.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        recorder = QueryRecorder()
+        with connection.execute_wrapper(recorder):
+            response = self.get_response(request)
+
+        response["X-DB-Query-Count"] = str(recorder.count)
+        response["X-DB-Query-Time"] = f"{recorder.duration * 1000:.1f}"
+
+        for shape, count in recorder.repeated(settings.QUERY_REPEAT_THRESHOLD):
+            logger.warning(
+                "Possible N+1 on %s %s: %s x %s",
+                request.method,
+                request.path,
+                count,
+                shape,
+            )
+
+        return response
+
+
+class QueryBudgetMixin:
+    """TestCase mixin failing when a block runs more queries than its budget."""
+
+    @contextmanager
+    def assertQueryBudget(self, budget, max_repeats=None):  # pylint: disable=C0103
+        """
+        Fails when the block runs more than budget queries, or with max_repeats
+        when one query shape runs more often than that (an N+1).
+        """
+        recorder = QueryRecorder()
+        with connection.execute_wrapper(recorder):
+            yield recorder
+
+        if recorder.count > budget:
+            self.fail(
+                f"{recorder.count} queries over a budget of {budget}:\n"
+                f"{recorder.report()}"
+            )
+        if max_repeats is not None and recorder.repeated(max_repeats + 1):
+            self.fail(
+                f"Query shapes repeated more than {max_repeats} times:\n"
+                f"{recorder.report()}"
+            )
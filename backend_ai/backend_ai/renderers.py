@@ -1,4 +1,5 @@
-from rest_framework.renderers import JSONRenderer
+import json
+from rest_framework.renderers import BaseRenderer, JSONRenderer
 
 
 class ViewRenderer(JSONRenderer):
@@ -25,3 +26,29 @@ class ViewRenderer(JSONRenderer):
                 data = {"errors": data}
 
         return super().render(data, accepted_media_type, renderer_context)
+
+
+class EventStreamRenderer(BaseRenderer):
+    """
+    Render Class for Server-Sent Event streams.
+    Streaming views return their own StreamingHttpResponse, this renderer
+    only lets content negotiation accept text/event-stream and renders errors.
+    """
+
+    media_type = "text/event-stream"
+    format = "sse"
+    charset = "utf-8"
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        """Render error responses as a single SSE error event."""
+        if data is None:
+            return b""
+
+        if isinstance(data, dict) and "error" in data:
+            data = {"errors": data["error"]}
+        if isinstance(data, dict) and "detail" in data:
+            data = {"errors": data["detail"]}
+
+        return f"event: error\ndata: {json.dumps(data, default=str)}\n\n".encode(
+            self.charset
+        )
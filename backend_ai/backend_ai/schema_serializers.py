@@ -51,3 +51,17 @@ class ChatMessagePOSTResponseSerializer(
 
     success = serializers.CharField(default="Message is currently processing.")
     data = ChatMessageAIMessageSerializer()
+
+
+class PipelineStageMetricSerializer(serializers.Serializer):  # pylint: disable=W0223
+    """Latency and token aggregates of one pipeline stage."""
+
+    stage = serializers.CharField()
+    count = serializers.IntegerField()
+    p50_ms = serializers.FloatField()
+    p95_ms = serializers.FloatField()
+    prompt_tokens = serializers.IntegerField()
+    completion_tokens = serializers.IntegerField()
+    retries = serializers.IntegerField()
+    cache_hit_rate = serializers.FloatField()
+    failure_rate = serializers.FloatField()
@@ -11,6 +11,7 @@ https://docs.djangoproject.com/en/6.0/ref/settings/
 """
 
 import os
+import sys
 from pathlib import Path
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -26,6 +27,11 @@ PUBLIC_KEY = os.getenv("public_key")
 GROQ_API_KEY = os.getenv("GROQ_API_KEY", "XXXXXX")
 GROQ_API_KEY2 = os.getenv("GROQ_API_KEY2", "XXXXXX")
 TAVILY_API_KEY = os.getenv("TAVILY_API_KEY", "XXXXXX")
+# Point both at the local stand-in (ai_standin) for offline load tests
+GROQ_BASE_URL = os.getenv("GROQ_BASE_URL", "https://api.groq.com/openai/v1")
+TAVILY_BASE_URL = os.getenv("TAVILY_BASE_URL", "https://api.tavily.com")
+# Run the real Tavily / Groq pipeline instead of the mock agents
+AI_AGENTS_LIVE = os.getenv("AI_AGENTS_LIVE", "False") == "True"
 
 # SECURITY WARNING: don't run with debug turned on in production!
 DEBUG = os.getenv("DEBUG")
@@ -64,6 +70,7 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    "backend_ai.metrics.PrometheusMetricsMiddleware",
     "corsheaders.middleware.CorsMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
@@ -168,8 +175,29 @@ REST_FRAMEWORK = {
         "rest_framework_simplejwt.authentication.JWTStatelessUserAuthentication",
     ),
     "DEFAULT_PERMISSION_CLASSES": ("rest_framework.permissions.IsAuthenticated",),
+    # Per scope, see backend_ai.throttling. Every report queues a chord of
+    # LLM and search calls, every chat message an LLM completion
+    "DEFAULT_THROTTLE_RATES": {
+        "report_user": "10/hour",
+        "report_ip": "30/hour",
+        "chat_user": "10/min",
+        "chat_ip": "30/min",
+    },
+    # Assumes the API is only reachable through the Next.js server, which
+    # sends one X-Forwarded-For entry (the client IP it trusts, see
+    # TRUSTED_PROXY in frontend/src/libs/apiClient.js). Exposing the API
+    # directly or adding a proxy in front of it means changing this count
+    "NUM_PROXIES": 1,
 }
 
+# Throttling
+# GCRA state lives in THROTTLE_CACHE (Redis), shared by every worker.
+# Off for the test suite and with THROTTLE_ENABLED=False for load tests
+THROTTLE_ENABLED = (
+    os.getenv("THROTTLE_ENABLED", "True") == "True" and "test" not in sys.argv
+)
+THROTTLE_CACHE = "default"
+
 # Simple JWT Settings
 
 REST_USE_JWT = True
@@ -179,6 +207,8 @@ SIMPLE_JWT = {
     "VERIFYING_KEY": PUBLIC_KEY,
     "USER_ID_CLAIM": "user_id",
     "AUTH_HEADER_TYPES": ("Bearer",),
+    # Stateless users read role, is_agent, is_staff and is_superuser claims
+    "TOKEN_USER_CLASS": "backend_ai.tokens.ClaimsTokenUser",
 }
 
 SPECTACULAR_SETTINGS = {
@@ -253,6 +283,83 @@ CELERY_TASK_SERIALIZER = "json"
 CELERY_RESULT_SERIALIZER = "json"
 CELERY_ACCEPT_CONTENT = ["json"]
 
+# Celery Queues
+# Chat, I/O bound report work (LLM / search calls) and CPU bound report work
+# run on separate queues and worker pools (see run.sh), so report bursts
+# cannot starve chat messages.
+# Redis priorities: 0 is the highest, messages are consumed by priority step
+CELERY_BROKER_TRANSPORT_OPTIONS = {
+    "queue_order_strategy": "priority",
+    "priority_steps": list(range(10)),
+}
+CELERY_TASK_DEFAULT_PRIORITY = 5
+CHAT_PRIORITY = 0
+REPORT_PRIORITY = 3
+BATCH_PRIORITY = 9
+
+CELERY_TASK_ROUTES = {
+    "chat_api.tasks.*": {"queue": "chat", "priority": CHAT_PRIORITY},
+    "report_api.tasks.report_finalizer": {
+        "queue": "report_cpu",
+        "priority": REPORT_PRIORITY,
+    },
+    "report_api.tasks.rescore_*": {"queue": "report_cpu", "priority": BATCH_PRIORITY},
+    "report_api.tasks.*": {"queue": "report_io", "priority": REPORT_PRIORITY},
+}
+
+# Chat Streaming
+# Partial AI answers are pushed to Redis while Qwen generates them
+CHAT_STREAMING_ENABLED = os.getenv("CHAT_STREAMING_ENABLED", "True") == "True"
+CHAT_STREAM_TTL = 300  # 5 minutes
+CHAT_STREAM_PUSH_INTERVAL = 0.1  # Seconds between Redis writes
+CHAT_STREAM_POLL_INTERVAL = 0.2  # Seconds between Redis reads on the endpoint
+CHAT_STREAM_TIMEOUT = 120  # Max seconds a stream connection is held open
+
+# Claim Check
+# Task payloads above this size are passed by reference instead of by value
+CLAIM_CHECK_MIN_BYTES = 4 * 1024  # 4 KB, 100 comparables are ~5 KB
+CLAIM_CHECK_TTL = 60 * 60 * 6  # 6 hours, outlives every retry of the pipelines
+
+# Snippet Deduplication
+# Near-duplicate Tavily snippets across the forks of a report are dropped
+SNIPPET_DEDUP_THRESHOLD = 0.7  # Estimated Jaccard similarity of word 3-grams
+SNIPPET_DEDUP_TTL = 60 * 60  # 1 hour, covers every search fork and retry
+
+# Structured Extraction
+# Chunks parsed by the regex extractor with at least this confidence skip the LLM
+EXTRACTOR_MIN_CONFIDENCE = 0.75
+
+# LLM Prompt Packing
+# Context tokens (Tavily text, comps) packed into a single prompt per model
+LLM_TOKEN_ENCODING = "o200k_base"
+LLM_CONTEXT_TOKEN_BUDGETS = {
+    "llama-3.1-8b-instant": 3500,  # Tavily text per extraction call
+    "openai/gpt-oss-120b": 400,  # Comps in the report insight
+    "qwen/qwen3-32b": 400,  # Comps in the chat insight
+}
+LLM_DEFAULT_CONTEXT_TOKEN_BUDGET = 2500
+
+# LLM Insight Cache
+# Insights are content addressed, identical prompts skip the Groq call
+LLM_INSIGHT_CACHE_TTL = 60 * 60 * 24  # 1 day
+LLM_INSIGHT_CACHE_MAX_ENTRIES = 5000
+
+# Investment Rating
+# "numpy" solves the regression in closed form, "sklearn" keeps the original pipeline
+REGRESSION_ENGINE = os.getenv("REGRESSION_ENGINE", "numpy")
+
+# Prometheus Metrics
+# Scraped from /metrics, multiprocess safe when PROMETHEUS_MULTIPROC_DIR is set
+METRICS_PATH = "/metrics"
+METRICS_TOKEN = os.getenv("METRICS_TOKEN", "")  # Bearer token, empty = closed
+
+# Query Inspection
+# Dev only: X-DB-Query-Count / X-DB-Query-Time headers and N+1 warnings
+QUERY_INSPECTION = os.getenv("QUERY_INSPECTION", "False") == "True"
+QUERY_REPEAT_THRESHOLD = 3  # Same query shape this often in one request
+if QUERY_INSPECTION:
+    MIDDLEWARE.insert(1, "backend_ai.query_inspection.QueryInspectionMiddleware")
+
 # Test Runner for Shadow Models
 TEST_RUNNER = "backend_ai.test_runner.ShadowModelTestRunner"
 
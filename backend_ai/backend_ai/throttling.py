@@ -0,0 +1,126 @@
+import math
+import logging
+from django.conf import settings
+from django.core.cache import caches
+from django_redis import get_redis_connection
+from redis.commands.core import Script
+from rest_framework.settings import api_settings
+from rest_framework.throttling import SimpleRateThrottle
+
+logger = logging.getLogger(__name__)
+
+# GCRA: KEYS[1] holds the theoretical arrival time (TAT) in ms, ARGV[1] is the
+# emission interval (period / requests) and ARGV[2] the period, both in ms.
+# Returns 0 when the request is allowed, else the ms until the next one is.
+# Redis' clock is used so workers on different hosts agree on "now", and
+# rejected requests leave the TAT alone so retrying does not extend the wait.
+GCRA_SCRIPT = """
+local time = redis.call("TIME")
+local now = time[1] * 1000 + math.floor(time[2] / 1000)
+local tat = math.max(tonumber(redis.call("GET", KEYS[1])) or now, now)
+local new_tat = tat + tonumber(ARGV[1])
+local wait = new_tat - now - tonumber(ARGV[2])
+if wait > 0 then
+    return math.ceil(wait)
+end
+redis.call("SET", KEYS[1], string.format("%d", new_tat), "PX", new_tat - now)
+return 0
+"""
+# Hashed once, EVALSHA loads the script on the servers that do not have it yet
+GCRA = Script(None, GCRA_SCRIPT.encode())
+
+
+class RedisRateThrottle(SimpleRateThrottle):  # pylint: disable=W0223
+    """
+    Rate limit kept in Redis with GCRA, one key and one script call per
+    request, so every gunicorn worker of every service shares the same limit.
+    Without Redis (local development) or with THROTTLE_ENABLED off nothing is
+    throttled, and Redis errors let the request through.
+    """
+
+    def __init__(self):
+        # The rate is looked up again per request, see allow_request
+        super().__init__()
+        self.key = None
+        self.wait_ms = 0
+
+    def get_rate(self):
+        """Rate of the scope, read per request so settings overrides apply."""
+        return api_settings.DEFAULT_THROTTLE_RATES.get(self.scope)
+
+    def allow_request(self, request, view):
+        if not settings.THROTTLE_ENABLED:
+            return True
+
+        self.rate = self.get_rate()
+        if self.rate is None:
+            return True
+        self.num_requests, self.duration = self.parse_rate(self.rate)
+
+        self.key = self.get_cache_key(request, view)
+        if self.key is None:
+            return True
+
+        try:
+            redis = get_redis_connection(settings.THROTTLE_CACHE)
+        except NotImplementedError:
+            # A per process cache would multiply the rate by the worker count
+            return True
+
+        period_ms = self.duration * 1000
+        try:
+            self.wait_ms = GCRA(
+                keys=[caches[settings.THROTTLE_CACHE].make_key(self.key)],
+                args=[math.ceil(period_ms / self.num_requests), period_ms],
+                client=redis,
+            )
+        except Exception as e:  # pylint: disable=W0718
+            logger.warning("Throttle %s unavailable: %s", self.scope, e)
+            return True
+
+        return self.wait_ms == 0
+
+    def wait(self):
+        """Seconds until the next request is allowed, sent as Retry-After."""
+        return self.wait_ms / 1000
+
+
+class ScopedRateThrottle(RedisRateThrottle):  # pylint: disable=W0223
+    """
+    Rate of "<view.throttle_scope>_<scope_suffix>" in DEFAULT_THROTTLE_RATES,
+    so one view can be limited per user and per IP with separate rates.
+    """
+
+    scope_suffix = None
+
+    def allow_request(self, request, view):
+        scope = getattr(view, "throttle_scope", None)
+        if not scope:
+            return True
+
+        self.scope = f"{scope}_{self.scope_suffix}"
+        return super().allow_request(request, view)
+
+
+class UserRateThrottle(ScopedRateThrottle):
+    """Limits authenticated users, anonymous requests are left to the IP rate."""
+
+    scope_suffix = "user"
+
+    def get_cache_key(self, request, view):
+        if not request.user or not request.user.is_authenticated:
+            return None
+
+        return self.cache_format % {"scope": self.scope, "ident": request.user.pk}
+
+
+class IPRateThrottle(ScopedRateThrottle):
+    """Limits client IPs, X-Forwarded-For is trusted as far as NUM_PROXIES."""
+
+    scope_suffix = "ip"
+
+    def get_cache_key(self, request, view):
+        return self.cache_format % {
+            "scope": self.scope,
+            "ident": self.get_ident(request),
+        }
@@ -0,0 +1,17 @@
+from django.utils.functional import cached_property
+from rest_framework_simplejwt.models import TokenUser
+
+
+class ClaimsTokenUser(TokenUser):  # pylint: disable=W0223
+    """
+    TokenUser of JWTStatelessUserAuthentication, authorized from the role
+    claims the backend embeds in access tokens instead of a user lookup.
+    """
+
+    @cached_property
+    def is_agent(self):
+        return self.token.get("is_agent", False)
+
+    @cached_property
+    def role(self):
+        return self.token.get("role", "UnAuthorized")
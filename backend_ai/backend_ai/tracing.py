@@ -0,0 +1,137 @@
+import time
+from contextlib import contextmanager
+from datetime import timedelta
+import numpy as np
+from django.utils import timezone
+from celery.utils.log import get_task_logger
+from core_db_ai.models import PipelineSpan
+
+logger = get_task_logger(__name__)
+
+# Longest metrics window, spans are loaded into memory for the percentiles
+MAX_METRICS_DAYS = 90
+
+
+class Usage:
+    """Tokens and cache usage of the LLM calls of one span."""
+
+    def __init__(self):
+        self.prompt_tokens = None
+        self.completion_tokens = None
+        self.cache_hit = False
+
+    def record(self, usage):
+        """Token usage of an LLM call, None means it was served from the cache."""
+        if usage is None:
+            self.cache_hit = True
+            return
+        self.prompt_tokens = (self.prompt_tokens or 0) + usage.prompt_tokens
+        self.completion_tokens = (self.completion_tokens or 0) + usage.completion_tokens
+
+
+class Span:
+    """Timing, tokens and cache usage of one pipeline stage."""
+
+    def __init__(self, stage, report_id=None, message_id=None, retries=0):
+        self.stage = stage
+        self.report_id = report_id
+        self.message_id = message_id
+        self.retries = retries or 0
+        self.usage = Usage()
+        self.succeeded = True
+        self.duration_ms = 0.0
+
+    def record_usage(self, usage):
+        """Token usage of an LLM call, None means it was served from the cache."""
+        self.usage.record(usage)
+
+    def save(self):
+        """Persists the span. Metrics must never break the pipeline."""
+        try:
+            PipelineSpan.objects.create(
+                report_id=self.report_id,
+                message_id=self.message_id,
+                stage=self.stage,
+                duration_ms=self.duration_ms,
+                prompt_tokens=self.usage.prompt_tokens,
+                completion_tokens=self.usage.completion_tokens,
+                retries=self.retries,
+                cache_hit=self.usage.cache_hit,
+                succeeded=self.succeeded,
+            )
+        except Exception as e:  # pylint: disable=W0718
+            logger.warning("Span %s could not be saved: %s", self.stage, e)
+
+
+@contextmanager
+def span(stage, report_id=None, message_id=None, retries=0):
+    """
+    Times the wrapped block as one pipeline stage of a report or chat message.
+    Exceptions (including Celery retries) mark the span failed and propagate.
+    """
+    current = Span(stage, report_id, message_id, retries)
+    start = time.perf_counter()
+    try:
+        yield current
+    except BaseException:
+        current.succeeded = False
+        raise
+    finally:
+        current.duration_ms = (time.perf_counter() - start) * 1000
+        logger.info(
+            "Span %s: %.1f ms | Tokens: %s/%s | Retries: %s | Cache hit: %s",
+            stage,
+            current.duration_ms,
+            current.usage.prompt_tokens,
+            current.usage.completion_tokens,
+            current.retries,
+            current.usage.cache_hit,
+        )
+        current.save()
+
+
+def stage_metrics(days=7, report_ids=None):
+    """
+    Latency percentiles and token totals per stage over the last days,
+    optionally only for the given reports.
+    Percentiles are computed here so they work on every database backend.
+    """
+    spans = PipelineSpan.objects.filter(
+        created_at__gte=timezone.now() - timedelta(days=days)
+    )
+    if report_ids is not None:
+        spans = spans.filter(report_id__in=report_ids)
+
+    rows = spans.order_by("stage").values_list(
+        "stage",
+        "duration_ms",
+        "prompt_tokens",
+        "completion_tokens",
+        "retries",
+        "cache_hit",
+        "succeeded",
+    )
+
+    by_stage = {}
+    for stage, *values in rows:
+        by_stage.setdefault(stage, []).append(values)
+
+    metrics = []
+    for stage, values in by_stage.items():
+        durations, prompt, completion, retries, cache_hits, succeeded = zip(*values)
+        durations = np.array(durations)
+        metrics.append(
+            {
+                "stage": stage,
+                "count": len(durations),
+                "p50_ms": round(float(np.percentile(durations, 50)), 1),
+                "p95_ms": round(float(np.percentile(durations, 95)), 1),
+                "prompt_tokens": sum(tokens or 0 for tokens in prompt),
+                "completion_tokens": sum(tokens or 0 for tokens in completion),
+                "retries": sum(retries),
+                "cache_hit_rate": round(sum(cache_hits) / len(durations), 3),
+                "failure_rate": round(1 - sum(succeeded) / len(durations), 3),
+            }
+        )
+
+    return metrics
@@ -21,8 +21,10 @@ from drf_spectacular.views import (
     SpectacularSwaggerView,
     SpectacularRedocView,
 )
+from backend_ai.metrics import metrics_view
 
 urlpatterns = [
+    path("metrics", metrics_view, name="metrics"),
     path("server-api-ai/chat-api/", include("chat_api.urls")),
     path("server-api-ai/report-api/", include("report_api.urls")),
     path("swagger-api-ai/schema/", SpectacularAPIView.as_view(), name="schema"),
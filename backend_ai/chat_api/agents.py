@@ -2,9 +2,7 @@ import json
 from openai import OpenAI
 from django.conf import settings
 
-openai = OpenAI(
-    api_key=settings.GROQ_API_KEY2, base_url="https://api.groq.com/openai/v1"
-)
+openai = OpenAI(api_key=settings.GROQ_API_KEY2, base_url=settings.GROQ_BASE_URL)
 
 
 def chat_json_extractor_agent(property_details, user_query):
@@ -0,0 +1,275 @@
+import re
+
+# Feature keywords, "cheaper" / "expensive" also imply a price change
+FEATURE_PATTERNS = {
+    "beds": re.compile(r"\b(?:bed(?:room)?s?|brs?|bds?)\b"),
+    "baths": re.compile(r"\bbath(?:room)?s?\b"),
+    "area_sqft": re.compile(
+        r"\b(?:sq(?:uare)?\.?\s*(?:ft|feet|foot(?:age)?)\b|sqft\b|sf\b|area\b|size\b)"
+    ),
+    "price": re.compile(
+        r"(?:\$|\b(?:price[ds]?|cost(?:s|ed)?|asking|listing|listed|dollars?"
+        r"|cheaper|expensive)\b)"
+    ),
+}
+
+NUMBER = re.compile(
+    r"(?<![\w.])\$?\s*(?P<value>\d+(?:,\d{3})*(?:\.\d+)?)"
+    r"(?:\s*(?P<scale>k\b|m\b|thousand\b|mil(?:lion)?\b))?"
+    r"(?:\s*(?P<percent>%|percent\b))?"
+)
+NUMBER_WORDS = {
+    "one": 1,
+    "two": 2,
+    "three": 3,
+    "four": 4,
+    "five": 5,
+    "six": 6,
+    "seven": 7,
+    "eight": 8,
+    "nine": 9,
+    "ten": 10,
+}
+NUMBER_WORD = re.compile(rf"\b(?:{'|'.join(NUMBER_WORDS)})\b")
+# "a" / "an" only count as 1 next to a change word ("add a bath", "an extra bed")
+ARTICLE = re.compile(r"\b(?:an?|another|single)\b")
+
+INCREASE = re.compile(
+    r"\b(?:more|add(?:ed|ing)?|extra|additional|another|increase[ds]?|raise[ds]?"
+    r"|up|plus|bigger|larger|higher|expensive)\b"
+)
+DECREASE = re.compile(
+    r"\b(?:less|fewer|remove[ds]?|minus|decrease[ds]?|reduce[ds]?|drop(?:s|ped)?"
+    r"|down|lower(?:ed)?|smaller|cheaper|cut|discount(?:ed)?)\b"
+)
+# "increase the price to 500k" is an absolute value, "by 50k" a relative one
+ABSOLUTE = re.compile(r"\bto\b")
+# A signed value, "negative 10k" or "-10k", is left to the LLM instead of
+# being read as its magnitude
+NEGATIVE = re.compile(r"\bnegative\b|(?<![\w-])-\s*\$?\s*\d")
+# Other money, "hoa cost $300" or "taxes went up $5,000" is not the price
+OTHER_COSTS = re.compile(
+    r"\b(?:hoa|tax(?:es)?|fees?|rent(?:al)?|insurance|mortgage|utilit(?:y|ies)"
+    r"|payments?|down\s*payment|deposit|per\s+month|a\s+month|monthly|yearly)\b"
+)
+
+# A number belongs to a feature when its unit follows it ("5 beds", "one more
+# bedroom", "10% cheaper")...
+UNIT_AFTER = {
+    feature: re.compile(rf"\s*(?:(?:more|extra|additional|fewer|less|new)\s+)?{unit}")
+    for feature, unit in {
+        "beds": r"(?:bed(?:room)?s?|brs?|bds?)\b",
+        "baths": r"bath(?:room)?s?\b",
+        "area_sqft": r"(?:sq(?:uare)?\.?\s*(?:ft|feet|foot(?:age)?)|sqft|sf)\b",
+        "price": r"(?:dollars?|cheaper|expensive)\b",
+    }.items()
+}
+# ...or when it ends the clause right after the feature and linking words
+# ("price went up by 10%", "sqft to 2000"), "area was 5 miles" does not
+CONNECTOR = (
+    r"(?:is|was|were|be|been|went|go(?:es)?|up|down|by|to|of|at|for|now|just|only"
+    r"|increase[ds]?|decrease[ds]?|raise[ds]?|rose|drop(?:s|ped)?|fell|falls?"
+    r"|reduce[ds]?|lower(?:ed)?|cut|change[ds]?|set|=|:)"
+)
+FEATURE_KEYWORDS = {
+    "beds": r"bed(?:room)?s?|brs?|bds?",
+    "baths": r"bath(?:room)?s?",
+    "area_sqft": r"sq(?:uare)?\.?\s*(?:ft|feet|foot(?:age)?)|sqft|sf|area|size",
+    "price": r"price[ds]?|cost(?:s|ed)?|asking|listing|listed",
+}
+KEYWORD_BEFORE = {
+    feature: re.compile(rf"\b(?:{keyword})(?:\s+{CONNECTOR})*\s*$")
+    for feature, keyword in FEATURE_KEYWORDS.items()
+}
+
+# Values outside these are misreads ("$300 a month") and go to the LLM
+MIN_VALUES = {"price": 10_000, "area_sqft": 100, "beds": 1, "baths": 1}
+MAX_ROOMS = 20
+
+# Clause boundaries, commas inside numbers (500,000) are kept
+CLAUSE_SPLIT = re.compile(r"\band\b|;|&|,(?!\d{3})|\?|!")
+# "5 beds 3 baths" written as a single clause
+NUMBER_FEATURE_PAIR = re.compile(
+    r"(?P<number>\d+(?:\.\d+)?)\s*(?P<feature>bed(?:room)?s?|brs?|bds?|bath(?:room)?s?"
+    r"|sq(?:uare)?\.?\s*(?:ft|feet|foot)|sqft|sf)\b"
+)
+
+
+def parse_number(match):
+    """Numeric value of a NUMBER match, with k / m scales applied."""
+    value = float(match.group("value").replace(",", ""))
+    scale = match.group("scale")
+    if scale:
+        value *= 1_000_000 if scale.startswith("m") else 1_000
+    return value, bool(match.group("percent"))
+
+
+def clause_features(clause):
+    """Feature names mentioned in a clause."""
+    return [
+        name for name, pattern in FEATURE_PATTERNS.items() if pattern.search(clause)
+    ]
+
+
+def is_attached(clause, match, feature):
+    """Whether the number (or "a" / "one") matched in the clause is the feature's."""
+    if UNIT_AFTER[feature].match(clause, match.end()):
+        return True
+
+    if clause[match.end() :].strip(" ."):
+        return False
+
+    # The number ends the clause, "$" or a k / m scale make it a price
+    groups = match.groupdict()
+    if feature == "price" and ("$" in match.group() or groups.get("scale")):
+        return True
+    return bool(KEYWORD_BEFORE[feature].search(clause, 0, match.start()))
+
+
+def clause_quantity(clause, feature, change):
+    """
+    (value, is_percent) of the one number attached to the feature, None when
+    the clause has none, several, or one that is not next to the feature.
+    """
+    numbers = list(NUMBER.finditer(clause)) + list(NUMBER_WORD.finditer(clause))
+    if len(numbers) > 1:
+        return None
+
+    if numbers and "value" in numbers[0].groupdict():
+        match = numbers[0]
+        value, percent = parse_number(match)
+    elif numbers:
+        match = numbers[0]
+        value, percent = NUMBER_WORDS[match.group()], False
+    else:
+        # "add a bath", "an extra bed"
+        match = ARTICLE.search(clause) if change else None
+        value, percent = 1, False
+
+    if match is None or not is_attached(clause, match, feature):
+        return None
+    return value, percent
+
+
+def parse_pairs(clause):
+    """Absolute updates of a clause like "5 beds 3 baths 2000 sqft"."""
+    if INCREASE.search(clause) or DECREASE.search(clause):
+        return None
+
+    updates = {}
+    for match in NUMBER_FEATURE_PAIR.finditer(clause):
+        feature = clause_features(match.group("feature"))[0]
+        if feature in updates:
+            return None
+        updates[feature] = ("set", float(match.group("number")))
+
+    # Every number of the clause has to belong to a pair
+    if not updates or len(NUMBER.findall(clause)) != len(updates):
+        return None
+
+    return updates
+
+
+def parse_clause(clause):
+    """
+    Update of a single clause as {feature: (operation, value)}.
+    Returns {} for clauses without any property feature and None when the
+    clause mentions a feature but cannot be parsed with confidence.
+    """
+    features = clause_features(clause)
+    numbers = list(NUMBER.finditer(clause))
+    words = NUMBER_WORD.findall(clause)
+
+    if not features:
+        # Numbers without a feature are too ambiguous to guess
+        return {} if not numbers and not words else None
+
+    if OTHER_COSTS.search(clause) or NEGATIVE.search(clause):
+        return None
+
+    if len(features) > 1:
+        # A price next to another feature, e.g. "5 beds for $500k", goes to the LLM
+        return None if "price" in features else parse_pairs(clause)
+
+    feature = features[0]
+    increase = bool(INCREASE.search(clause))
+    decrease = bool(DECREASE.search(clause))
+    quantity = clause_quantity(clause, feature, increase or decrease)
+
+    if quantity is None or (increase and decrease):
+        return None
+    value, percent = quantity
+
+    if not (increase or decrease) or ABSOLUTE.search(clause):
+        # Percentages only make sense as a change
+        return None if percent else {feature: ("set", value)}
+
+    sign = 1 if increase else -1
+    return {feature: ("percent" if percent else "add", sign * value)}
+
+
+def apply_update(current, operation, value):
+    """New value of a feature after an update."""
+    if operation == "set":
+        return value
+    if operation == "add":
+        return current + value
+    return current * (1 + value / 100)
+
+
+def is_plausible(property_json):
+    """
+    Whether the updated property is within the ranges a parsed query can
+    produce; anything else is more likely a misread number.
+    """
+    # Fractional rooms like 2.5 baths are left to the LLM
+    if any(property_json[f] != int(property_json[f]) for f in ("beds", "baths")):
+        return False
+    if any(property_json[feature] < low for feature, low in MIN_VALUES.items()):
+        return False
+    return max(property_json["beds"], property_json["baths"]) <= MAX_ROOMS
+
+
+def parse_what_if_query(property_details, user_query):
+    """
+    Rule-based extractor for common what-if chat queries.
+    Handles absolute and relative changes (including percentages) to beds,
+    baths, area_sqft and price. Returns the same JSON the LLM extractor
+    produces, or None when the query should go to the LLM instead.
+    """
+    query = user_query.lower().replace("square feet", "sqft")
+    updates = {}
+
+    for clause in CLAUSE_SPLIT.split(query):
+        clause_updates = parse_clause(clause)
+        if clause_updates is None:
+            return None
+        for feature, update in clause_updates.items():
+            if feature in updates:
+                # The same feature changed twice, let the LLM resolve it
+                return None
+            updates[feature] = update
+
+    if not updates:
+        return None
+
+    property_json = {
+        "area_sqft": float(property_details["area_sqft"]),
+        "beds": int(property_details["beds"]),
+        "baths": int(property_details["baths"]),
+        "price": float(property_details["price"]),
+    }
+
+    for feature, (operation, value) in updates.items():
+        property_json[feature] = apply_update(property_json[feature], operation, value)
+
+    if not is_plausible(property_json):
+        return None
+
+    for feature in ("area_sqft", "price"):
+        property_json[feature] = round(property_json[feature], 2)
+    for feature in ("beds", "baths"):
+        property_json[feature] = int(property_json[feature])
+
+    property_json["title"] = property_details["title"]
+    return property_json
@@ -0,0 +1,78 @@
+import re
+import time
+from django.conf import settings
+from django.core.cache import cache
+from report_api.agents import THINK_BLOCK
+
+THINK_OPEN = "<think>"
+# A reasoning block that is still being streamed
+OPEN_THINK_BLOCK = re.compile(r"<think>.*", flags=re.DOTALL)
+
+
+def chat_stream_key(message_id):
+    """Redis key holding the partial AI answer of a chat message."""
+    return f"chat_stream_{message_id}"
+
+
+def read_chat_stream(message_id):
+    """Returns {"content": str, "done": bool} or None if nothing streamed yet."""
+    return cache.get(chat_stream_key(message_id))
+
+
+async def aread_chat_stream(message_id):
+    """read_chat_stream for the async SSE endpoint."""
+    return await cache.aget(chat_stream_key(message_id))
+
+
+def visible_content(content):
+    """
+    The part of a streamed answer users may see. Qwen reasons in a <think>
+    block first, finished or still open, and a tag can be split over chunks.
+    """
+    content = OPEN_THINK_BLOCK.sub("", THINK_BLOCK.sub("", content))
+    for length in range(len(THINK_OPEN) - 1, 0, -1):
+        if content.endswith(THINK_OPEN[:length]):
+            content = content[:-length]
+            break
+    return content.lstrip()
+
+
+def close_chat_stream(message_id):
+    """Marks the stream as finished so readers can stop polling."""
+    stream = read_chat_stream(message_id) or {"content": ""}
+    stream["done"] = True
+    cache.set(chat_stream_key(message_id), stream, timeout=settings.CHAT_STREAM_TTL)
+
+
+class ChatStreamWriter:
+    """
+    Pushes the accumulated AI answer into Redis while it is generated.
+    Writes are throttled so a fast token stream does not hammer Redis.
+    """
+
+    def __init__(self, message_id):
+        self.key = chat_stream_key(message_id)
+        self.interval = settings.CHAT_STREAM_PUSH_INTERVAL
+        self.last_push = 0.0
+        self.content = ""
+
+        # Reset any content left over from a failed attempt
+        self.push("")
+
+    def push(self, content):
+        self.content = content
+        self.last_push = time.monotonic()
+        cache.set(
+            self.key,
+            {"content": visible_content(content), "done": False},
+            timeout=settings.CHAT_STREAM_TTL,
+        )
+
+    def __call__(self, content):
+        self.content = content
+        if time.monotonic() - self.last_push >= self.interval:
+            self.push(content)
+
+    def flush(self):
+        """Pushes whatever arrived since the last throttled write."""
+        self.push(self.content)
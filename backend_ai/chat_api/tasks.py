@@ -1,12 +1,17 @@
+from django.conf import settings
 from django.utils import timezone
 from celery import shared_task, chain
 from celery.utils.log import get_task_logger
 from celery.exceptions import MaxRetriesExceededError
 from report_api.regression_model import InvestmentRegressor
 from report_api.agents import groq_ai_insight_prompt
-from core_db_ai.models import ChatSession, ChatMessage, AIReport
+from core_db_ai.models import ChatSession, ChatMessage, AIReport, PipelineSpan
+from backend_ai.claim_check import store_payload, load_payload
+from backend_ai.tracing import span
+from .parsers import parse_what_if_query
+from .streams import ChatStreamWriter, close_chat_stream
 
-# from .agents import chat_json_extractor_agent
+from .agents import chat_json_extractor_agent
 
 logger = get_task_logger(__name__)
 
@@ -30,68 +35,121 @@ def ai_message_extractor(
     return "Stopped"
 
 
-# @shared_task(
-#     bind=True,
-#     max_retries=3,
-#     default_retry_delay=61,
-#     rate_limit="8/m",
-#     retry_jitter=False,
-# )
-# def ai_message_extractor(self, session_id, message_id, property_details, user_query):
-#     """
-#     Worker Task: Calls Groq GPT for extraction.
-#     """
-#     try:
-#         property_json, usage = chat_json_extractor_agent(property_details, user_query)
-
-#         # pylint: disable=R0801
-#         logger.info(
-#             "[Groq GPT] Prompt Tokens: %s | Completion Tokens: %s | Total: %s",
-#             usage.prompt_tokens,
-#             usage.completion_tokens,
-#             usage.total_tokens,
-#         )
-#         logger.info("Groq Json extraction complete.")
-#         # pylint: enable=R0801
-
-#         error = property_json.get("error")
-#         if error:
-#             self.request.chain = None
-#             message = ChatMessage.objects.get(id=message_id)
-#             message.status = ChatMessage.Status.FAILED
-#             message.content = error
-#             message.timestamp = timezone.now()
-#             message.save(update_fields=["status", "content", "timestamp"])
-
-#             if error == "Invalid request. Please try again.":
-#                 session = ChatSession.objects.get(id=session_id)
-#                 session.user_message_count += 1
-#                 session.save()
-
-#             return "Stopped"
-
-#         property_json["title"] = property_details["title"]
-#         return property_json
-#     except Exception as e:  # pylint: disable=W0718
-#         # pylint: disable=R0801
-#         logger.warning(
-#             "Attempt %s/%s failed Groq Rate Limit/Error: %s. Retrying again",
-#             self.request.retries,
-#             self.max_retries,
-#             e,
-#         )
-#         # pylint: enable=R0801
-#         try:
-#             return self.retry(exc=e)
-#         except MaxRetriesExceededError as err:
-#             logger.error("Groq GPT Summary Error: %s", err)
-#             self.request.chain = None
-#             message = ChatMessage.objects.get(id=message_id)
-#             message.status = ChatMessage.Status.FAILED
-#             message.content = "Agent failed to respond. Please try again."
-#             message.timestamp = timezone.now()
-#             message.save(update_fields=["status", "content", "timestamp"])
-#             return "Stopped"
+@shared_task(
+    bind=True,
+    max_retries=3,
+    default_retry_delay=61,
+    rate_limit="8/m",
+    retry_jitter=False,
+)
+def ai_message_extractor_live(
+    self, session_id, message_id, property_details, user_query
+):
+    """
+    Worker Task: Calls Groq GPT for extraction.
+    """
+    try:
+        with span(
+            PipelineSpan.Stage.CHAT_EXTRACTION,
+            message_id=message_id,
+            retries=self.request.retries,
+        ) as extraction:
+            property_json, usage = chat_json_extractor_agent(
+                property_details, user_query
+            )
+            extraction.record_usage(usage)
+
+        # pylint: disable=R0801
+        logger.info(
+            "[Groq GPT] Prompt Tokens: %s | Completion Tokens: %s | Total: %s",
+            usage.prompt_tokens,
+            usage.completion_tokens,
+            usage.total_tokens,
+        )
+        logger.info("Groq Json extraction complete.")
+        # pylint: enable=R0801
+
+        error = property_json.get("error")
+        if error:
+            self.request.chain = None
+            message = ChatMessage.objects.get(id=message_id)
+            message.status = ChatMessage.Status.FAILED
+            message.content = error
+            message.timestamp = timezone.now()
+            message.save(update_fields=["status", "content", "timestamp"])
+
+            if error == "Invalid request. Please try again.":
+                session = ChatSession.objects.get(id=session_id)
+                session.user_message_count += 1
+                session.save()
+
+            return "Stopped"
+
+        property_json["title"] = property_details["title"]
+        return property_json
+    except Exception as e:  # pylint: disable=W0718
+        # pylint: disable=R0801
+        logger.warning(
+            "Attempt %s/%s failed Groq Rate Limit/Error: %s. Retrying again",
+            self.request.retries,
+            self.max_retries,
+            e,
+        )
+        # pylint: enable=R0801
+        try:
+            return self.retry(exc=e)
+        except MaxRetriesExceededError as err:
+            logger.error("Groq GPT Summary Error: %s", err)
+            self.request.chain = None
+            message = ChatMessage.objects.get(id=message_id)
+            message.status = ChatMessage.Status.FAILED
+            message.content = "Agent failed to respond. Please try again."
+            message.timestamp = timezone.now()
+            message.save(update_fields=["status", "content", "timestamp"])
+            return "Stopped"
+
+
+def rate_what_if(report_details, compiled_data, property_json):
+    """
+    Rating and breakdown of the what-if property, scored against the report's
+    stored market model or, for older reports, refitted from the comps.
+    """
+    regressor = InvestmentRegressor(
+        avg_price=float(report_details["avg_market_price"]),
+        avg_pps=float(report_details["avg_price_per_sqft"]),
+        avg_beds=float(report_details["avg_beds"]),
+        avg_baths=float(report_details["avg_baths"]),
+    )
+
+    market_model = report_details.get("market_model")
+    if market_model:
+        return regressor.score(market_model, property_json)
+    return regressor.calculate_rating(compiled_data, property_json)
+
+
+def chat_insight(message_id, compiled_data, property_json, rating, breakdown):
+    """
+    Groq Qwen insight of a what-if answer, the prompt packs the comps nearest
+    to the what-if property. Streamed into Redis while it is generated when
+    CHAT_STREAMING_ENABLED is on.
+    """
+    stream_writer = None
+    if settings.CHAT_STREAMING_ENABLED:
+        stream_writer = ChatStreamWriter(message_id)
+
+    final_insight, usage = groq_ai_insight_prompt(
+        compiled_data,
+        property_json,
+        rating,
+        breakdown,
+        "Qwen",
+        on_delta=stream_writer,
+    )
+
+    if stream_writer:
+        stream_writer.flush()
+
+    return final_insight, usage
 
 
 @shared_task(
@@ -115,23 +173,18 @@ def ai_message_analysis(
     Passes the json to Investment Regressor for rating.
     Then Calls Groq Qwen for AI Insight Summary.
     """
-    compiled_data = report_details.get("comparable_data", [])
+    compiled_data = load_payload(report_details.get("comparable_data", []))
 
     if rating and len(breakdown) > 0:
         logger.info(
             "Retrying Groq Qwen only. Skipping Investment Regressor for rating and breakdown."
         )
     else:
-        regressor = InvestmentRegressor(
-            avg_price=float(report_details["avg_market_price"]),
-            avg_pps=float(report_details["avg_price_per_sqft"]),
-            avg_beds=float(report_details["avg_beds"]),
-            avg_baths=float(report_details["avg_baths"]),
-        )
-
-        compiled_data = report_details.get("comparable_data", [])
         try:
-            rating, breakdown = regressor.calculate_rating(compiled_data, property_json)
+            with span(PipelineSpan.Stage.CHAT_REGRESSION, message_id=message_id):
+                rating, breakdown = rate_what_if(
+                    report_details, compiled_data, property_json
+                )
             if not rating or not breakdown or len(breakdown) == 0:
                 raise ValueError("Empty rating or breakdown generated")
         except Exception as e:  # pylint: disable=W0718
@@ -147,26 +200,30 @@ def ai_message_analysis(
     # pylint: disable=R0801
     logger.info("Investment Rating: %s", rating)
     logger.info("Investment Breakdown: %s", str(breakdown))
-
-    if len(compiled_data) > 50:
-        comps_sample = compiled_data[:50]
-    else:
-        comps_sample = compiled_data
     # pylint: enable=R0801
 
     try:
-        final_insight, usage = groq_ai_insight_prompt(
-            comps_sample, property_json, rating, breakdown, "Qwen"
-        )
+        with span(
+            PipelineSpan.Stage.CHAT_INSIGHT,
+            message_id=message_id,
+            retries=self.request.retries,
+        ) as insight:
+            final_insight, usage = chat_insight(
+                message_id, compiled_data, property_json, rating, breakdown
+            )
+            insight.record_usage(usage)
 
         # pylint: disable=R0801
-        logger.info(
-            "[Groq Qwen] Prompt Tokens: %s | Completion Tokens: %s | Total: %s",
-            usage.prompt_tokens,
-            usage.completion_tokens,
-            usage.total_tokens,
-        )
-        logger.info("Groq Qwen chat answer generated successfully")
+        if usage is None:
+            logger.info("Groq Qwen chat answer served from the insight cache")
+        else:
+            logger.info(
+                "[Groq Qwen] Prompt Tokens: %s | Completion Tokens: %s | Total: %s",
+                usage.prompt_tokens,
+                usage.completion_tokens,
+                usage.total_tokens,
+            )
+            logger.info("Groq Qwen chat answer generated successfully")
         # pylint: enable=R0801
 
         return {
@@ -216,39 +273,44 @@ def finalizer_task(analysis_result, session_id, message_id):  # pylint: disable=
     if analysis_result == "Stopped":
         return "Aborted"
 
-    try:
-        message = ChatMessage.objects.get(id=message_id)
-        session = ChatSession.objects.get(id=session_id)
-        insight = analysis_result.get("text", {})
-        rating = analysis_result.get("rating", 0)
-        intro = "Based on your criteria, here is my analysis of this property:"
-
-        summary_text = (
-            f"{intro}\n\n"
-            f"**New Projected Rating: {rating} / 5**\n\n"
-            f"{insight.get('investment_summary', '')}\n\n"
-            f"**Analysis of Adjustments:**\n{insight.get('weighted_analysis', '')}\n\n"
-            "**Key Strengths:**\n- " + "\n- ".join(insight.get("pros", [])) + "\n\n"
-            "**Potential Risks:**\n- " + "\n- ".join(insight.get("cons", []))
-        )
+    with span(PipelineSpan.Stage.CHAT_FINALIZE, message_id=message_id) as finalize:
+        try:
+            message = ChatMessage.objects.get(id=message_id)
+            session = ChatSession.objects.get(id=session_id)
+            insight = analysis_result.get("text", {})
+            rating = analysis_result.get("rating", 0)
+            intro = "Based on your criteria, here is my analysis of this property:"
+
+            summary_text = (
+                f"{intro}\n\n"
+                f"**New Projected Rating: {rating} / 5**\n\n"
+                f"{insight.get('investment_summary', '')}\n\n"
+                f"**Analysis of Adjustments:**\n{insight.get('weighted_analysis', '')}\n\n"
+                "**Key Strengths:**\n- " + "\n- ".join(insight.get("pros", [])) + "\n\n"
+                "**Potential Risks:**\n- " + "\n- ".join(insight.get("cons", []))
+            )
 
-        message.content = summary_text
-        message.status = ChatMessage.Status.COMPLETED
-        message.timestamp = timezone.now()
-        message.save()
+            message.content = summary_text
+            message.status = ChatMessage.Status.COMPLETED
+            message.timestamp = timezone.now()
+            message.save()
 
-        session.user_message_count += 1
-        session.save()
+            session.user_message_count += 1
+            session.save()
 
-        return f"Message {message_id} Success"
-    except Exception as e:  # pylint: disable=W0718
-        logger.error("Finalizer failed: %s", str(e))
-        ChatMessage.objects.filter(id=message_id).update(
-            status=ChatMessage.Status.FAILED,
-            content="Error finalizing the AI response.",
-            timestamp=timezone.now(),
-        )
-        return f"Message {message_id} Failed"
+            if settings.CHAT_STREAMING_ENABLED:
+                close_chat_stream(message_id)
+
+            return f"Message {message_id} Success"
+        except Exception as e:  # pylint: disable=W0718
+            logger.error("Finalizer failed: %s", str(e))
+            finalize.succeeded = False
+            ChatMessage.objects.filter(id=message_id).update(
+                status=ChatMessage.Status.FAILED,
+                content="Error finalizing the AI response.",
+                timestamp=timezone.now(),
+            )
+            return f"Message {message_id} Failed"
 
 
 @shared_task
@@ -269,7 +331,9 @@ def generate_ai_chat_response(session_id, message_id, report_id, user_query):
         }
 
         report_details = {
-            "comparable_data": report.comparable_data,
+            # Passed by reference, Qwen's prompt picks the nearest comps from it
+            "comparable_data": store_payload(report.comparable_data or []),
+            "market_model": report.market_model,
             "avg_beds": report.avg_beds,
             "avg_baths": report.avg_baths,
             "avg_market_price": str(report.avg_market_price),
@@ -277,10 +341,29 @@ def generate_ai_chat_response(session_id, message_id, report_id, user_query):
             "investment_rating": str(report.investment_rating),
         }
 
+        # In the live pipeline common what-if queries are parsed locally,
+        # skipping the rate-limited LLM extractor
+        property_json = (
+            parse_what_if_query(property_details, user_query)
+            if settings.AI_AGENTS_LIVE
+            else None
+        )
+        if property_json:
+            logger.info("What-if query parsed without the LLM extractor.")
+            return chain(
+                ai_message_analysis.s(
+                    property_json, message_id, report_details, user_query
+                ),
+                finalizer_task.s(session_id, message_id),
+            ).apply_async()
+
+        extractor = (
+            ai_message_extractor_live
+            if settings.AI_AGENTS_LIVE
+            else ai_message_extractor
+        )
         return chain(
-            ai_message_extractor.s(
-                session_id, message_id, property_details, user_query
-            ),
+            extractor.s(session_id, message_id, property_details, user_query),
             ai_message_analysis.s(message_id, report_details, user_query),
             finalizer_task.s(session_id, message_id),
         ).apply_async()
@@ -0,0 +1,141 @@
+from asgiref.sync import async_to_sync
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+from core_db_ai.models import User, Agent, Property, AIReport, ChatSession, ChatMessage
+from report_api.agents import parse_json_content
+from chat_api.streams import (
+    ChatStreamWriter,
+    close_chat_stream,
+    read_chat_stream,
+    visible_content,
+)
+
+LOCMEM_CACHE = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+STREAM_URL = lambda pk: reverse("chat-message-stream", kwargs={"id": pk})
+
+
+@override_settings(CACHES=LOCMEM_CACHE, CHAT_STREAM_POLL_INTERVAL=0)
+class ChatMessageStreamTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email="test@example.com",
+            username="testuser",
+            password="password123",
+            first_name="John",
+            last_name="Doe",
+            slug="john-doe",
+        )
+        self.other_user = User.objects.create_user(
+            email="other@example.com",
+            username="otheruser",
+            password="password123",
+            first_name="Jane",
+            last_name="Doe",
+            slug="jane-doe",
+        )
+        agent = Agent.objects.create(
+            user=self.user, company_name="Dream Realty", bio="Expert in urban lofts"
+        )
+        property_obj = Property.objects.create(
+            agent=agent,
+            title="Modern Condo",
+            description="A beautiful condo in the city center",
+            beds=2,
+            baths=2,
+            price=500000.00,
+            area_sqft=1200,
+            address="123 Main St",
+            slug="modern-condo",
+        )
+        report = AIReport.objects.create(property=property_obj, user=self.user)
+        session = ChatSession.objects.create(user=self.user, report=report)
+        self.message = ChatMessage.objects.create(
+            session=session,
+            role=ChatMessage.Role.AI,
+            status=ChatMessage.Status.PROCESSING,
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+
+    def read_events(self, response):
+        # Async streams are sent as they come under ASGI
+        self.assertTrue(response.is_async)
+
+        async def collect():
+            return [chunk async for chunk in response.streaming_content]
+
+        return b"".join(async_to_sync(collect)()).decode()
+
+    def test_stream_relays_partial_content_and_done(self):
+        """Test that streamed content is relayed as delta events."""
+        writer = ChatStreamWriter(self.message.id)
+        writer.push('{"investment_summary": "Strong')
+        close_chat_stream(self.message.id)
+
+        response = self.client.get(STREAM_URL(self.message.id))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response["Content-Type"], "text/event-stream")
+        events = self.read_events(response)
+        self.assertIn("event: delta", events)
+        self.assertIn("Strong", events)
+        self.assertIn('"status": "COMPLETED"', events)
+
+    def test_stream_stops_when_message_failed(self):
+        """Test that a failed message ends the stream without any content."""
+        self.message.status = ChatMessage.Status.FAILED
+        self.message.save()
+
+        response = self.client.get(STREAM_URL(self.message.id))
+
+        events = self.read_events(response)
+        self.assertNotIn("event: delta", events)
+        self.assertIn('"status": "FAILED"', events)
+
+    def test_stream_denied_for_other_user(self):
+        """Test that a user cannot stream another user's message."""
+        self.client.force_authenticate(user=self.other_user)
+        response = self.client.get(STREAM_URL(self.message.id))
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_reasoning_is_never_published(self):
+        """Test that Qwen's <think> block does not reach the stream."""
+        writer = ChatStreamWriter(self.message.id)
+
+        writer.push("<think>price per sqft looks")
+        self.assertEqual(read_chat_stream(self.message.id)["content"], "")
+
+        writer.push('<think>done</think>\n{"pros": ["a"]}')
+        self.assertEqual(
+            read_chat_stream(self.message.id)["content"], '{"pros": ["a"]}'
+        )
+
+    def test_split_think_tag_is_held_back(self):
+        """Test that a partly streamed <think> tag is not published."""
+        self.assertEqual(visible_content("<thi"), "")
+        self.assertEqual(visible_content('{"a": 1}<'), '{"a": 1}')
+        self.assertEqual(visible_content('{"a": "<b>"}'), '{"a": "<b>"}')
+
+    def test_writer_throttles_and_flushes(self):
+        """Test that throttled writes are flushed at the end."""
+        writer = ChatStreamWriter(self.message.id)
+        writer("partial")
+        writer("partial answer")
+        writer.flush()
+        self.assertEqual(
+            read_chat_stream(self.message.id),
+            {"content": "partial answer", "done": False},
+        )
+
+
+class ParseJsonContentTest(TestCase):
+    def test_parse_strips_reasoning_and_extra_text(self):
+        """Test JSON extraction from raw streamed model output."""
+        content = '<think>math first</think>\nHere you go: {"pros": ["a"]} done'
+        self.assertEqual(parse_json_content(content), {"pros": ["a"]})
+
+    def test_parse_without_json_raises(self):
+        with self.assertRaises(ValueError):
+            parse_json_content("no json here")
@@ -0,0 +1,102 @@
+from django.test import SimpleTestCase
+from chat_api.parsers import parse_what_if_query
+
+PROPERTY_DETAILS = {
+    "title": "Modern Condo",
+    "area_sqft": 1500,
+    "beds": 3,
+    "baths": 2,
+    "price": 450000.0,
+}
+
+
+class ParseWhatIfQueryTest(SimpleTestCase):
+    def assert_parsed(self, user_query, **changes):
+        expected = {
+            "area_sqft": 1500.0,
+            "beds": 3,
+            "baths": 2,
+            "price": 450000.0,
+            "title": "Modern Condo",
+            **changes,
+        }
+        self.assertEqual(parse_what_if_query(PROPERTY_DETAILS, user_query), expected)
+
+    def test_absolute_changes(self):
+        """Test that new values replace the original ones."""
+        self.assert_parsed("What if it had 5 beds?", beds=5)
+        self.assert_parsed("What if it had 2,500 square feet?", area_sqft=2500.0)
+        self.assert_parsed("What if the price was $500,000?", price=500000.0)
+        self.assert_parsed("What if it was listed at 1.2 million?", price=1200000.0)
+        self.assert_parsed("What if the price dropped to 400k?", price=400000.0)
+        self.assert_parsed(
+            "4 beds, 3 baths and 2000 sqft", beds=4, baths=3, area_sqft=2000.0
+        )
+        self.assert_parsed("5 bed 3 bath", beds=5, baths=3)
+        self.assert_parsed("What if the size was 2,000?", area_sqft=2000.0)
+
+    def test_relative_changes(self):
+        """Test that additions and subtractions apply to the original values."""
+        self.assert_parsed("What if it had one more bedroom?", beds=4)
+        self.assert_parsed("Add a bathroom", baths=3)
+        self.assert_parsed("What if I remove a bedroom?", beds=2)
+        self.assert_parsed("Add 500 sqft", area_sqft=2000.0)
+        self.assert_parsed("What if the price went up by $50k?", price=500000.0)
+
+    def test_percentage_changes(self):
+        """Test that percentages change the original value proportionally."""
+        self.assert_parsed("What if it was 10% cheaper?", price=405000.0)
+        self.assert_parsed("What if price went up by 10%?", price=495000.0)
+        self.assert_parsed("What if the sqft increased by 5 percent", area_sqft=1575.0)
+
+    def test_ambiguous_queries_fall_back(self):
+        """Test that queries without a confident parse are left to the LLM."""
+        for user_query in [
+            "Is this a good deal?",
+            "What if it had a pool?",
+            "What if it had 4 bedrooms instead of 3?",
+            "What if it had 2.5 baths?",
+            "What if the house was 20% larger?",
+            "What if the price were lower?",
+            "What if the price was 10%?",
+            "5 beds for $500k",
+            "Remove 3 bedrooms",
+            "Add a bed and add another bed",
+        ]:
+            with self.subTest(user_query=user_query):
+                self.assertIsNone(parse_what_if_query(PROPERTY_DETAILS, user_query))
+
+    def test_numbers_not_next_to_a_feature_fall_back(self):
+        """Test that numbers of other things are not read as a feature."""
+        for user_query in [
+            "What if the hoa cost $300 a month?",
+            "What if taxes went up $5,000?",
+            "What if the area was 5 miles from downtown?",
+            "What if the area was 500 miles from downtown?",
+            "What if the listing was 2 years old?",
+            "What if the house size was 2 stories?",
+        ]:
+            with self.subTest(user_query=user_query):
+                self.assertIsNone(parse_what_if_query(PROPERTY_DETAILS, user_query))
+
+    def test_negative_values_fall_back(self):
+        """Test that a minus sign or "negative" is not dropped from the value."""
+        for user_query in [
+            "What if the price was negative 10k?",
+            "What if price were -10k?",
+            "What if the price was -$200,000?",
+            "What if the area dropped by -100 sqft?",
+        ]:
+            with self.subTest(user_query=user_query):
+                self.assertIsNone(parse_what_if_query(PROPERTY_DETAILS, user_query))
+
+    def test_implausible_values_fall_back(self):
+        """Test that values outside plausible ranges are left to the LLM."""
+        for user_query in [
+            "What if the price was $5,000?",
+            "What if it had 50 sqft?",
+            "What if it had 25 bedrooms?",
+            "What if it had 21 baths?",
+        ]:
+            with self.subTest(user_query=user_query):
+                self.assertIsNone(parse_what_if_query(PROPERTY_DETAILS, user_query))
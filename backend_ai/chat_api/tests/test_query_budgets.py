@@ -0,0 +1,114 @@
+from unittest.mock import patch
+from asgiref.sync import async_to_sync
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from rest_framework.test import APIClient
+from backend_ai.query_inspection import QueryBudgetMixin
+from core_db_ai.models import User, Agent, Property, AIReport, ChatSession, ChatMessage
+from chat_api.streams import ChatStreamWriter, close_chat_stream
+
+LOCMEM_CACHE = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+SESSION_URL = lambda pk: reverse("chat-session", kwargs={"id": pk})
+MESSAGE_URL = lambda pk: reverse("chat-message-detail", kwargs={"id": pk})
+STREAM_URL = lambda pk: reverse("chat-message-stream", kwargs={"id": pk})
+MESSAGE_CREATE_URL = reverse("chat-message-create")
+
+
+# Budgets are the queries of each endpoint today. Requests use
+# force_authenticate, so the JWT user lookup is not part of them.
+@override_settings(CACHES=LOCMEM_CACHE, CHAT_STREAM_POLL_INTERVAL=0)
+class ChatQueryBudgetTest(QueryBudgetMixin, TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email="test@example.com",
+            username="testuser",
+            password="password123",
+            first_name="John",
+            last_name="Doe",
+            slug="john-doe",
+        )
+        agent = Agent.objects.create(
+            user=self.user, company_name="Dream Realty", bio="Expert in urban lofts"
+        )
+        properties = Property.objects.bulk_create(
+            Property(
+                agent=agent,
+                title=f"Modern Condo {i}",
+                description="A beautiful condo in the city center",
+                beds=2,
+                baths=2,
+                price=500000.00,
+                area_sqft=1200,
+                address="123 Main St",
+                slug=f"modern-condo-{i}",
+            )
+            for i in range(2)
+        )
+        self.report, self.new_report = AIReport.objects.bulk_create(
+            AIReport(property=prop, user=self.user, status=AIReport.Status.COMPLETED)
+            for prop in properties
+        )
+        self.session = ChatSession.objects.create(user=self.user, report=self.report)
+        # Several messages, so per-message queries would show up as repeats
+        self.messages = ChatMessage.objects.bulk_create(
+            ChatMessage(
+                session=self.session,
+                role=ChatMessage.Role.USER if i % 2 == 0 else ChatMessage.Role.AI,
+                status=ChatMessage.Status.COMPLETED,
+                content=f"Message {i}",
+            )
+            for i in range(6)
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+
+    def test_existing_session_budget(self):
+        """Test that an existing chat session loads within its query budget."""
+        with self.assertQueryBudget(3, max_repeats=1):
+            response = self.client.get(SESSION_URL(self.report.id))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data["messages"]), 6)
+
+    def test_new_session_budget(self):
+        """Test that a new chat session is created within its query budget."""
+        with self.assertQueryBudget(6):
+            response = self.client.get(SESSION_URL(self.new_report.id))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["messages"], [])
+
+    def test_delete_session_budget(self):
+        """Test that deleting a chat session stays within its query budget."""
+        with self.assertQueryBudget(5):
+            response = self.client.delete(SESSION_URL(self.session.id))
+        self.assertEqual(response.status_code, 200)
+
+    def test_message_detail_budget(self):
+        """Test that a chat message loads within its query budget."""
+        with self.assertQueryBudget(1):
+            response = self.client.get(MESSAGE_URL(self.messages[1].id))
+        self.assertEqual(response.status_code, 200)
+
+    async def _read_stream(self, response):
+        return [chunk async for chunk in response.streaming_content]
+
+    def test_message_stream_budget(self):
+        """Test that streaming a finished message stays within its query budget."""
+        ChatStreamWriter(self.messages[1].id).push('{"investment_summary": "Ok"}')
+        close_chat_stream(self.messages[1].id)
+
+        with self.assertQueryBudget(1):
+            response = self.client.get(STREAM_URL(self.messages[1].id))
+            async_to_sync(self._read_stream)(response)
+        self.assertEqual(response.status_code, 200)
+
+    @patch("chat_api.views.generate_ai_chat_response.delay")
+    def test_message_create_budget(self, delay):
+        """Test that posting a chat message stays within its query budget."""
+        with self.assertQueryBudget(5):
+            response = self.client.post(
+                MESSAGE_CREATE_URL,
+                {"session": self.session.id, "content": "What if it had 3 beds?"},
+                format="json",
+            )
+        self.assertEqual(response.status_code, 202)
+        delay.assert_called_once()
@@ -0,0 +1,39 @@
+from unittest.mock import patch
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from rest_framework.test import APIClient
+from core_db_ai.models import User
+
+MESSAGE_CREATE_URL = reverse("chat-message-create")
+
+
+@override_settings(THROTTLE_ENABLED=True)
+@patch("backend_ai.throttling.get_redis_connection")
+class ChatThrottlingTest(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            email="test@example.com",
+            username="testuser",
+            password="password123",
+            first_name="John",
+            last_name="Doe",
+            slug="john-doe",
+        )
+        self.client.force_authenticate(user=self.user)
+
+    def test_throttled_message_sets_retry_after(self, get_redis_connection):
+        """Test that a throttled chat message returns 429 before any work."""
+        evalsha = get_redis_connection.return_value.evalsha
+        evalsha.side_effect = [0, 4200]
+
+        with self.assertNumQueries(0):
+            response = self.client.post(
+                MESSAGE_CREATE_URL, {"session": 1, "content": "Hi"}, format="json"
+            )
+
+        self.assertEqual(response.status_code, 429)
+        self.assertEqual(response["Retry-After"], "5")
+        keys = [call.args[2] for call in evalsha.call_args_list]
+        self.assertTrue(keys[0].endswith(f"throttle_chat_user_{self.user.pk}"))
+        self.assertTrue(keys[1].endswith("throttle_chat_ip_127.0.0.1"))
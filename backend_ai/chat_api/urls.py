@@ -1,5 +1,10 @@
 from django.urls import path
-from .views import ChatSessionView, ChatMessageDetailView, ChatMessageCreateView
+from .views import (
+    ChatSessionView,
+    ChatMessageDetailView,
+    ChatMessageStreamView,
+    ChatMessageCreateView,
+)
 
 urlpatterns = [
     path("chat/session/<int:id>/", ChatSessionView.as_view(), name="chat-session"),
@@ -8,5 +13,10 @@ urlpatterns = [
         ChatMessageDetailView.as_view(),
         name="chat-message-detail",
     ),
+    path(
+        "chat/message/<int:id>/stream/",
+        ChatMessageStreamView.as_view(),
+        name="chat-message-stream",
+    ),
     path("chat/message/", ChatMessageCreateView.as_view(), name="chat-message-create"),
 ]
@@ -1,3 +1,8 @@
+import json
+import time
+import asyncio
+from django.conf import settings
+from django.http import StreamingHttpResponse
 from django.utils import timezone
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.views import APIView
@@ -10,7 +15,8 @@ from drf_spectacular.utils import (
     OpenApiParameter,
     extend_schema,
 )
-from backend_ai.renderers import ViewRenderer
+from backend_ai.renderers import ViewRenderer, EventStreamRenderer
+from backend_ai.throttling import IPRateThrottle, UserRateThrottle
 from backend_ai.schema_serializers import (
     ErrorResponseSerializer,
     ChatMessageGETResponseSerializer,
@@ -19,9 +25,13 @@ from backend_ai.schema_serializers import (
 )
 from core_db_ai.models import ChatSession, AIReport, ChatMessage
 from .serializers import ChatSessionSerializer, ChatMessageSerializer
+from .streams import aread_chat_stream
 from .tasks import generate_ai_chat_response
 
 
+TERMINAL_STATUSES = {ChatMessage.Status.COMPLETED, ChatMessage.Status.FAILED}
+
+
 def check_request_data(data_id, current_user, method):  # pylint: disable=R0911
     """
     Check if the id for either report or session is valid
@@ -46,7 +56,7 @@ def check_request_data(data_id, current_user, method):  # pylint: disable=R0911
                 status=status.HTTP_404_NOT_FOUND,
             )
 
-        if ai_report.user != current_user and not current_user.is_superuser:
+        if ai_report.user_id != current_user.id and not current_user.is_superuser:
             return Response(
                 {
                     "error": "You do not have permission to view this report's chat session."
@@ -78,7 +88,7 @@ def check_request_data(data_id, current_user, method):  # pylint: disable=R0911
                 status=status.HTTP_404_NOT_FOUND,
             )
 
-        if session.user != current_user and not current_user.is_superuser:
+        if session.user_id != current_user.id and not current_user.is_superuser:
             return Response(
                 {"error": "Access denied. This session belongs to another user."},
                 status=status.HTTP_403_FORBIDDEN,
@@ -91,6 +101,94 @@ def check_request_data(data_id, current_user, method):  # pylint: disable=R0911
     return None
 
 
+def check_message_access(message_id, current_user):
+    """
+    Check if the message id is valid and the message belongs to the user
+    """
+    if not message_id:
+        return Response(
+            {"error": "Message ID is required."}, status=status.HTTP_400_BAD_REQUEST
+        )
+
+    if not str(message_id).isdigit():
+        return Response(
+            {"error": "Invalid Message ID format. Must be an integer."},
+            status=status.HTTP_400_BAD_REQUEST,
+        )
+
+    try:
+        message = ChatMessage.objects.select_related("session").get(pk=message_id)
+    except ChatMessage.DoesNotExist:
+        return Response(
+            {"error": f"Message with ID {message_id} does not exist."},
+            status=status.HTTP_404_NOT_FOUND,
+        )
+
+    if message.session.user_id != current_user.id:
+        return Response(
+            {"error": "Access denied. You do not own this chat session."},
+            status=status.HTTP_403_FORBIDDEN,
+        )
+
+    return message
+
+
+def done_event(final_status):
+    done = json.dumps({"status": final_status})
+    return f"event: done\ndata: {done}\n\n"
+
+
+async def chat_done_events(final_status):
+    """Stream of a message that already finished, only its done event."""
+    yield done_event(final_status)
+
+
+async def chat_stream_events(message_id):
+    """
+    Relays the partial AI answer from Redis as Server-Sent Events.
+    Each delta event carries only the text added since the previous event.
+    Async, so under ASGI events are sent as they come and waiting between
+    polls does not hold a worker thread.
+    """
+    sent = 0
+    started = time.monotonic()
+    last_status_check = started
+    final_status = None
+
+    while time.monotonic() - started < settings.CHAT_STREAM_TIMEOUT:
+        stream = await aread_chat_stream(message_id)
+
+        if stream:
+            content = stream.get("content", "")
+            if len(content) < sent:
+                # The analysis was retried, the stream restarted from scratch
+                sent = 0
+                yield "event: reset\ndata: {}\n\n"
+            if len(content) > sent:
+                delta = json.dumps({"content": content[sent:]})
+                sent = len(content)
+                yield f"event: delta\ndata: {delta}\n\n"
+            if stream.get("done"):
+                final_status = ChatMessage.Status.COMPLETED
+                break
+
+        # Failures never close the stream, so the message row is checked too
+        if time.monotonic() - last_status_check >= 1:
+            last_status_check = time.monotonic()
+            message_status = (
+                await ChatMessage.objects.filter(pk=message_id)
+                .values_list("status", flat=True)
+                .afirst()
+            )
+            if message_status in TERMINAL_STATUSES:
+                final_status = message_status
+                break
+
+        await asyncio.sleep(settings.CHAT_STREAM_POLL_INTERVAL)
+
+    yield done_event(final_status or "TIMEOUT")
+
+
 class ChatSessionView(APIView):
     """
     Chat Session View (GET, DELETE)
@@ -186,14 +284,16 @@ class ChatSessionView(APIView):
         if isinstance(check_integrity, Response):
             return check_integrity
 
-        session, created = ChatSession.objects.get_or_create(
-            report=check_integrity["ai_report"],
-            user=current_user,
+        session = (
+            ChatSession.objects.prefetch_related("messages")
+            .filter(report=check_integrity["ai_report"], user=current_user)
+            .first()
         )
 
-        if not created:
-            session = ChatSession.objects.prefetch_related("messages").get(
-                pk=session.pk
+        if session is None:
+            session = ChatSession.objects.create(
+                report=check_integrity["ai_report"],
+                user=current_user,
             )
 
         serializer = ChatSessionSerializer(session)
@@ -367,40 +467,12 @@ class ChatMessageDetailView(APIView):
         ],
     )
     def get(self, request, *args, **kwargs):
-        message_id = kwargs.get("id")
-        current_user = request.user
+        message = check_message_access(kwargs.get("id"), request.user)
 
-        if not message_id:
-            return Response(
-                {"error": "Message ID is required."}, status=status.HTTP_400_BAD_REQUEST
-            )
+        if isinstance(message, Response):
+            return message
 
-        if not str(message_id).isdigit():
-            return Response(
-                {"error": "Invalid Message ID format. Must be an integer."},
-                status=status.HTTP_400_BAD_REQUEST,
-            )
-
-        try:
-            message = ChatMessage.objects.select_related("session__user").get(
-                pk=message_id
-            )
-        except ChatMessage.DoesNotExist:
-            return Response(
-                {"error": f"Message with ID {message_id} does not exist."},
-                status=status.HTTP_404_NOT_FOUND,
-            )
-
-        if message.session.user != current_user:
-            return Response(
-                {"error": "Access denied. You do not own this chat session."},
-                status=status.HTTP_403_FORBIDDEN,
-            )
-
-        if message.status not in {
-            ChatMessage.Status.COMPLETED,
-            ChatMessage.Status.FAILED,
-        }:
+        if message.status not in TERMINAL_STATUSES:
             return Response(
                 {"pending": f"Your message is still being {message.status.lower()}."},
                 status=status.HTTP_202_ACCEPTED,
@@ -414,6 +486,83 @@ class ChatMessageDetailView(APIView):
         )
 
 
+class ChatMessageStreamView(APIView):
+    """
+    Chat Message Stream View (GET by ID)
+    Streams the AI answer token by token while it is being generated.
+    """
+
+    renderer_classes = [ViewRenderer, EventStreamRenderer]
+    authentication_classes = [JWTAuthentication]
+    permission_classes = [IsAuthenticated]
+    http_method_names = ["get"]
+
+    @extend_schema(
+        summary="Stream an AI Chat Message",
+        description=(
+            "Streams the partial AI answer of a message as Server-Sent Events. "
+            "'delta' events carry newly generated text, 'reset' means the answer "
+            "restarted after a retry, and 'done' carries the final message status. "
+            "The finished message must still be fetched from the message endpoint."
+        ),
+        tags=["AI Chat Messages"],
+        parameters=[
+            OpenApiParameter(
+                name="id",
+                type=int,
+                location=OpenApiParameter.PATH,
+                description="The ID of the AI message to stream",
+                required=True,
+            ),
+        ],
+        request=None,
+        responses={
+            (status.HTTP_200_OK, "text/event-stream"): OpenApiResponse(
+                response=str,
+                description="Server-Sent Event stream of the AI answer.",
+            ),
+            status.HTTP_401_UNAUTHORIZED: ErrorResponseSerializer,
+            status.HTTP_403_FORBIDDEN: ErrorResponseSerializer,
+            status.HTTP_404_NOT_FOUND: ErrorResponseSerializer,
+        },
+        examples=[
+            OpenApiExample(
+                name="Unauthorized Access",
+                response_only=True,
+                status_codes=["401"],
+                value={"error": "You are not authenticated."},
+            ),
+            OpenApiExample(
+                name="Not Found Error",
+                response_only=True,
+                status_codes=["404"],
+                value={"error": "Message with ID 1 does not exist."},
+            ),
+            OpenApiExample(
+                name="Unauthorized Chat access Error",
+                response_only=True,
+                status_codes=["403"],
+                value={"error": "Access denied. You do not own this chat session."},
+            ),
+        ],
+    )
+    def get(self, request, *args, **kwargs):
+        message = check_message_access(kwargs.get("id"), request.user)
+
+        if isinstance(message, Response):
+            return message
+
+        if message.status in TERMINAL_STATUSES:
+            events = chat_done_events(message.status)
+        else:
+            events = chat_stream_events(message.id)
+
+        response = StreamingHttpResponse(events, content_type="text/event-stream")
+        response["Cache-Control"] = "no-cache"
+        response["X-Accel-Buffering"] = "no"  # Disable Nginx buffering
+        return response
+
+
 class ChatMessageCreateView(APIView):
     """
     Chat Message View (POST)
@@ -422,6 +571,8 @@ class ChatMessageCreateView(APIView):
     renderer_classes = [ViewRenderer]
     authentication_classes = [JWTAuthentication]
     permission_classes = [IsAuthenticated]
+    throttle_classes = [UserRateThrottle, IPRateThrottle]
+    throttle_scope = "chat"
     http_method_names = ["post"]
 
     @extend_schema(
@@ -437,6 +588,7 @@ class ChatMessageCreateView(APIView):
             status.HTTP_401_UNAUTHORIZED: ErrorResponseSerializer,
             status.HTTP_403_FORBIDDEN: ErrorResponseSerializer,
             status.HTTP_404_NOT_FOUND: ErrorResponseSerializer,
+            status.HTTP_429_TOO_MANY_REQUESTS: ErrorResponseSerializer,
         },
         examples=[
             OpenApiExample(
@@ -470,7 +622,7 @@ class ChatMessageCreateView(APIView):
         try:
             session = ChatSession.objects.select_related("report").get(pk=session_id)
 
-            if session.user != current_user:
+            if session.user_id != current_user.id:
                 return Response(
                     {"error": "Access denied. This session belongs to another user."},
                     status=status.HTTP_403_FORBIDDEN,
@@ -1,14 +1,64 @@
+import time
 import random
+import numpy as np
 from django.core.management.base import BaseCommand
 from django.db import transaction
 from core_db_ai.models import Property, AIReport, User, ChatSession, ChatMessage
 from core_db_ai.factories import AIReportFactory, ChatSessionFactory, ChatMessageFactory
+from core_db_ai.seeding import clear_tables, seed_reports, seed_messages
 
 
 class Command(BaseCommand):
-    help = "Seeds AI Reports and Chat Sessions."
+    help = (
+        "Seeds AI Reports and Chat Sessions. --reports / --messages bulk seed "
+        "that many instead, replacing the existing ones."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--reports", type=int, help="Reports to bulk seed.")
+        parser.add_argument("--messages", type=int, help="Chat messages to bulk seed.")
+        parser.add_argument(
+            "--seed", type=int, default=0, help="Random seed of the bulk data."
+        )
+
+    def seed_at_scale(self, options):
+        """Bulk reports and chat messages with realistic distributions."""
+        rng = np.random.default_rng(options["seed"])
+        steps = []
+        if options["reports"] is not None:
+            clear_tables(ChatMessage, ChatSession, AIReport)
+            steps.append(("reports", options["reports"], seed_reports))
+        if options["messages"] is not None:
+            clear_tables(ChatMessage, ChatSession)
+            steps.append(("messages", options["messages"], seed_messages))
+
+        for label, count, seed in steps:
+            self.stdout.write(f"Bulk seeding {count} {label}...")
+            started = time.perf_counter()
+
+            def progress(label, done, total, started=started):
+                rate = done / max(time.perf_counter() - started, 1e-9)
+                self.stdout.write(f"{label}: {done}/{total} ({rate:,.0f} rows/s)")
+
+            try:
+                seed(count, rng, progress=progress)
+            except ValueError as e:
+                self.stdout.write(self.style.ERROR(f"❌ Seeding failed: {e}"))
+                return
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"✅ {AIReport.objects.count()} reports, "
+                f"{ChatSession.objects.count()} chat sessions, "
+                f"{ChatMessage.objects.count()} messages."
+            )
+        )
 
     def handle(self, *args, **options):
+        if options["reports"] is not None or options["messages"] is not None:
+            self.seed_at_scale(options)
+            return
+
         self.stdout.write(self.style.WARNING("Cleaning up old AI Reports..."))
         AIReport.objects.all().delete()
 
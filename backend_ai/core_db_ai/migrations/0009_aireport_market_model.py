@@ -0,0 +1,22 @@
+# Generated by Django 6.0.1 on 2026-10-19 10:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core_db_ai", "0008_alter_aireport_ai_insight_summary_and_more"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="aireport",
+            name="market_model",
+            field=models.JSONField(
+                blank=True,
+                help_text="Regression fitted on the comparables, reused to score chat queries",
+                null=True,
+            ),
+        ),
+    ]
@@ -0,0 +1,84 @@
+# Generated by Django 6.0.1 on 2026-10-19 14:05
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core_db_ai", "0009_aireport_market_model"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="PipelineSpan",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "stage",
+                    models.CharField(
+                        choices=[
+                            ("search", "Search"),
+                            ("extraction", "Extraction"),
+                            ("compile", "Compile"),
+                            ("regression", "Regression"),
+                            ("insight", "Insight"),
+                            ("finalize", "Finalize"),
+                            ("chat_extraction", "Chat Extraction"),
+                            ("chat_regression", "Chat Regression"),
+                            ("chat_insight", "Chat Insight"),
+                            ("chat_finalize", "Chat Finalize"),
+                        ],
+                        max_length=20,
+                    ),
+                ),
+                ("duration_ms", models.FloatField()),
+                ("prompt_tokens", models.PositiveIntegerField(blank=True, null=True)),
+                (
+                    "completion_tokens",
+                    models.PositiveIntegerField(blank=True, null=True),
+                ),
+                ("retries", models.PositiveSmallIntegerField(default=0)),
+                ("cache_hit", models.BooleanField(default=False)),
+                ("succeeded", models.BooleanField(default=True)),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                (
+                    "message",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="spans",
+                        to="core_db_ai.chatmessage",
+                    ),
+                ),
+                (
+                    "report",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="spans",
+                        to="core_db_ai.aireport",
+                    ),
+                ),
+            ],
+            options={
+                "indexes": [
+                    models.Index(
+                        fields=["stage", "created_at"],
+                        name="core_db_ai__stage_e41e2a_idx",
+                    )
+                ],
+            },
+        ),
+    ]
@@ -112,6 +112,12 @@ class AIReport(models.Model):
         help_text="Rating from 0.0 to 5.0 based on analysis",
     )
 
+    market_model = models.JSONField(
+        blank=True,
+        null=True,
+        help_text="Regression fitted on the comparables, reused to score chat queries",
+    )
+
     ai_insight_summary = models.TextField(blank=True, null=True)
     created_at = models.DateTimeField(auto_now_add=True)
 
@@ -171,3 +177,46 @@ class ChatMessage(models.Model):
 
     class Meta:
         ordering = ["timestamp"]
+
+
+class PipelineSpan(models.Model):
+    class Stage(models.TextChoices):
+        SEARCH = "search", "Search"
+        EXTRACTION = "extraction", "Extraction"
+        COMPILE = "compile", "Compile"
+        REGRESSION = "regression", "Regression"
+        INSIGHT = "insight", "Insight"
+        FINALIZE = "finalize", "Finalize"
+        CHAT_EXTRACTION = "chat_extraction", "Chat Extraction"
+        CHAT_REGRESSION = "chat_regression", "Chat Regression"
+        CHAT_INSIGHT = "chat_insight", "Chat Insight"
+        CHAT_FINALIZE = "chat_finalize", "Chat Finalize"
+
+    report = models.ForeignKey(
+        AIReport,
+        on_delete=models.CASCADE,
+        related_name="spans",
+        blank=True,
+        null=True,
+    )
+    message = models.ForeignKey(
+        ChatMessage,
+        on_delete=models.CASCADE,
+        related_name="spans",
+        blank=True,
+        null=True,
+    )
+    stage = models.CharField(max_length=20, choices=Stage.choices)
+    duration_ms = models.FloatField()
+    prompt_tokens = models.PositiveIntegerField(blank=True, null=True)
+    completion_tokens = models.PositiveIntegerField(blank=True, null=True)
+    retries = models.PositiveSmallIntegerField(default=0)
+    cache_hit = models.BooleanField(default=False)
+    succeeded = models.BooleanField(default=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [models.Index(fields=["stage", "created_at"])]
+
+    def __str__(self):
+        return f"{self.stage} ({self.duration_ms:.0f} ms)"
@@ -0,0 +1,250 @@
+from datetime import timedelta
+import numpy as np
+from django.db import connection, transaction
+from django.utils import timezone
+from report_api.utils import extract_location
+from .models import User, Property, AIReport, ChatSession, ChatMessage
+
+BATCH_SIZE = 2000
+COMPARABLES = 10
+MESSAGES_PER_SESSION = (2, 12)
+RATINGS = np.arange(0.0, 5.5, 0.5)
+# Ratings cluster around 3 like the regression's output does
+RATINGS_P = np.array([1, 1, 2, 4, 7, 12, 18, 22, 17, 10, 6]) / 100
+REPORT_STATUSES = [
+    AIReport.Status.COMPLETED,
+    AIReport.Status.FAILED,
+    AIReport.Status.PENDING,
+    AIReport.Status.PROCESSING,
+]
+REPORT_STATUSES_P = [0.9, 0.05, 0.03, 0.02]
+QUESTIONS = [
+    "What if it had {n} bedrooms?",
+    "What if it had {n} bathrooms?",
+    "What if the price dropped by {n}0,000?",
+    "What if the area was {n}00 sqft larger?",
+]
+ANSWER = (
+    "With that change the property would rate {rating} / 5 against the "
+    "comparable sales in the area."
+)
+
+
+def clear_tables(*models):
+    """
+    Empties the tables. TRUNCATE on PostgreSQL, millions of rows would take
+    the ORM ages to collect for the cascade.
+    """
+    if connection.vendor == "postgresql":
+        tables = ", ".join(
+            connection.ops.quote_name(model._meta.db_table) for model in models
+        )
+        with connection.cursor() as cursor:
+            cursor.execute(f"TRUNCATE {tables} RESTART IDENTITY CASCADE")
+        return
+
+    for model in models:
+        model.objects.all().delete()
+
+
+def batches(count, batch_size=BATCH_SIZE):
+    """(start, size) of every batch."""
+    for start in range(0, count, batch_size):
+        yield start, min(batch_size, count - start)
+
+
+def sample_pairs(rng, count, user_ids, property_ids):
+    """
+    Distinct (user, property) pairs, one report per pair like the API allows.
+    A few properties are far more popular than the rest (Pareto weights).
+    """
+    if count > len(user_ids) * len(property_ids):
+        raise ValueError("More reports requested than user / property pairs.")
+
+    weights = rng.pareto(1.5, len(property_ids)) + 1
+    weights /= weights.sum()
+    codes = np.empty(0, dtype=np.int64)
+    while len(codes) < count:
+        users = rng.integers(0, len(user_ids), count).astype(np.int64)
+        properties = rng.choice(len(property_ids), count, p=weights)
+        codes = np.unique(
+            np.concatenate([codes, users * len(property_ids) + properties])
+        )
+
+    codes = rng.permutation(codes)[:count]
+    return user_ids[codes // len(property_ids)], property_ids[codes % len(property_ids)]
+
+
+def comparable_columns(rng, props):
+    """
+    Sales around each property (one row per property), what the search stage
+    would have found. Returns price, area, beds and baths matrices.
+    """
+    area_sqft = np.array([prop.area_sqft for prop in props], dtype=float)[:, None]
+    price = np.array([float(prop.price) for prop in props])[:, None]
+    beds = np.array([prop.beds for prop in props])[:, None]
+    baths = np.array([prop.baths for prop in props])[:, None]
+    shape = (len(props), COMPARABLES)
+
+    comp_area = np.round(area_sqft * rng.uniform(0.75, 1.25, shape))
+    comp_price = np.round(comp_area * price / area_sqft * rng.lognormal(0, 0.15, shape))
+    comp_beds = np.clip(beds + rng.integers(-1, 2, shape), 1, None)
+    comp_baths = np.clip(baths + rng.integers(-1, 2, shape), 1, None)
+    return (
+        comp_price.astype(int),
+        comp_area.astype(int),
+        comp_beds.astype(int),
+        comp_baths.astype(int),
+    )
+
+
+def completed_fields(rating, city, comps):
+    """Fields of a completed report, comps holds its price, area, beds and baths."""
+    price, area_sqft, beds, baths = comps
+    return {
+        "comparable_data": [
+            {"price": p, "area_sqft": a, "beds": b, "baths": ba}
+            for p, a, b, ba in zip(price, area_sqft, beds, baths)
+        ],
+        "avg_market_price": round(sum(price) / len(price), 2),
+        "avg_price_per_sqft": round(sum(price) / sum(area_sqft), 2),
+        "avg_beds": round(sum(beds) / len(beds)),
+        "avg_baths": round(sum(baths) / len(baths)),
+        "investment_rating": rating,
+        "ai_insight_summary": (
+            f"The property earns a {rating} / 5 rating against "
+            f"{COMPARABLES} comparable sales in {city}."
+        ),
+    }
+
+
+def report_batch(rng, props, users, statuses, ratings):
+    """Reports of one batch, users / statuses / ratings are aligned with props."""
+    comps = comparable_columns(rng, props)
+    reports = []
+    for i, prop in enumerate(props):
+        area, city = extract_location(prop.address)
+        status = REPORT_STATUSES[statuses[i]]
+        fields = {}
+        if status == AIReport.Status.COMPLETED:
+            fields = completed_fields(
+                float(ratings[i]), city, [column[i].tolist() for column in comps]
+            )
+        reports.append(
+            AIReport(
+                user_id=int(users[i]),
+                property=prop,
+                status=status,
+                extracted_area=area,
+                extracted_city=city,
+                **fields,
+            )
+        )
+    return reports
+
+
+def seed_reports(count, rng, progress=None):
+    """Reports of non-staff users, 90% of them completed."""
+    user_ids = np.array(
+        User.objects.filter(is_staff=False).values_list("id", flat=True)
+    )
+    property_ids = np.array(Property.objects.values_list("id", flat=True))
+    if user_ids.size == 0 or property_ids.size == 0:
+        raise ValueError("Reports need both users and properties.")
+
+    users, properties = sample_pairs(rng, count, user_ids, property_ids)
+    statuses = rng.choice(len(REPORT_STATUSES), count, p=REPORT_STATUSES_P)
+    ratings = rng.choice(RATINGS, count, p=RATINGS_P)
+
+    for start, size in batches(count):
+        batch = slice(start, start + size)
+        in_bulk = Property.objects.in_bulk(properties[batch].tolist())
+        props = [in_bulk[property_id] for property_id in properties[batch].tolist()]
+        reports = report_batch(
+            rng, props, users[batch], statuses[batch], ratings[batch]
+        )
+
+        with transaction.atomic():
+            AIReport.objects.bulk_create(reports)
+        if progress:
+            progress("Reports", start + size, count)
+
+
+def session_lengths(rng, count):
+    """Messages per session summing to count, user and AI turns alternate."""
+    if count <= 0:
+        return np.empty(0, dtype=int)
+    low, high = MESSAGES_PER_SESSION
+    lengths = rng.integers(low, high + 1, count // low + 1)
+    lengths = lengths[: np.searchsorted(np.cumsum(lengths), count) + 1]
+    lengths[-1] -= lengths.sum() - count
+    return lengths
+
+
+def session_messages(rng, session, rating, length, started):
+    """Alternating what-if questions and answers of one session."""
+    numbers = rng.integers(1, 6, length)
+    messages = []
+    for turn in range(length):
+        user_turn = turn % 2 == 0
+        messages.append(
+            ChatMessage(
+                session=session,
+                role=ChatMessage.Role.USER if user_turn else ChatMessage.Role.AI,
+                status=ChatMessage.Status.COMPLETED,
+                content=(
+                    rng.choice(QUESTIONS).format(n=numbers[turn])
+                    if user_turn
+                    else ANSWER.format(rating=rating)
+                ),
+                timestamp=started + timedelta(seconds=30 * turn),
+            )
+        )
+    return messages
+
+
+def save_sessions(rng, reports, lengths, now):
+    """Creates a session per (report id, user id, rating) with its messages."""
+    with transaction.atomic():
+        sessions = ChatSession.objects.bulk_create(
+            [
+                ChatSession(
+                    report_id=report_id,
+                    user_id=user_id,
+                    user_message_count=int((length + 1) // 2),
+                )
+                for (report_id, user_id, _), length in zip(reports, lengths)
+            ]
+        )
+        messages = []
+        for session, (_, _, rating), length in zip(sessions, reports, lengths):
+            started = now - timedelta(minutes=int(rng.integers(0, 60 * 24 * 90)))
+            messages.extend(session_messages(rng, session, rating, length, started))
+        ChatMessage.objects.bulk_create(messages)
+
+
+def seed_messages(count, rng, progress=None):
+    """
+    Chat sessions on completed reports, filled with what-if turns. Every
+    session is on a different report, so one per report and its user.
+    """
+    reports = list(
+        AIReport.objects.filter(status=AIReport.Status.COMPLETED).values_list(
+            "id", "user_id", "investment_rating"
+        )
+    )
+    lengths = session_lengths(rng, count)
+    if len(lengths) > len(reports):
+        raise ValueError("More chat sessions needed than completed reports.")
+
+    picked = [reports[i] for i in rng.choice(len(reports), len(lengths), replace=False)]
+    now = timezone.now()
+    done = 0
+
+    for start, size in batches(len(lengths), BATCH_SIZE // 10):
+        batch_lengths = lengths[start : start + size]
+        save_sessions(rng, picked[start : start + size], batch_lengths, now)
+
+        done += int(batch_lengths.sum())
+        if progress:
+            progress("Messages", done, count)
@@ -0,0 +1,58 @@
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+METRICS_URL = reverse("metrics")
+METRICS_TOKEN = "scrape-secret"
+LIST_URL = reverse("report-list")
+
+
+@override_settings(METRICS_TOKEN=METRICS_TOKEN)
+class PrometheusMetricsTest(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+
+    def scrape(self):
+        return self.client.get(
+            METRICS_URL, HTTP_AUTHORIZATION=f"Bearer {METRICS_TOKEN}"
+        )
+
+    def test_requests_are_measured_per_route(self):
+        """Test that latency, status and query counts are exported per route name."""
+        self.client.get(LIST_URL)
+
+        response = self.scrape()
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        body = response.content.decode()
+        self.assertIn(
+            'django_http_request_duration_seconds_count{method="GET",route="report-list"}',
+            body,
+        )
+        self.assertIn('django_http_db_queries_count{route="report-list"}', body)
+        self.assertIn("django_http_requests_in_flight", body)
+
+    def test_metrics_endpoint_is_not_measured(self):
+        """Test that scrapes do not show up as traffic."""
+        self.scrape()
+
+        response = self.scrape()
+
+        self.assertNotIn('route="metrics"', response.content.decode())
+
+    def test_metrics_token_required(self):
+        """Test that the endpoint requires the configured token."""
+        response = self.client.get(METRICS_URL)
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+        response = self.client.get(METRICS_URL, HTTP_AUTHORIZATION="Bearer wrong")
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+        self.assertEqual(self.scrape().status_code, status.HTTP_200_OK)
+
+    @override_settings(METRICS_TOKEN="")
+    def test_metrics_closed_without_token(self):
+        """Test that the endpoint is closed when no token is configured."""
+        response = self.client.get(METRICS_URL, HTTP_AUTHORIZATION="Bearer ")
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
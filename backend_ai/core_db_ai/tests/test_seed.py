@@ -0,0 +1,114 @@
+from io import StringIO
+import numpy as np
+from django.core.management import call_command
+from django.test import TestCase
+from core_db_ai.models import (
+    User,
+    Agent,
+    Property,
+    AIReport,
+    ChatSession,
+    ChatMessage,
+)
+from core_db_ai.seeding import COMPARABLES, sample_pairs, session_lengths
+
+
+class BulkSeedTest(TestCase):
+    def setUp(self):
+        for i in range(4):
+            User.objects.create_user(
+                email=f"user{i}@example.com",
+                username=f"user{i}",
+                password=None,
+                first_name="John",
+                last_name="Doe",
+                slug=f"user-{i}",
+            )
+        agent = Agent.objects.create(
+            user=User.objects.first(), company_name="Dream Realty", bio="Lofts"
+        )
+        Property.objects.bulk_create(
+            Property(
+                agent=agent,
+                title=f"Modern Condo {i}",
+                description="A beautiful condo",
+                beds=3,
+                baths=2,
+                price=450000,
+                area_sqft=1500,
+                address=(
+                    f"flat_no=1, house_no={i}, street=Oak St, area=Midtown, "
+                    "city=Austin, state=Texas, country=United States"
+                ),
+                slug=f"modern-condo-{i}",
+            )
+            for i in range(10)
+        )
+
+    def seed(self, *args):
+        call_command("seed", *args, stdout=StringIO())
+
+    def test_bulk_reports(self):
+        """Test that --reports seeds distinct user / property reports."""
+        self.seed("--reports", "30")
+
+        self.assertEqual(AIReport.objects.count(), 30)
+        pairs = set(AIReport.objects.values_list("user_id", "property_id"))
+        self.assertEqual(len(pairs), 30)
+
+        report = AIReport.objects.filter(status=AIReport.Status.COMPLETED).first()
+        self.assertEqual(report.extracted_city, "Austin")
+        self.assertEqual(report.extracted_area, "Midtown")
+        self.assertEqual(len(report.comparable_data), COMPARABLES)
+        self.assertTrue(0 <= report.investment_rating <= 5)
+
+    def test_bulk_messages(self):
+        """Test that --messages seeds alternating turns on completed reports."""
+        self.seed("--reports", "20", "--messages", "45")
+
+        self.assertEqual(ChatMessage.objects.count(), 45)
+        for session in ChatSession.objects.all():
+            roles = list(session.messages.values_list("role", flat=True))
+            self.assertEqual(roles[0], ChatMessage.Role.USER)
+            self.assertEqual(
+                session.user_message_count, roles.count(ChatMessage.Role.USER)
+            )
+            self.assertEqual(session.report.status, AIReport.Status.COMPLETED)
+            self.assertEqual(session.user_id, session.report.user_id)
+
+        report_ids = list(ChatSession.objects.values_list("report_id", flat=True))
+        self.assertEqual(len(report_ids), len(set(report_ids)))
+
+    def test_too_many_messages_fail(self):
+        """Test that more sessions than completed reports are refused."""
+        self.seed("--reports", "2")
+        out = StringIO()
+        call_command("seed", "--messages", "100", stdout=out)
+
+        self.assertIn("Seeding failed", out.getvalue())
+        self.assertEqual(ChatSession.objects.count(), 0)
+
+    def test_reseeding_replaces_reports(self):
+        """Test that seeding again replaces the earlier reports."""
+        self.seed("--reports", "10")
+        self.seed("--reports", "5")
+
+        self.assertEqual(AIReport.objects.count(), 5)
+
+    def test_too_many_reports_fail(self):
+        """Test that more reports than user / property pairs are refused."""
+        out = StringIO()
+        call_command("seed", "--reports", "100", stdout=out)
+
+        self.assertIn("Seeding failed", out.getvalue())
+        self.assertEqual(AIReport.objects.count(), 0)
+
+    def test_sampling_helpers(self):
+        """Test that pairs are distinct and session lengths add up."""
+        rng = np.random.default_rng(0)
+        users, properties = sample_pairs(rng, 50, np.arange(10), np.arange(10))
+        self.assertEqual(len(set(zip(users, properties))), 50)
+
+        lengths = session_lengths(rng, 101)
+        self.assertEqual(lengths.sum(), 101)
+        self.assertTrue((lengths > 0).all())
@@ -0,0 +1,33 @@
+from django.test import SimpleTestCase
+from rest_framework_simplejwt.authentication import JWTStatelessUserAuthentication
+from rest_framework_simplejwt.tokens import AccessToken
+from backend_ai.tokens import ClaimsTokenUser
+
+
+class ClaimsTokenUserTest(SimpleTestCase):
+    def token(self, **claims):
+        token = AccessToken()
+        token["user_id"] = 7
+        for claim, value in claims.items():
+            token[claim] = value
+        return token
+
+    def test_stateless_user_reads_role_claims(self):
+        """Test that the stateless user is authorized from the token claims."""
+        token = self.token(role="Agent", is_agent=True, is_staff=False)
+        user = JWTStatelessUserAuthentication().get_user(token)
+
+        self.assertIsInstance(user, ClaimsTokenUser)
+        self.assertEqual(user.id, 7)
+        self.assertEqual(user.role, "Agent")
+        self.assertTrue(user.is_agent)
+        self.assertFalse(user.is_staff)
+
+    def test_tokens_without_claims_are_unprivileged(self):
+        """Test that tokens issued before the claims existed grant nothing extra."""
+        user = ClaimsTokenUser(self.token())
+
+        self.assertEqual(user.role, "UnAuthorized")
+        self.assertFalse(user.is_agent)
+        self.assertFalse(user.is_staff)
+        self.assertFalse(user.is_superuser)
@@ -0,0 +1,6 @@
+from prometheus_client import multiprocess
+
+
+def child_exit(server, worker):  # pylint: disable=W0613
+    """Drops a dead worker's live gauges from the multiprocess metrics."""
+    multiprocess.mark_process_dead(worker.pid)
@@ -1,18 +1,33 @@
+import re
 import json
 from openai import OpenAI
 from tavily import TavilyClient
 from django.conf import settings
 from .utils import clean_context
+from .packing import pack_comps
+from .dedupe import drop_duplicate_snippets
+from .insight_cache import (
+    insight_cache_key_for,
+    get_cached_insight,
+    set_cached_insight,
+)
 
-openai = OpenAI(
-    api_key=settings.GROQ_API_KEY, base_url="https://api.groq.com/openai/v1"
+openai = OpenAI(api_key=settings.GROQ_API_KEY, base_url=settings.GROQ_BASE_URL)
+tavily = TavilyClient(
+    api_key=settings.TAVILY_API_KEY, api_base_url=settings.TAVILY_BASE_URL
 )
-tavily = TavilyClient(api_key=settings.TAVILY_API_KEY)
+
+EXTRACTION_MODEL = "llama-3.1-8b-instant"
 
 
 def tavily_search(
-    area, city, area_sqft, beds, baths, count, seed_index
+    area, city, area_sqft, beds, baths, count, seed_index, report_id=None
 ):  # pylint: disable=R0913, R0917
+    """
+    Tavily search for one fork of a report.
+    Snippets are cleaned and near-duplicates, including listings another
+    fork of the same report_id already found, are dropped before extraction.
+    """
     search_queries = [
         (
             f"recently sold properties in {area} {city} with price area_sqft "
@@ -45,14 +60,19 @@ def tavily_search(
     tavily_credits = search_result.get("usage", {}).get("credits", "unknown")
 
     # Tavily Context
-    context_text = "\n---\n".join(
-        [
-            f"Source: {res['url']}\nContent: {res['content']}"
-            for res in search_result["results"]
-        ]
+    snippets = [
+        (res["url"], clean_context(res["content"])) for res in search_result["results"]
+    ]
+    snippets = drop_duplicate_snippets(
+        [(url, content) for url, content in snippets if content],
+        report_id=report_id,
+        fork=seed_index,
+        key=lambda snippet: snippet[1],
     )
 
-    context_text = clean_context(context_text)
+    context_text = "\n---\n".join(
+        [f"Source: {url}\nContent: {content}" for url, content in snippets]
+    )
 
     return context_text, tavily_credits
 
@@ -71,7 +91,7 @@ def groq_json_formatter(context_text, area, city):
     )
 
     response = openai.chat.completions.create(
-        model="llama-3.1-8b-instant",
+        model=EXTRACTION_MODEL,
         messages=[{"role": "user", "content": prompt}],
         response_format={"type": "json_object"},
         temperature=0.0,  # Low temperature for strict extraction accuracy
@@ -86,11 +106,58 @@ def groq_json_formatter(context_text, area, city):
     return data.get("properties", []), usage
 
 
-def groq_ai_insight_prompt(
-    comps_sample, property_data, rating, breakdown, agent="GPT"
-):  # pylint: disable=R0913, R0914, R0917
-    """Groq gpt oss 120b"""
+THINK_BLOCK = re.compile(r"<think>.*?</think>", flags=re.DOTALL)
+
+
+def parse_json_content(content):
+    """
+    Parses a JSON object out of raw model output.
+    Streamed completions are not in JSON mode, so reasoning blocks and
+    stray text around the object are stripped first.
+    """
+    content = THINK_BLOCK.sub("", content)
+    start = content.find("{")
+    end = content.rfind("}")
+
+    if start == -1 or end < start:
+        raise ValueError("No JSON object found in model output")
+
+    return json.loads(content[start : end + 1])
+
+
+def stream_chat_completion(agent_model, messages, on_delta, temperature):
+    """
+    Streams a chat completion, calling on_delta with the accumulated
+    content every time a new token arrives.
+    """
+    stream = openai.chat.completions.create(
+        model=agent_model,
+        messages=messages,
+        temperature=temperature,
+        stream=True,
+        stream_options={"include_usage": True},
+    )
+
+    content = ""
+    usage = None
 
+    for chunk in stream:
+        if chunk.usage:
+            usage = chunk.usage
+
+        if not chunk.choices:
+            continue
+
+        delta = chunk.choices[0].delta.content
+        if delta:
+            content += delta
+            on_delta(content)
+
+    return content, usage
+
+
+def build_insight_prompt(comps_sample, property_data, rating, breakdown):
+    """User prompt of the insight completion."""
     title = property_data.get("title")
     price = property_data.get("price")
     sqft = property_data.get("area_sqft")
@@ -99,26 +166,12 @@ def groq_ai_insight_prompt(
 
     math_context = json.dumps(breakdown, indent=2)
 
-    system_role = (
-        "You are a Senior Real Estate Investment Analyst. You are reviewing a property "
-        "valuation generated by a regression algorithm. Your job is to translate raw "
-        "scoring data into a polished executive summary for an investor.\n\n"
-        "GUIDELINES:\n"
-        "1. TRANSLATE DEBUG LOGS: If you see remarks like 'sqft discarded' or 'more price', "
-        "understand this means the algorithm penalized the property for poor price-to-space "
-        "efficiency. Translate this to: 'Premium pricing relative to square footage utility'.\n"
-        "2. PRICE SENSITIVITY: If price_score is high, emphasize equity capture.\n"
-        "3. TONE: Professional, objective, and data-driven. "
-        "Do not use phrases like 'The algorithm says'.\n"
-        "4. DO NOT use internal developer terms like 'bed_final', 'pps_score', or 'remarks'."
-    )
-
-    user_prompt = (
+    return (
         f"PROPERTY UNDER REVIEW: {title}\n"
         f"Price: ${price:,} | {sqft} sqft | {beds} BR | {baths} BA\n\n"
         f"ALGORITHM DATA (Internal Metrics & Logic):\n{math_context}\n\n"
         f"COMPUTED RATING: {rating} / 5\n\n"
-        f"MARKET DATA (Comps): {json.dumps(comps_sample[:10])}\n\n"
+        f"MARKET DATA (Comps): {json.dumps(comps_sample)}\n\n"
         "TASK: Provide a JSON object with this exact structure:\n"
         "{\n"
         "  'weighted_analysis': 'A single string where each line represents a score adjustment. "
@@ -131,22 +184,75 @@ def groq_ai_insight_prompt(
         "}"
     )
 
+
+def groq_ai_insight_prompt(
+    comps_sample, property_data, rating, breakdown, agent="GPT", on_delta=None
+):  # pylint: disable=R0913, R0917
+    """
+    Groq gpt oss 120b.
+    If on_delta is given the completion is streamed and on_delta receives
+    the accumulated content as tokens arrive.
+    Identical inputs are served from the insight cache, usage is then None.
+    """
+    system_role = (
+        "You are a Senior Real Estate Investment Analyst. You are reviewing a property "
+        "valuation generated by a regression algorithm. Your job is to translate raw "
+        "scoring data into a polished executive summary for an investor.\n\n"
+        "GUIDELINES:\n"
+        "1. TRANSLATE DEBUG LOGS: If you see remarks like 'sqft discarded' or 'more price', "
+        "understand this means the algorithm penalized the property for poor price-to-space "
+        "efficiency. Translate this to: 'Premium pricing relative to square footage utility'.\n"
+        "2. PRICE SENSITIVITY: If price_score is high, emphasize equity capture.\n"
+        "3. TONE: Professional, objective, and data-driven. "
+        "Do not use phrases like 'The algorithm says'.\n"
+        "4. DO NOT use internal developer terms like 'bed_final', 'pps_score', or 'remarks'."
+    )
+
     if agent == "GPT":
         agent_model = "openai/gpt-oss-120b"
     else:
         agent_model = "qwen/qwen3-32b"
 
-    response = openai.chat.completions.create(
-        model=agent_model,
-        messages=[
-            {"role": "system", "content": system_role},
-            {"role": "user", "content": user_prompt},
-        ],
-        response_format={"type": "json_object"},
-        temperature=0.3,  # Lower temperature, more focus on math
+    # Nearest comps that fit the model's token budget
+    comps_sample = pack_comps(comps_sample, property_data, agent_model)
+
+    messages = [
+        {"role": "system", "content": system_role},
+        {
+            "role": "user",
+            "content": build_insight_prompt(
+                comps_sample, property_data, rating, breakdown
+            ),
+        },
+    ]
+
+    cache_key = insight_cache_key_for(
+        agent_model, system_role, comps_sample, property_data, rating, breakdown
     )
+    cached_insight = get_cached_insight(cache_key)
+    if cached_insight is not None:
+        if on_delta is not None:
+            on_delta(json.dumps(cached_insight))
+        return cached_insight, None
 
-    # Groq Credit Usage
-    usage = response.usage
+    if on_delta is not None:
+        # JSON mode is not available while streaming, the prompt enforces it
+        content, usage = stream_chat_completion(
+            agent_model, messages, on_delta, temperature=0.3
+        )
+        insight = parse_json_content(content)
+    else:
+        response = openai.chat.completions.create(
+            model=agent_model,
+            messages=messages,
+            response_format={"type": "json_object"},
+            temperature=0.3,  # Lower temperature, more focus on math
+        )
+
+        # Groq Credit Usage
+        usage = response.usage
+        insight = json.loads(response.choices[0].message.content)
+
+    set_cached_insight(cache_key, insight)
 
-    return json.loads(response.choices[0].message.content), usage
+    return insight, usage
@@ -0,0 +1,250 @@
+import time
+import random
+import threading
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+import redis
+from django.conf import settings
+from django.db import connection, connections
+from django.test import override_settings
+from django_redis import get_redis_connection
+from rest_framework.test import APIRequestFactory, force_authenticate
+from core_db_ai.models import User, Agent, Property, AIReport
+from backend_ai.celery import app
+from backend_ai.tracing import stage_metrics
+from .views import AIReportViewSet
+
+BENCH_PREFIX = "bench-report"
+CITIES = ["Springfield, IL", "Austin, TX", "Portland, OR", "Columbus, OH"]
+DONE = {AIReport.Status.COMPLETED, AIReport.Status.FAILED}
+
+
+def percentiles(values):
+    """p50 / p95 / max of a list of seconds, in milliseconds."""
+    if not values:
+        return {"p50_ms": None, "p95_ms": None, "max_ms": None}
+    values = np.array(values) * 1000
+    return {
+        "p50_ms": round(float(np.percentile(values, 50)), 1),
+        "p95_ms": round(float(np.percentile(values, 95)), 1),
+        "max_ms": round(float(values.max()), 1),
+    }
+
+
+def benchmark_user():
+    """
+    The user and agent every run requests its reports as. They are reused
+    rather than deleted, the user's group tables belong to the backend service.
+    """
+    user = User.objects.filter(slug=BENCH_PREFIX).first()
+    if user is None:
+        user = User.objects.create_user(
+            email=f"{BENCH_PREFIX}@example.com",
+            username=BENCH_PREFIX,
+            password=None,
+            first_name="Bench",
+            last_name="Runner",
+            slug=BENCH_PREFIX,
+        )
+    agent, _ = Agent.objects.get_or_create(
+        user=user, defaults={"company_name": "Bench", "bio": "Benchmark"}
+    )
+    return user, agent
+
+
+def seed_benchmark_data(count, seed=0):
+    """Benchmark user with count fresh properties to request reports for."""
+    rng = random.Random(seed)
+    run = f"{BENCH_PREFIX}-{int(time.time() * 1000)}"
+    user, agent = benchmark_user()
+    properties = Property.objects.bulk_create(
+        Property(
+            agent=agent,
+            title=f"Bench Property {i}",
+            description="Benchmark property",
+            beds=rng.randint(1, 5),
+            baths=rng.randint(1, 4),
+            price=rng.randint(150, 900) * 1000,
+            area_sqft=rng.randint(600, 3500),
+            address=f"{rng.randint(1, 999)} Main St, {rng.choice(CITIES)}",
+            slug=f"{run}-{i}",
+        )
+        for i in range(count)
+    )
+    return user, properties
+
+
+def cleanup_benchmark_data(properties):
+    """Removes the properties of a run and their reports, nothing cascades."""
+    AIReport.objects.filter(property__in=properties).delete()
+    Property.objects.filter(id__in=[prop.id for prop in properties]).delete()
+
+
+def submit_report(user, property_id, counter):
+    """
+    Creates a report through AIReportViewSet.create, like the frontend does.
+    In eager mode the whole pipeline runs inside this call.
+    """
+    request = APIRequestFactory().post(
+        "/reports/", {"property_id": property_id}, format="json"
+    )
+    force_authenticate(request, user=user)
+    # Throttling would reject most of a run, the pipeline is what is measured
+    view = AIReportViewSet.as_view({"post": "create"}, throttle_classes=[])
+
+    submitted = time.perf_counter()
+    try:
+        with connection.execute_wrapper(counter):
+            response = view(request)
+    finally:
+        # Worker threads must not leak connections
+        if not connections["default"].in_atomic_block:
+            connection.close()
+    return response.status_code, submitted
+
+
+def wait_for_reports(properties, expected, timeout, poll_interval=0.5):
+    """Polls until every report of the run finished, returns {id: finished_at}."""
+    finished = {}
+    deadline = time.perf_counter() + timeout
+
+    while len(finished) < expected and time.perf_counter() < deadline:
+        for report_id in AIReport.objects.filter(
+            property__in=properties, status__in=DONE
+        ).values_list("id", flat=True):
+            finished.setdefault(report_id, time.perf_counter())
+        if len(finished) < expected:
+            time.sleep(poll_interval)
+
+    return finished
+
+
+def redis_commands(client):
+    """Commands the Redis server processed so far, None if unavailable."""
+    try:
+        return client.info("stats")["total_commands_processed"]
+    except Exception:  # pylint: disable=W0718
+        return None
+
+
+def redis_clients():
+    """Cache and broker Redis clients, skipping the ones not in use."""
+    clients = {}
+    try:
+        clients["cache"] = get_redis_connection("default")
+    except NotImplementedError:
+        pass
+    if not app.conf.task_always_eager:
+        clients["broker"] = redis.Redis.from_url(settings.CELERY_BROKER_URL)
+    return clients
+
+
+class QueryCounter:
+    """Counts database queries across the submitting threads."""
+
+    def __init__(self):
+        self.count = 0
+        self.lock = threading.Lock()
+
+    def __call__(
+        self, execute, sql, params, many, context
+    ):  # pylint: disable=R0913, R0917
+        with self.lock:
+            self.count += 1
+        return execute(sql, params, many, context)
+
+
+@contextmanager
+def pipeline_mode(eager, live):
+    """
+    Runs the pipeline in-process (eager) with live or mock agents.
+    Without eager the running workers pick the agents from their own settings.
+    """
+    previous = (app.conf.task_always_eager, app.conf.task_eager_propagates)
+    app.conf.task_always_eager = eager
+    app.conf.task_eager_propagates = eager
+    try:
+        with override_settings(AI_AGENTS_LIVE=live):
+            yield
+    finally:
+        app.conf.task_always_eager, app.conf.task_eager_propagates = previous
+
+
+def run_benchmark(
+    reports, concurrency, eager=True, live=False, timeout=600, keep=False
+):  # pylint: disable=R0913, R0914, R0917
+    """
+    Requests reports for freshly seeded properties and waits for all of them.
+    Returns throughput, end-to-end and per-stage latency, and Redis / DB
+    operation counts as a JSON-serializable dict. DB queries are the ones of
+    this process, i.e. the whole pipeline in eager mode.
+    """
+    user, properties = seed_benchmark_data(reports)
+    counter = QueryCounter()
+
+    try:
+        with pipeline_mode(eager, live):
+            clients = redis_clients()
+            redis_before = {name: redis_commands(c) for name, c in clients.items()}
+            start = time.perf_counter()
+
+            if concurrency > 1:
+                with ThreadPoolExecutor(max_workers=concurrency) as executor:
+                    submissions = list(
+                        executor.map(
+                            lambda prop: submit_report(user, prop.id, counter),
+                            properties,
+                        )
+                    )
+            else:
+                submissions = [
+                    submit_report(user, prop.id, counter) for prop in properties
+                ]
+
+            accepted = {
+                prop.id: submitted
+                for prop, (code, submitted) in zip(properties, submissions)
+                if code == 202
+            }
+            finished = wait_for_reports(properties, len(accepted), timeout)
+            elapsed = time.perf_counter() - start
+
+            redis_after = {name: redis_commands(c) for name, c in clients.items()}
+
+        reports_qs = AIReport.objects.filter(property__in=properties)
+        report_rows = dict(reports_qs.values_list("id", "property_id"))
+        statuses = list(reports_qs.values_list("status", flat=True))
+        end_to_end = [
+            finished_at - accepted[report_rows[report_id]]
+            for report_id, finished_at in finished.items()
+        ]
+
+        return {
+            "config": {
+                "reports": reports,
+                "concurrency": concurrency,
+                "eager": eager,
+                "agents": ("live" if live else "mock") if eager else "workers",
+            },
+            "submitted": len(accepted),
+            "completed": statuses.count(AIReport.Status.COMPLETED),
+            "failed": statuses.count(AIReport.Status.FAILED),
+            "timed_out": len(accepted) - len(finished),
+            "elapsed_s": round(elapsed, 2),
+            "reports_per_minute": round(len(finished) / elapsed * 60, 2),
+            "end_to_end": percentiles(end_to_end),
+            "stages": stage_metrics(days=1, report_ids=list(report_rows)),
+            "db_queries": counter.count,
+            "redis_commands": {
+                name: (
+                    None
+                    if redis_before[name] is None or redis_after[name] is None
+                    else redis_after[name] - redis_before[name]
+                )
+                for name in clients
+            },
+        }
+    finally:
+        if not keep:
+            cleanup_benchmark_data(properties)
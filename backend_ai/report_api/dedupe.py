@@ -0,0 +1,128 @@
+import re
+import zlib
+import hashlib
+import numpy as np
+from django.conf import settings
+from django.core.cache import cache
+from celery.utils.log import get_task_logger
+
+logger = get_task_logger(__name__)
+
+WORD = re.compile(r"[a-z0-9$]+")
+SHINGLE_SIZE = 3
+
+# MinHash with 64 permutations split into 16 LSH bands of 4 rows
+NUM_PERMUTATIONS = 64
+BAND_ROWS = 4
+# Prime above 2**32, coefficients below 2**31 keep a * x + b inside uint64
+MERSENNE_PRIME = np.uint64(4294967311)
+# Fixed seed, every worker must draw the same permutations
+_rng = np.random.default_rng(20240601)
+PERM_A = _rng.integers(1, 2**31, NUM_PERMUTATIONS, dtype=np.uint64)
+PERM_B = _rng.integers(0, 2**31, NUM_PERMUTATIONS, dtype=np.uint64)
+
+
+def shingle_hashes(text):
+    """Stable 32-bit hashes of the word 3-grams of a snippet."""
+    words = WORD.findall(text.lower())
+    if len(words) < SHINGLE_SIZE:
+        shingles = [" ".join(words)]
+    else:
+        shingles = {
+            " ".join(words[i : i + SHINGLE_SIZE])
+            for i in range(len(words) - SHINGLE_SIZE + 1)
+        }
+    return np.array([zlib.crc32(s.encode()) for s in shingles], dtype=np.uint64)
+
+
+def minhash_signature(text):
+    """MinHash signature of a snippet, one minimum per permutation."""
+    hashes = shingle_hashes(text)
+    permuted = (PERM_A[:, None] * hashes[None, :] + PERM_B[:, None]) % MERSENNE_PRIME
+    return permuted.min(axis=1)
+
+
+def signature_bands(signature):
+    """LSH band digests, near-duplicates share at least one band."""
+    bands = signature.reshape(-1, BAND_ROWS)
+    return [
+        hashlib.blake2b(band.tobytes(), digest_size=8).hexdigest() for band in bands
+    ]
+
+
+class SnippetDeduplicator:
+    """
+    Drops near-duplicate snippets (estimated Jaccard >= threshold).
+    With a report_id the LSH index also lives in Redis, so snippets that
+    another search fork of the same report already kept are dropped too.
+    """
+
+    def __init__(self, report_id=None, fork=None):
+        self.prefix = f"snippet_lsh_{report_id}" if report_id else None
+        self.fork = fork
+        self.local_index = {}
+        self.threshold = settings.SNIPPET_DEDUP_THRESHOLD
+
+    def local_owner(self, key, signature):
+        """Signature of an earlier snippet of this fork sharing the band."""
+        owner = self.local_index.setdefault(key, signature)
+        return None if owner is signature else owner
+
+    def remote_owner(self, key, signature):
+        """
+        Signature of another fork's snippet sharing the band.
+        SET NX makes the first fork to see a listing its owner.
+        """
+        if not self.prefix:
+            return None
+
+        redis_key = f"{self.prefix}_{key}"
+        try:
+            value = {"fork": self.fork, "signature": signature.tolist()}
+            if cache.add(redis_key, value, settings.SNIPPET_DEDUP_TTL):
+                return None
+            owner = cache.get(redis_key)
+        except Exception as e:  # pylint: disable=W0718
+            logger.warning("Snippet index unavailable, deduplicating locally: %s", e)
+            self.prefix = None
+            return None
+
+        # A retried fork must not drop its own snippets
+        if not owner or owner["fork"] == self.fork:
+            return None
+        return np.array(owner["signature"], dtype=np.uint64)
+
+    def is_duplicate(self, text):
+        signature = minhash_signature(text)
+        duplicate = False
+
+        # Every band is claimed so later snippets can match this one too
+        for band_index, digest in enumerate(signature_bands(signature)):
+            key = f"{band_index}_{digest}"
+            for owner in (
+                self.local_owner(key, signature),
+                self.remote_owner(key, signature),
+            ):
+                if owner is not None and np.mean(owner == signature) >= self.threshold:
+                    duplicate = True
+
+        return duplicate
+
+
+def drop_duplicate_snippets(snippets, report_id=None, fork=None, key=None):
+    """
+    Snippets without near-duplicates among each other or in other forks.
+    key extracts the text to compare from a snippet.
+    """
+    deduplicator = SnippetDeduplicator(report_id, fork)
+    key = key or (lambda snippet: snippet)
+    unique = [
+        snippet for snippet in snippets if not deduplicator.is_duplicate(key(snippet))
+    ]
+
+    if len(unique) < len(snippets):
+        logger.info(
+            "Dropped %s duplicate snippets before extraction.",
+            len(snippets) - len(unique),
+        )
+    return unique
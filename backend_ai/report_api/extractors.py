@@ -0,0 +1,159 @@
+import re
+import time
+
+# Listing fields as they appear on Zillow / Redfin / homes.com cards,
+# e.g. "$612,000 · 3 bds · 2 ba · 1,850 sqft"
+PRICE = re.compile(
+    r"\$\s?(?P<value>\d{1,3}(?:,\d{3})+|\d+(?:\.\d+)?)\s?(?P<scale>[KkMm]\b)?"
+    r"(?P<rent>\s?(?:/\s?mo\b|/\s?month\b|per month\b))?"
+)
+BEDS = re.compile(r"(?P<value>\d{1,2})\s?-?\s?(?:bds?|beds?|bedrooms?|br)\b", re.I)
+BATHS = re.compile(
+    r"(?P<value>\d{1,2}(?:\.\d)?)\s?-?\s?(?:ba|baths?|bathrooms?)\b", re.I
+)
+SQFT = re.compile(
+    r"(?P<value>\d{1,3}(?:,\d{3})+|\d{3,6})\s?-?\s?"
+    r"(?:sq\.?\s?ft\.?|sqft|square\s(?:feet|foot)|sf)\b",
+    re.I,
+)
+LOT = re.compile(r"\blot\b", re.I)
+FIELD_PATTERNS = {"price": PRICE, "beds": BEDS, "baths": BATHS, "area_sqft": SQFT}
+
+# Plausible ranges, anything outside is a misread
+FIELD_RANGES = {
+    "price": (10_000, 50_000_000),
+    "beds": (1, 20),
+    "baths": (1, 20),
+    "area_sqft": (200, 50_000),
+}
+PPS_RANGE = (20, 5_000)
+# Fields of one listing card sit close together
+MAX_RECORD_SPAN = 160
+
+
+def parse_field(field, match):
+    """Numeric value of a field match, None for rents."""
+    value = float(match.group("value").replace(",", ""))
+    if field == "price":
+        if match.group("rent"):
+            return None
+        scale = match.group("scale")
+        if scale:
+            value *= 1_000 if scale.lower() == "k" else 1_000_000
+    return value
+
+
+def field_matches(text):
+    """All field matches of a chunk ordered by position."""
+    matches = []
+    for field, pattern in FIELD_PATTERNS.items():
+        for match in pattern.finditer(text):
+            if field == "area_sqft" and LOT.search(
+                text[max(0, match.start() - 12) : match.end() + 6]
+            ):
+                # Lot size, not living area
+                continue
+            matches.append(
+                (match.start(), match.end(), field, parse_field(field, match))
+            )
+    return sorted(matches)
+
+
+def record_confidence(record, span):
+    """Confidence of a complete record, 0 if it cannot be a real listing."""
+    for field, (low, high) in FIELD_RANGES.items():
+        if not low <= record[field] <= high:
+            return 0.0
+
+    confidence = 1.0
+    pps = record["price"] / record["area_sqft"]
+    if not PPS_RANGE[0] <= pps <= PPS_RANGE[1]:
+        confidence -= 0.5
+    if span > MAX_RECORD_SPAN:
+        confidence -= 0.3
+    if record["baths"] > record["beds"] + 2:
+        confidence -= 0.2
+    return max(confidence, 0.0)
+
+
+def extract_listings(text):
+    """
+    Parses listing cards out of a chunk.
+    Returns (properties, confidence). Confidence is 0 when nothing reliable
+    was found and drops when price mentions are left without a listing,
+    so those chunks can be sent to the LLM instead.
+    """
+    properties = []
+    confidences = []
+    prices = 0
+    record, start = {}, None
+
+    def close(end):
+        if len(record) == len(FIELD_PATTERNS) and None not in record.values():
+            confidence = record_confidence(record, end - start)
+            if confidence > 0:
+                properties.append(
+                    {
+                        "price": int(record["price"]),
+                        "area_sqft": int(record["area_sqft"]),
+                        "beds": int(record["beds"]),
+                        "baths": record["baths"],
+                    }
+                )
+                confidences.append(confidence)
+
+    last_end = 0
+    for match_start, match_end, field, value in field_matches(text):
+        if field == "price" and value is not None:
+            prices += 1
+        # A repeated field starts the next listing card
+        if field in record:
+            close(last_end)
+            record, start = {}, None
+        if start is None:
+            start = match_start
+        record[field] = value
+        last_end = match_end
+    close(last_end)
+
+    if not properties:
+        return [], 0.0
+
+    for item in properties:
+        if item["baths"] == int(item["baths"]):
+            item["baths"] = int(item["baths"])
+
+    coverage = len(properties) / max(len(properties), prices)
+    return properties, sum(confidences) / len(confidences) * coverage
+
+
+def evaluate_extraction(cases, min_confidence):
+    """
+    Offline accuracy of the extractor on captured chunks.
+    cases: [{"chunk": str, "expected": [property, ...]}]
+    """
+    chunks = confident = predicted = correct = expected = 0
+    start = time.perf_counter()
+
+    for case in cases:
+        chunks += 1
+        truth = [tuple(sorted(item.items())) for item in case["expected"]]
+        expected += len(truth)
+
+        properties, confidence = extract_listings(case["chunk"])
+        if confidence < min_confidence:
+            continue
+
+        confident += 1
+        predicted += len(properties)
+        correct += sum(1 for item in properties if tuple(sorted(item.items())) in truth)
+
+    elapsed = time.perf_counter() - start
+    return {
+        "chunks": chunks,
+        "llm_calls_saved": confident,
+        "llm_call_reduction": confident / chunks if chunks else 0.0,
+        "precision": correct / predicted if predicted else 1.0,
+        "recall": correct / expected if expected else 1.0,
+        "ms_per_chunk": elapsed * 1000 / chunks if chunks else 0.0,
+    }
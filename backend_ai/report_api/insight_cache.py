@@ -0,0 +1,99 @@
+import time
+import json
+import hashlib
+from django.conf import settings
+from django.core.cache import cache
+from django_redis import get_redis_connection
+from celery.utils.log import get_task_logger
+
+logger = get_task_logger(__name__)
+
+# Sorted set of cached insight keys scored by insert time, used for eviction
+INSIGHT_INDEX_KEY = "llm_insight_index"
+
+
+def round_numbers(value, ndigits=2):
+    """Rounds every float inside nested dicts / lists so tiny noise hits the cache."""
+    if isinstance(value, dict):
+        return {key: round_numbers(item, ndigits) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [round_numbers(item, ndigits) for item in value]
+    if isinstance(value, float):
+        return round(value, ndigits)
+    return value
+
+
+def insight_cache_key(model, messages):
+    """Content address of a completion: sha256 of the canonical model and messages."""
+    canonical = json.dumps(
+        {"model": model, "messages": messages},
+        sort_keys=True,
+        separators=(",", ":"),
+        default=str,
+    )
+    return f"llm_insight_{hashlib.sha256(canonical.encode()).hexdigest()}"
+
+
+def insight_cache_key_for(
+    agent_model, system_role, comps, property_data, rating, breakdown
+):  # pylint: disable=R0913, R0917
+    """
+    Cache key of an insight completion. Numbers are rounded so float noise
+    in the scoring still hits the cache.
+    """
+    return insight_cache_key(
+        agent_model,
+        [
+            system_role,
+            round_numbers(
+                {
+                    "comps": comps,
+                    "property_data": property_data,
+                    "rating": rating,
+                    "breakdown": breakdown,
+                }
+            ),
+        ],
+    )
+
+
+def get_cached_insight(key):
+    """Cached insight or None. Cache errors count as a miss."""
+    try:
+        return cache.get(key)
+    except Exception as e:  # pylint: disable=W0718
+        logger.warning("Insight cache read failed: %s", e)
+        return None
+
+
+def set_cached_insight(key, insight):
+    """Stores an insight with a TTL and evicts the oldest past the size limit."""
+    try:
+        cache.set(key, insight, timeout=settings.LLM_INSIGHT_CACHE_TTL)
+        evict_insights(key)
+    except Exception as e:  # pylint: disable=W0718
+        logger.warning("Insight cache write failed: %s", e)
+
+
+def evict_insights(key):
+    """Keeps at most LLM_INSIGHT_CACHE_MAX_ENTRIES insights in Redis."""
+    try:
+        redis = get_redis_connection("default")
+    except NotImplementedError:
+        # Non Redis caches (tests) cull entries on their own
+        return
+
+    now = time.time()
+    index = cache.make_key(INSIGHT_INDEX_KEY)
+
+    pipe = redis.pipeline()
+    pipe.zadd(index, {cache.make_key(key): now})
+    # Drop index entries whose insight already expired
+    pipe.zremrangebyscore(index, 0, now - settings.LLM_INSIGHT_CACHE_TTL)
+    pipe.zcard(index)
+    size = pipe.execute()[-1]
+
+    overflow = size - settings.LLM_INSIGHT_CACHE_MAX_ENTRIES
+    if overflow > 0:
+        oldest = [member for member, _ in redis.zpopmin(index, overflow)]
+        redis.delete(*oldest)
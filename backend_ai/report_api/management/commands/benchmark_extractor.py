@@ -0,0 +1,53 @@
+import json
+from pathlib import Path
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from report_api.extractors import evaluate_extraction
+
+DEFAULT_FIXTURES = (
+    Path(__file__).resolve().parents[2] / "tests" / "fixtures" / "listing_chunks.json"
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Measures the regex extractor on captured search chunks: accuracy of the "
+        "chunks it handles and LLM extraction calls saved."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--fixtures",
+            default=str(DEFAULT_FIXTURES),
+            help='JSON list of {"chunk": ..., "expected": [...]} cases.',
+        )
+        parser.add_argument(
+            "--min-confidence",
+            type=float,
+            default=settings.EXTRACTOR_MIN_CONFIDENCE,
+            help="Confidence needed to skip the LLM.",
+        )
+
+    def handle(self, *args, **options):
+        try:
+            cases = json.loads(Path(options["fixtures"]).read_text())
+        except (OSError, ValueError) as e:
+            raise CommandError(f"Could not load fixtures: {e}") from e
+
+        metrics = evaluate_extraction(cases, options["min_confidence"])
+
+        self.stdout.write(f"Chunks: {metrics['chunks']}")
+        self.stdout.write(
+            f"LLM calls saved: {metrics['llm_calls_saved']} "
+            f"({metrics['llm_call_reduction']:.0%})"
+        )
+        self.stdout.write(f"Precision: {metrics['precision']:.2%}")
+        self.stdout.write(f"Recall: {metrics['recall']:.2%}")
+        self.stdout.write(f"Time per chunk: {metrics['ms_per_chunk']:.3f} ms")
+
+        if metrics["precision"] < 1.0:
+            self.stdout.write(
+                self.style.WARNING("Confident chunks contain extraction errors.")
+            )
+        else:
+            self.stdout.write(self.style.SUCCESS("✅ Confident chunks are exact."))
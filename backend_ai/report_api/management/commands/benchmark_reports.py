@@ -0,0 +1,88 @@
+import json
+import subprocess
+from pathlib import Path
+from django.core.management.base import BaseCommand, CommandError
+from report_api.benchmark import run_benchmark
+
+
+def current_commit():
+    """Commit the benchmark ran on, so runs can be compared across commits."""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+            timeout=5,
+        ).stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+class Command(BaseCommand):
+    help = (
+        "Seeds properties, requests AI reports for them concurrently and waits "
+        "for completion. Prints throughput, end-to-end and per-stage latency and "
+        "Redis / DB operation counts as JSON."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--reports", type=int, default=20, help="Reports to request."
+        )
+        parser.add_argument(
+            "--concurrency",
+            type=int,
+            default=4,
+            help="Report requests in flight at once.",
+        )
+        parser.add_argument(
+            "--eager",
+            action="store_true",
+            help="Run the pipeline in this process instead of on the workers.",
+        )
+        parser.add_argument(
+            "--agents",
+            choices=["mock", "live"],
+            default="mock",
+            help=(
+                "Eager mode only: mock tasks, or the live pipeline "
+                "(point GROQ_BASE_URL / TAVILY_BASE_URL at the ai-standin)."
+            ),
+        )
+        parser.add_argument(
+            "--timeout",
+            type=float,
+            default=600,
+            help="Seconds to wait for the reports to finish.",
+        )
+        parser.add_argument(
+            "--keep", action="store_true", help="Keep the seeded data and reports."
+        )
+        parser.add_argument("--output", help="Write the JSON here instead of stdout.")
+
+    def handle(self, *args, **options):
+        if options["reports"] < 1 or options["concurrency"] < 1:
+            raise CommandError("--reports and --concurrency must be at least 1.")
+
+        result = run_benchmark(
+            options["reports"],
+            options["concurrency"],
+            eager=options["eager"],
+            live=options["agents"] == "live",
+            timeout=options["timeout"],
+            keep=options["keep"],
+        )
+        result = {"commit": current_commit(), **result}
+        output = json.dumps(result, indent=2)
+
+        if options["output"]:
+            Path(options["output"]).write_text(output + "\n")
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"✅ {result['reports_per_minute']} reports/min, "
+                    f"written to {options['output']}"
+                )
+            )
+        else:
+            self.stdout.write(output)
@@ -0,0 +1,107 @@
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+import django
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from tqdm import tqdm
+from report_api.regression_model import REGRESSION_ENGINES
+from report_api.rescoring import (
+    rescorable_reports,
+    report_id_batches,
+    load_report_rows,
+    rescore_rows,
+    save_scores,
+)
+from report_api.tasks import rescore_all_reports
+
+
+class Command(BaseCommand):
+    help = "Re-scores stored AI Reports from their comparables without any LLM calls."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=200,
+            help="Reports loaded, scored and updated per batch.",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=os.cpu_count(),
+            help="Processes scoring the batches.",
+        )
+        parser.add_argument(
+            "--engine",
+            choices=REGRESSION_ENGINES,
+            default=settings.REGRESSION_ENGINE,
+            help="Regression engine used for the new ratings.",
+        )
+        parser.add_argument(
+            "--async",
+            action="store_true",
+            dest="run_async",
+            help="Dispatch the batches to the Celery workers instead.",
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+
+        if options["run_async"]:
+            group_id = rescore_all_reports.delay(batch_size)
+            self.stdout.write(
+                self.style.SUCCESS(f"✅ Re-scoring dispatched to Celery ({group_id}).")
+            )
+            return
+
+        queryset = rescorable_reports()
+        total = queryset.count()
+
+        if total == 0:
+            self.stdout.write(self.style.WARNING("No completed reports to re-score."))
+            return
+
+        workers = max(1, options["workers"])
+        self.stdout.write(
+            self.style.NOTICE(
+                f"Re-scoring {total} reports in batches of {batch_size} "
+                f"on {workers} processes..."
+            )
+        )
+
+        start = time.perf_counter()
+        updated = 0
+
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=django.setup
+        ) as pool, tqdm(total=total, unit="report", file=self.stderr) as progress:
+            pending = {}
+
+            def collect(futures):
+                count = 0
+                for future in futures:
+                    count += save_scores(future.result(), batch_size)
+                    progress.update(pending.pop(future))
+                return count
+
+            for report_ids in report_id_batches(queryset, batch_size):
+                # Keep a bounded number of batches in flight
+                if len(pending) >= workers * 2:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    updated += collect(done)
+
+                rows = load_report_rows(report_ids)
+                future = pool.submit(rescore_rows, rows, options["engine"])
+                pending[future] = len(report_ids)
+
+            done, _ = wait(pending)
+            updated += collect(done)
+
+        elapsed = time.perf_counter() - start
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"✅ Re-scored {updated} reports in {elapsed:.2f}s "
+                f"({updated / elapsed:.1f} reports/s)."
+            )
+        )
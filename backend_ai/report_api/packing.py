@@ -0,0 +1,137 @@
+import json
+from functools import lru_cache
+import numpy as np
+import tiktoken
+from django.conf import settings
+from celery.utils.log import get_task_logger
+
+logger = get_task_logger(__name__)
+
+SOURCE_SEPARATOR = "\n---\n"
+# Rough size of a token when the tokenizer is unavailable
+CHARS_PER_TOKEN = 4
+
+
+@lru_cache(maxsize=1)
+def get_encoding():
+    """
+    Tokenizer used to measure prompts, loaded once per worker.
+    Groq models have their own tokenizers, o200k_base is a close proxy.
+    Returns None if the encoding cannot be loaded (e.g. offline).
+    """
+    try:
+        return tiktoken.get_encoding(settings.LLM_TOKEN_ENCODING)
+    except Exception as e:  # pylint: disable=W0718
+        logger.warning("Tokenizer unavailable, estimating token counts: %s", e)
+        return None
+
+
+def count_tokens(text):
+    """Number of tokens of text."""
+    encoding = get_encoding()
+    if encoding is None:
+        return -(-len(text) // CHARS_PER_TOKEN)
+    return len(encoding.encode(text, disallowed_special=()))
+
+
+def token_budget(model):
+    """Prompt tokens available for packed context on a model."""
+    return settings.LLM_CONTEXT_TOKEN_BUDGETS.get(
+        model, settings.LLM_DEFAULT_CONTEXT_TOKEN_BUDGET
+    )
+
+
+def split_by_tokens(text, budget):
+    """Hard split of a single segment that is bigger than the budget."""
+    encoding = get_encoding()
+    if encoding is None:
+        size = budget * CHARS_PER_TOKEN
+        return [text[i : i + size] for i in range(0, len(text), size)]
+
+    tokens = encoding.encode(text, disallowed_special=())
+    return [
+        encoding.decode(tokens[i : i + budget]) for i in range(0, len(tokens), budget)
+    ]
+
+
+def split_context_tokens(text, model):
+    """
+    Token-aware version of split_context.
+    Packs \n---\n separated sources into as few chunks as the model's token
+    budget allows, sources are only broken up when one alone exceeds it.
+    """
+    if not text:
+        return []
+
+    budget = token_budget(model)
+    separator_tokens = count_tokens(SOURCE_SEPARATOR)
+
+    chunks = []
+    current = []
+    current_tokens = 0
+
+    for segment in text.split(SOURCE_SEPARATOR):
+        segment_tokens = count_tokens(segment)
+
+        if current and current_tokens + separator_tokens + segment_tokens > budget:
+            chunks.append(SOURCE_SEPARATOR.join(current).strip())
+            current, current_tokens = [], 0
+
+        if segment_tokens > budget:
+            chunks.extend(split_by_tokens(segment, budget))
+            continue
+
+        if current:
+            current_tokens += separator_tokens
+        current.append(segment)
+        current_tokens += segment_tokens
+
+    if current:
+        chunks.append(SOURCE_SEPARATOR.join(current).strip())
+
+    return [chunk for chunk in chunks if chunk]
+
+
+def nearest_comps(comps, property_data):
+    """
+    Comparables ordered by similarity to the subject property.
+    Distance is the relative difference in area_sqft, beds and baths,
+    comps with missing values go last.
+    """
+    if not comps:
+        return []
+
+    features = ["area_sqft", "beds", "baths"]
+    subject = np.array([float(property_data.get(feature) or 0) for feature in features])
+    values = np.array(
+        [
+            [
+                np.nan if comp.get(feature) is None else comp[feature]
+                for feature in features
+            ]
+            for comp in comps
+        ],
+        dtype=float,
+    )
+
+    scale = np.where(subject > 0, subject, 1.0)
+    distance = np.sum(((values - subject) / scale) ** 2, axis=1)
+    distance = np.where(np.isnan(distance), np.inf, distance)
+
+    return [comps[i] for i in np.argsort(distance, kind="stable")]
+
+
+def pack_comps(comps, property_data, model):
+    """Nearest comparables that fit into the model's token budget."""
+    budget = token_budget(model)
+    packed = []
+    used = 2  # List brackets
+
+    for comp in nearest_comps(comps, property_data):
+        comp_tokens = count_tokens(json.dumps(comp)) + 1  # Separator
+        if used + comp_tokens > budget:
+            break
+        packed.append(comp)
+        used += comp_tokens
+
+    return packed
@@ -1,32 +1,88 @@
-import pandas as pd
 import numpy as np
-from sklearn.linear_model import LinearRegression
-from sklearn.impute import SimpleImputer
+from django.conf import settings
 from .utils import (
     calculate_market_adjustments,
+    calculate_market_adjustments_np,
     generate_price_score,
     generate_space_efficiency,
     generate_bed_score,
     generate_bath_score,
+    nan_median,
 )
 
+REGRESSION_ENGINES = ("numpy", "sklearn")
 
-class InvestmentRegressor:  # pylint: disable=R0902
-    def __init__(
-        self, avg_price, avg_pps, avg_beds, avg_baths, min_samples=10
-    ):  # pylint: disable=R0913, R0917
-        self.avg_price = avg_price
-        self.avg_pps = avg_pps
-        self.avg_beds = avg_beds
-        self.avg_baths = avg_baths
-        self.avg_sqft = avg_price / avg_pps
+
+def fit_least_squares(X, y):
+    """
+    Closed-form OLS with an intercept, same solution as sklearn's LinearRegression.
+    Centers the data and solves the 3-feature system with lstsq.
+    """
+    X_offset = X.mean(axis=0)
+    y_offset = y.mean()
+    coef, *_ = np.linalg.lstsq(X - X_offset, y - y_offset, rcond=None)
+    intercept = y_offset - X_offset @ coef
+
+    return intercept, coef
+
+
+def to_json_float(value):
+    """Plain float for the stored model, None for NaN / inf (not valid JSON)."""
+    value = float(value)
+    return value if np.isfinite(value) else None
+
+
+def from_json_float(value):
+    """Inverse of to_json_float."""
+    return np.nan if value is None else value
+
+
+class MarketModelFitter:
+    """
+    Fits the comparables of a report once into a compact market model.
+    The model is plain JSON so it can be stored on the report and scored later
+    without touching the comparables again.
+    """
+
+    def __init__(self, min_samples=10, engine=None):
         self.min_samples = min_samples
         self.features = ["area_sqft", "beds", "baths"]
-        self.imputer = SimpleImputer(strategy="median")
-        self.model = LinearRegression()
+        self.engine = engine or settings.REGRESSION_ENGINE
+
+        if self.engine not in REGRESSION_ENGINES:
+            raise ValueError(f"Unknown regression engine: {self.engine}")
+
+        if self.engine == "sklearn":
+            # Imported lazily so the NumPy engine never loads pandas or sklearn
+            # pylint: disable=C0415
+            from sklearn.impute import SimpleImputer
+            from sklearn.linear_model import LinearRegression
+
+            self.imputer = SimpleImputer(strategy="median")
+            self.model = LinearRegression()
+
+    def load_data(self, compiled_data):
+        """Dataset of the comparables for the selected engine."""
+        if self.engine == "sklearn":
+            import pandas as pd  # pylint: disable=C0415
+
+            return pd.DataFrame(compiled_data)
+
+        # [price, area_sqft, beds, baths] matrix, NaN marks a missing value
+        columns = ["price"] + self.features
+        return np.array(
+            [
+                [np.nan if item.get(col) is None else item.get(col) for col in columns]
+                for item in compiled_data
+            ],
+            dtype=float,
+        ).reshape(-1, len(columns))
 
     def clean_data(self, df):
         """Removes properties without prices and handles missing feature data."""
+        if self.engine == "numpy":
+            return self.clean_matrix(df)
+
         # Remove properties without prices
         df = df.dropna(subset=["price"])
 
@@ -35,11 +91,96 @@ class InvestmentRegressor:  # pylint: disable=R0902
 
         # Handle missing feature data
         X = self.imputer.fit_transform(df[self.features])
-        y = df["price"]
+        y = df["price"].to_numpy(dtype=float)
+
+        return X, y, self.imputer.statistics_
+
+    def clean_matrix(self, data):
+        """NumPy version of clean_data working on the load_data matrix."""
+        # Remove properties without prices
+        data = data[~np.isnan(data[:, 0])]
+
+        if len(data) < self.min_samples:
+            return None
+
+        # Handle missing feature data with the column median
+        X = data[:, 1:].copy()
+        medians = []
+        for col, feature in enumerate(self.features):
+            median = nan_median(X[:, col])
+            if np.isnan(median):
+                raise ValueError(f"No comparable has a value for {feature}")
+            X[np.isnan(X[:, col]), col] = median
+            medians.append(median)
+
+        y = data[:, 0]
+
+        return X, y, np.array(medians)
+
+    def market_adjustments(self, data):
+        """Market adjustments of the raw comparables for the selected engine."""
+        if self.engine == "sklearn":
+            return calculate_market_adjustments(data)
+
+        return calculate_market_adjustments_np(data[:, 0], data[:, 1], data[:, 2])
+
+    def fit_regression(self, X, y):
+        """Intercept and coefficients of the price regression."""
+        if self.engine == "sklearn":
+            self.model.fit(X, y)
+            return self.model.intercept_, self.model.coef_
+
+        return fit_least_squares(X, y)
+
+    def fit(self, compiled_data):
+        """Fitted market model of the comparables, None if there are too few."""
+        if not compiled_data:
+            return None
+
+        data = self.load_data(compiled_data)
+
+        cleaned = self.clean_data(data)
+
+        if cleaned is None:
+            return None
+
+        X, y, medians = cleaned
+        intercept, coef = self.fit_regression(X, y)
+
+        if len(coef) != len(self.features):
+            raise ValueError("Regression dropped a feature without any values")
+
+        # Price Volatility
+        pps_series = y / X[:, 0]
+        pps_series = pps_series[~np.isnan(pps_series)]
+        volatility = pps_series.std(ddof=1) / pps_series.mean()
+
+        adjustments = self.market_adjustments(data)
+
+        return {
+            "n": len(y),
+            "intercept": to_json_float(intercept),
+            "coef": [to_json_float(value) for value in coef],
+            "medians": [to_json_float(value) for value in medians],
+            "volatility": to_json_float(volatility),
+            "adjustments": {
+                key: to_json_float(value) for key, value in adjustments.items()
+            },
+        }
+
 
-        return X, y
+class InvestmentRegressor(MarketModelFitter):  # pylint: disable=R0902
+    def __init__(
+        self, avg_price, avg_pps, avg_beds, avg_baths, min_samples=10, engine=None
+    ):  # pylint: disable=R0913, R0917
+        super().__init__(min_samples=min_samples, engine=engine)
+        self.avg_price = avg_price
+        self.avg_pps = avg_pps
+        self.avg_beds = avg_beds
+        self.avg_baths = avg_baths
+        self.avg_sqft = avg_price / avg_pps
 
-    def calculate_rating(self, compiled_data, property_data):  # pylint: disable=R0914
+    def calculate_rating(self, compiled_data, property_data):
         """Main entry point to get the 0.0 - 5.0 score."""
         area_sqft = float(property_data.get("area_sqft"))
         beds = int(property_data.get("beds"))
@@ -49,18 +190,37 @@ class InvestmentRegressor:  # pylint: disable=R0902
         if not compiled_data or price == 0 or area_sqft == 0 or beds == 0 or baths == 0:
             return 2.5, {}
 
-        # Convert to dataframe
-        df = pd.DataFrame(compiled_data)
+        return self.score(self.fit(compiled_data), property_data)
 
-        x_y = self.clean_data(df)
+    def rate(self, compiled_data, property_data):
+        """
+        Fits the market model once and scores the property against it.
+        Returns (rating, breakdown, market_model), raises on an empty rating.
+        """
+        market_model = self.fit(compiled_data)
+        rating, breakdown = self.score(market_model, property_data)
+        if not rating or not breakdown:
+            raise ValueError("Empty rating or breakdown generated")
+        return rating, breakdown, market_model
 
-        if x_y is None:
-            return 2.5, {}
+    def score(self, market_model, property_data):  # pylint: disable=R0914
+        """
+        Scores a property against a stored market model.
+        Only evaluates the model, the comparables are not needed.
+        """
+        area_sqft = float(property_data.get("area_sqft"))
+        beds = int(property_data.get("beds"))
+        baths = int(property_data.get("baths"))
+        price = float(property_data.get("price"))
 
-        X, y = x_y
+        if not market_model or price == 0 or area_sqft == 0 or beds == 0 or baths == 0:
+            return 2.5, {}
 
-        if area_sqft > (self.avg_sqft * 1.15) and beds > self.avg_bed:
-            adjustments = calculate_market_adjustments(df)
+        if area_sqft > (self.avg_sqft * 1.15) and beds > self.avg_beds:
+            adjustments = {
+                key: from_json_float(value)
+                for key, value in market_model["adjustments"].items()
+            }
             self.avg_pps = adjustments["avg_pps"]
 
             sqft_gap = area_sqft - self.avg_sqft
@@ -76,12 +236,12 @@ class InvestmentRegressor:  # pylint: disable=R0902
             )
             market_superiority = 0.3
         else:
-            # Train the model
-            self.model.fit(X, y)
-
             # Subject and prediction
-            subject_X = np.array([[area_sqft, beds, baths]])
-            predicted_price = self.model.predict(subject_X)[0]
+            coef = np.array([from_json_float(value) for value in market_model["coef"]])
+            subject_X = np.array([area_sqft, beds, baths])
+            predicted_price = from_json_float(market_model["intercept"]) + (
+                subject_X @ coef
+            )
             market_superiority = 0
 
         price_score, price_remarks = generate_price_score(price, predicted_price)
@@ -113,8 +273,7 @@ class InvestmentRegressor:  # pylint: disable=R0902
         # pylint: enable=R0801
 
         # Price Volatility
-        pps_series = y / X[:, 0]
-        volatility = pps_series.std() / pps_series.mean()
+        volatility = from_json_float(market_model["volatility"])
         market_stability = -0.4 if volatility > 0.15 else 0.2
 
         # Model layout score
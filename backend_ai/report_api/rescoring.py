@@ -0,0 +1,103 @@
+from decimal import Decimal
+from celery.utils.log import get_task_logger
+from core_db_ai.models import AIReport
+from .regression_model import InvestmentRegressor
+
+logger = get_task_logger(__name__)
+
+RESCORE_FIELDS = (
+    "id",
+    "comparable_data",
+    "avg_market_price",
+    "avg_price_per_sqft",
+    "avg_beds",
+    "avg_baths",
+    "property__price",
+    "property__area_sqft",
+    "property__beds",
+    "property__baths",
+)
+
+
+def rescorable_reports():
+    """Completed reports with stored comparables and market averages."""
+    return AIReport.objects.filter(
+        status=AIReport.Status.COMPLETED,
+        comparable_data__isnull=False,
+        avg_market_price__gt=0,
+        avg_price_per_sqft__gt=0,
+        avg_beds__gt=0,
+        avg_baths__gt=0,
+    ).order_by("id")
+
+
+def report_id_batches(queryset, batch_size):
+    """Streams the report ids in batches, rows are loaded one batch at a time."""
+    batch = []
+    for report_id in queryset.values_list("id", flat=True).iterator(
+        chunk_size=batch_size
+    ):
+        batch.append(report_id)
+        if len(batch) == batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def load_report_rows(report_ids):
+    """Plain tuples of everything the regressor needs, cheap to send to a worker."""
+    return list(AIReport.objects.filter(id__in=report_ids).values_list(*RESCORE_FIELDS))
+
+
+def rescore_row(row, engine=None):
+    """
+    Fits and scores one report row with the given regression engine.
+    A failed rating scores 0 without a model, like in the report pipeline.
+    """
+    (
+        report_id,
+        compiled_data,
+        avg_price,
+        avg_pps,
+        avg_beds,
+        avg_baths,
+        *property_values,
+    ) = row
+    property_data = dict(zip(["price", "area_sqft", "beds", "baths"], property_values))
+
+    try:
+        regressor = InvestmentRegressor(
+            float(avg_price), float(avg_pps), avg_beds, avg_baths, engine=engine
+        )
+        rating, _, market_model = regressor.rate(compiled_data, property_data)
+    except Exception as e:  # pylint: disable=W0718
+        logger.warning("Report %s rating error: %s", report_id, e)
+        return report_id, 0, None
+
+    return report_id, rating, market_model
+
+
+def rescore_rows(rows, engine=None):
+    """
+    Re-scores report rows from their stored comparables.
+    Only runs the regression, no LLM calls.
+    Returns (report_id, rating, market_model) for every row.
+    """
+    return [rescore_row(row, engine) for row in rows]
+
+
+def save_scores(results, batch_size=500):
+    """Writes the new ratings and market models with a single bulk_update."""
+    reports = [
+        AIReport(
+            id=report_id,
+            investment_rating=Decimal(str(rating)),
+            market_model=market_model,
+        )
+        for report_id, rating, market_model in results
+    ]
+    AIReport.objects.bulk_update(
+        reports, ["investment_rating", "market_model"], batch_size=batch_size
+    )
+    return len(reports)
@@ -1,17 +1,32 @@
-# import time
-# import random
-from celery import shared_task, chord, chain
+import time
+import random
+from celery import shared_task, chord, chain, group
 from celery.utils.log import get_task_logger
-
-# from celery.exceptions import MaxRetriesExceededError
-from core_db_ai.models import AIReport
-
-# from .agents import tavily_search, groq_json_formatter, groq_ai_insight_prompt
-# from .regression_model import InvestmentRegressor
+from celery.exceptions import MaxRetriesExceededError
+from django.conf import settings
+from core_db_ai.models import AIReport, PipelineSpan
+from backend_ai.claim_check import store_payload, load_payload
+from backend_ai.tracing import span
+
+from .agents import (
+    EXTRACTION_MODEL,
+    tavily_search,
+    groq_json_formatter,
+    groq_ai_insight_prompt,
+)
+from .extractors import extract_listings
+from .packing import split_context_tokens
+from .regression_model import InvestmentRegressor, MarketModelFitter
+from .rescoring import (
+    rescorable_reports,
+    report_id_batches,
+    load_report_rows,
+    rescore_rows,
+    save_scores,
+)
 from .utils import (
-    # split_context,
-    clean_properties,
-    # average_prices_beds_baths,
+    clean_properties_batch,
+    average_prices_beds_baths,
     generate_mock_summary,
     generate_mock_properties,
 )
@@ -30,163 +45,184 @@ def search_properties(
     area_sqft = property_data.get("area_sqft")
     beds = property_data.get("beds")
     baths = property_data.get("baths")
-    return generate_mock_properties(area_sqft, beds, baths, count)
-
-
-# @shared_task(
-#     bind=True,
-#     rate_limit="15/m",  # Max 15 calls/m to avoid Groq 429s
-#     max_retries=5,
-#     default_retry_delay=61,  # Groq hits a limit, wait for full minute reset
-#     retry_jitter=False,  # Predictable 61s wait, no randomness needed
-#     autoretry_for=(),
-# )
-# def search_properties(
-#     self,
-#     report_id,
-#     property_data,
-#     count,
-#     seed_index,
-#     existing_context=None,
-#     final_properties=None,
-#     completed_chunks=None,
-# ):  # pylint: disable=R0913, R0914, R0917
-#     """
-#     Worker Task: Calls Tavily and Groq llama for a specific slice of data.
-#     """
-#     area = property_data.get("area")
-#     city = property_data.get("city")
-#     area_sqft = property_data.get("area_sqft")
-#     beds = property_data.get("beds")
-#     baths = property_data.get("baths")
-#     context_text = None
-
-#     if existing_context:
-#         logger.info("Retrying Groq only. Skipping Tavily for query %s.", seed_index)
-#         context_text = existing_context
-#     else:
-#         try:
-#             # Variations to ensure the 4 workers find different things
-#             context_text, tavily_credits = tavily_search(
-#                 area, city, area_sqft, beds, baths, count, seed_index
-#             )
-
-#             logger.info(
-#                 "[Tavily] Used %s credits for query %s", tavily_credits, seed_index
-#             )
-#         except Exception as e:  # pylint: disable=W0718
-#             logger.warning("Search Task Error: %s. Retrying...", e)
-#             try:
-#                 raise self.retry(exc=e)
-#             except MaxRetriesExceededError:
-#                 logger.error(
-#                     "FATAL: Fork %s exceeded max retries. Providing mock data.",
-#                     seed_index,
-#                 )
-#                 AIReport.objects.get(id=report_id).update(
-#                     status=AIReport.Status.FAILED,
-#                     ai_insight_summary="Automated data search failed. Please try again later.",
-#                 )
-#                 return generate_mock_properties(area_sqft, beds, baths, count)
-
-#     if final_properties is None:
-#         final_properties = []
-#     if completed_chunks is None:
-#         completed_chunks = []
-
-#     chunks = split_context(context_text)
-#     time.sleep(random.uniform(1.0, 5.0))
-
-#     for i, chunk in enumerate(chunks):
-#         if i in completed_chunks:
-#             continue
-
-#         try:
-#             if i > 0:
-#                 time.sleep(2)
-
-#             properties_json, usage = groq_json_formatter(chunk, area, city)
-
-#             logger.info(
-#                 "Fork %s Chunk %s: [Groq Llama] Prompt Tokens:%s "
-#                 "| Completion Tokens:%s | Total:%s",
-#                 seed_index,
-#                 i,
-#                 usage.prompt_tokens,
-#                 usage.completion_tokens,
-#                 usage.total_tokens,
-#             )
-
-#             final_properties.extend(properties_json)
-#             completed_chunks.append(i)
-#         except Exception as e:  # pylint: disable=W0718
-#             logger.warning(
-#                 "Attempt %s/%s failed for Fork %s Chunk %s. Groq Rate "
-#                 "Limit/Error: %s. Retrying extraction with SAVED context.",
-#                 self.request.retries,
-#                 self.max_retries,
-#                 seed_index,
-#                 i,
-#                 e,
-#             )
-
-#             try:
-#                 raise self.retry(
-#                     args=[report_id, property_data, count, seed_index],
-#                     kwargs={
-#                         "existing_context": context_text,
-#                         "final_properties": final_properties,
-#                         "completed_chunks": completed_chunks,
-#                     },
-#                     exc=e,
-#                 )
-#             except MaxRetriesExceededError:
-#                 logger.error(
-#                     "FATAL: Fork %s exceeded max retries. Providing mock data.",
-#                     seed_index,
-#                 )
-#                 AIReport.objects.get(id=report_id).update(
-#                     status=AIReport.Status.FAILED,
-#                     ai_insight_summary="Automated data search failed. Please try again later.",
-#                 )
-#                 return generate_mock_properties(area_sqft, beds, baths, count)
-
-#     return final_properties
+    with span(PipelineSpan.Stage.SEARCH, report_id=report_id):
+        return generate_mock_properties(area_sqft, beds, baths, count)
+
+
+def search_context(report_id, property_data, count, seed_index, retries):
+    """Tavily search of one fork, timed as a search span."""
+    # Variations to ensure the 4 workers find different things
+    with span(PipelineSpan.Stage.SEARCH, report_id=report_id, retries=retries):
+        context_text, tavily_credits = tavily_search(
+            property_data.get("area"),
+            property_data.get("city"),
+            property_data.get("area_sqft"),
+            property_data.get("beds"),
+            property_data.get("baths"),
+            count,
+            seed_index,
+            report_id=report_id,
+        )
 
+    logger.info("[Tavily] Used %s credits for query %s", tavily_credits, seed_index)
+    return context_text
 
-@shared_task
-def compile_search_data(results, property_data):
+
+def fail_fork(report_id, property_data, count, seed_index):
+    """Marks the report failed when a fork runs out of retries, returns mock data."""
+    logger.error(
+        "FATAL: Fork %s exceeded max retries. Providing mock data.",
+        seed_index,
+    )
+    AIReport.objects.filter(id=report_id).update(
+        status=AIReport.Status.FAILED,
+        ai_insight_summary="Automated data search failed. Please try again later.",
+    )
+    return generate_mock_properties(
+        property_data.get("area_sqft"),
+        property_data.get("beds"),
+        property_data.get("baths"),
+        count,
+    )
+
+
+@shared_task(
+    bind=True,
+    rate_limit="15/m",  # Max 15 calls/m to avoid Groq 429s
+    max_retries=5,
+    default_retry_delay=61,  # Groq hits a limit, wait for full minute reset
+    retry_jitter=False,  # Predictable 61s wait, no randomness needed
+    autoretry_for=(),
+)
+def search_properties_live(
+    self,
+    report_id,
+    property_data,
+    count,
+    seed_index,
+    existing_context=None,
+    final_properties=None,
+    completed_chunks=None,
+):  # pylint: disable=R0913, R0914, R0917
     """
-    Merges results into a single LIST of dictionaries.
-    Uses a safe fingerprint that handles missing keys.
+    Worker Task: Calls Tavily and Groq llama for a specific slice of data.
     """
-    final_list = []
-    seen_identifiers = set()
+    area = property_data.get("area")
+    city = property_data.get("city")
+
+    if existing_context:
+        logger.info("Retrying Groq only. Skipping Tavily for query %s.", seed_index)
+        context_text = existing_context
+    else:
+        try:
+            context_text = search_context(
+                report_id, property_data, count, seed_index, self.request.retries
+            )
+        except Exception as e:  # pylint: disable=W0718
+            logger.warning("Search Task Error: %s. Retrying...", e)
+            try:
+                raise self.retry(exc=e)
+            except MaxRetriesExceededError:
+                return fail_fork(report_id, property_data, count, seed_index)
+
+    if final_properties is None:
+        final_properties = []
+    if completed_chunks is None:
+        completed_chunks = []
+
+    chunks = split_context_tokens(context_text, EXTRACTION_MODEL)
+    time.sleep(random.uniform(1.0, 5.0))
+
+    for i, chunk in enumerate(chunks):
+        if i in completed_chunks:
+            continue
 
-    for chunk in results:
-        if not chunk:
+        # Listing cards are parsed without the LLM when the parse is reliable
+        properties_json, confidence = extract_listings(chunk)
+        if confidence >= settings.EXTRACTOR_MIN_CONFIDENCE:
+            logger.info(
+                "Fork %s Chunk %s: [Regex] %s properties (confidence %.2f), "
+                "skipped LLM extraction.",
+                seed_index,
+                i,
+                len(properties_json),
+                confidence,
+            )
+            final_properties.extend(properties_json)
+            completed_chunks.append(i)
             continue
-        for item in chunk:
+
+        try:
+            if i > 0:
+                time.sleep(2)
+
+            with span(
+                PipelineSpan.Stage.EXTRACTION,
+                report_id=report_id,
+                retries=self.request.retries,
+            ) as extraction:
+                properties_json, usage = groq_json_formatter(chunk, area, city)
+                extraction.record_usage(usage)
+
+            logger.info(
+                "Fork %s Chunk %s: [Groq Llama] Prompt Tokens:%s "
+                "| Completion Tokens:%s | Total:%s",
+                seed_index,
+                i,
+                usage.prompt_tokens,
+                usage.completion_tokens,
+                usage.total_tokens,
+            )
+
+            final_properties.extend(properties_json)
+            completed_chunks.append(i)
+        except Exception as e:  # pylint: disable=W0718
+            logger.warning(
+                "Attempt %s/%s failed for Fork %s Chunk %s. Groq Rate "
+                "Limit/Error: %s. Retrying extraction with SAVED context.",
+                self.request.retries,
+                self.max_retries,
+                seed_index,
+                i,
+                e,
+            )
+
             try:
-                price, sqft, bds, bths = clean_properties(item, property_data)
-            except (ValueError, TypeError, IndexError):
-                continue
-
-            fingerprint = f"{price}-{sqft}-{bds}-{bths}"
-            if fingerprint not in seen_identifiers:
-                final_list.append(
-                    {"price": price, "area_sqft": sqft, "beds": bds, "baths": bths}
+                raise self.retry(
+                    args=[report_id, property_data, count, seed_index],
+                    kwargs={
+                        "existing_context": context_text,
+                        "final_properties": final_properties,
+                        "completed_chunks": completed_chunks,
+                    },
+                    exc=e,
                 )
-                seen_identifiers.add(fingerprint)
+            except MaxRetriesExceededError:
+                return fail_fork(report_id, property_data, count, seed_index)
+
+    return final_properties
+
+
+@shared_task
+def compile_search_data(results, property_data, report_id=None):
+    """
+    Merges results into a single LIST of dictionaries.
+    All forks are cleaned and deduplicated in one vectorized batch.
+    """
+    with span(PipelineSpan.Stage.COMPILE, report_id=report_id):
+        final_list = clean_properties_batch(results, property_data)
 
     logger.info("Final dataset compiled: %s unique properties.", len(final_list))
-    return final_list
+    # Analysis and finalizer only receive a reference to the comparables
+    return store_payload(final_list)
 
 
 @shared_task()
 def report_analysis(compiled_data, report_id, property_data):  # pylint: disable=W0613
     """Mocks Groq GPT to generate the analysis."""
-    ai_insight_summary = generate_mock_summary(compiled_data, property_data)
+    compiled_data = load_payload(compiled_data)
+    with span(PipelineSpan.Stage.INSIGHT, report_id=report_id):
+        ai_insight_summary = generate_mock_summary(compiled_data, property_data)
     return {
         "avg_market_price": 0,
         "avg_price_per_sqft": 0,
@@ -197,119 +233,128 @@ def report_analysis(compiled_data, report_id, property_data):  # pylint: disable
     }
 
 
-# @shared_task(bind=True, max_retries=3, default_retry_delay=61, rate_limit="8/m")
-# def report_analysis(
-#     self, compiled_data, report_id, property_data
-# ):  # pylint: disable=R0914, R1710
-#     """
-#     Calculates average prices, beds, baths.
-#     Calculates investment rating.
-#     Produce AI insight summary on them with pros and cons.
-#     Using Groq gpt oss 120b
-#     """
-#     report = AIReport.objects.get(id=report_id)
-#     if not compiled_data or report.status == AIReport.Status.FAILED:
-#         return {
-#             "avg_market_price": 0,
-#             "avg_price_per_sqft": 0,
-#             "avg_beds": 0,
-#             "avg_baths": 0,
-#             "investment_rating": 0,
-#             "ai_insight_summary": report.ai_insight_summary
-#             or "No market data available for analysis.",
-#         }
-
-#     avg_price, avg_pps, avg_beds, avg_baths = average_prices_beds_baths(compiled_data)
-
-#     if avg_price == 0 or avg_pps == 0 or avg_beds == 0 or avg_baths == 0:
-#         return {
-#             "avg_market_price": avg_price,
-#             "avg_price_per_sqft": avg_pps,
-#             "avg_beds": avg_beds,
-#             "avg_baths": avg_baths,
-#             "investment_rating": 0,
-#             "ai_insight_summary": "No market data available for analysis.",
-#         }
-
-#     logger.info(
-#         "Market Average Price: %s ||| Market Average PPS: %s ||| "
-#         "Average Beds: %s ||| Average Baths: %s",
-#         avg_price,
-#         avg_pps,
-#         avg_beds,
-#         avg_baths,
-#     )
-
-#     regressor = InvestmentRegressor(
-#         float(avg_price), float(avg_pps), avg_beds, avg_baths
-#     )
-#     try:
-#         rating, breakdown = regressor.calculate_rating(compiled_data, property_data)
-#         if not rating or not breakdown or len(breakdown) == 0:
-#             raise ValueError("Empty rating or breakdown generated")
-#     except Exception as e:  # pylint: disable=W0718
-#         logger.error("FATAL: Investment Rating Error: %s", e)
-#         return {
-#             "avg_market_price": avg_price,
-#             "avg_price_per_sqft": avg_pps,
-#             "avg_beds": avg_beds,
-#             "avg_baths": avg_baths,
-#             "investment_rating": 0,
-#             "ai_insight_summary": "No market data available for analysis.",
-#         }
-
-#     logger.info("Investment Rating: %s", rating)
-#     logger.info("Investment Breakdown: %s", str(breakdown))
-
-#     # Small compiled json data to avoid window bloat
-#     if len(compiled_data) > 50:
-#         comps_sample = compiled_data[:50]
-#     else:
-#         comps_sample = compiled_data
-
-#     try:
-#         ai_json, usage = groq_ai_insight_prompt(
-#             comps_sample, property_data, rating, breakdown
-#         )
-
-#         logger.info(
-#             "[Groq GPT] Prompt Tokens: %s | Completion Tokens: %s | Total: %s",
-#             usage.prompt_tokens,
-#             usage.completion_tokens,
-#             usage.total_tokens,
-#         )
-#         logger.info("Groq GPT summary generated successfully")
-
-#         return {
-#             "avg_market_price": avg_price,
-#             "avg_price_per_sqft": avg_pps,
-#             "avg_beds": avg_beds,
-#             "avg_baths": avg_baths,
-#             "investment_rating": rating,
-#             "ai_insight_summary": ai_json,
-#         }
-#     except Exception as e:  # pylint: disable=W0718
-#         logger.warning(
-#             "Attempt %s/%s failed Groq Rate Limit/Error: %s. Retrying again",
-#             self.request.retries,
-#             self.max_retries,
-#             e,
-#         )
-#         try:
-#             self.retry(exc=e)
-#         except MaxRetriesExceededError as err:
-#             logger.error("Groq GPT Summary Error: %s", err)
-#             ai_insight_summary = generate_mock_summary(compiled_data, property_data)
-#             return {
-#                 "avg_market_price": avg_price,
-#                 "avg_price_per_sqft": avg_pps,
-#                 "avg_beds": avg_beds,
-#                 "avg_baths": avg_baths,
-#                 "investment_rating": rating,
-#                 "ai_insight_summary": ai_insight_summary,
-#             }
-
-#     return None
+@shared_task(bind=True, max_retries=3, default_retry_delay=61, rate_limit="8/m")
+def report_analysis_live(
+    self, compiled_data, report_id, property_data
+):  # pylint: disable=R0914, R1710
+    """
+    Calculates average prices, beds, baths.
+    Calculates investment rating.
+    Produce AI insight summary on them with pros and cons.
+    Using Groq gpt oss 120b
+    """
+    compiled_data = load_payload(compiled_data)
+    report = AIReport.objects.get(id=report_id)
+    if not compiled_data or report.status == AIReport.Status.FAILED:
+        return {
+            "avg_market_price": 0,
+            "avg_price_per_sqft": 0,
+            "avg_beds": 0,
+            "avg_baths": 0,
+            "investment_rating": 0,
+            "ai_insight_summary": report.ai_insight_summary
+            or "No market data available for analysis.",
+        }
+
+    avg_price, avg_pps, avg_beds, avg_baths = average_prices_beds_baths(compiled_data)
+
+    if avg_price == 0 or avg_pps == 0 or avg_beds == 0 or avg_baths == 0:
+        return {
+            "avg_market_price": avg_price,
+            "avg_price_per_sqft": avg_pps,
+            "avg_beds": avg_beds,
+            "avg_baths": avg_baths,
+            "investment_rating": 0,
+            "ai_insight_summary": "No market data available for analysis.",
+        }
+
+    logger.info(
+        "Market Average Price: %s ||| Market Average PPS: %s ||| "
+        "Average Beds: %s ||| Average Baths: %s",
+        avg_price,
+        avg_pps,
+        avg_beds,
+        avg_baths,
+    )
+
+    regressor = InvestmentRegressor(
+        float(avg_price), float(avg_pps), avg_beds, avg_baths
+    )
+    try:
+        # Fitted once, the finalizer stores this model for the chat
+        with span(PipelineSpan.Stage.REGRESSION, report_id=report_id):
+            rating, breakdown, market_model = regressor.rate(
+                compiled_data, property_data
+            )
+    except Exception as e:  # pylint: disable=W0718
+        logger.error("FATAL: Investment Rating Error: %s", e)
+        return {
+            "avg_market_price": avg_price,
+            "avg_price_per_sqft": avg_pps,
+            "avg_beds": avg_beds,
+            "avg_baths": avg_baths,
+            "investment_rating": 0,
+            "ai_insight_summary": "No market data available for analysis.",
+        }
+
+    logger.info("Investment Rating: %s", rating)
+    logger.info("Investment Breakdown: %s", str(breakdown))
+
+    try:
+        # The prompt packs the comps nearest to the property
+        with span(
+            PipelineSpan.Stage.INSIGHT,
+            report_id=report_id,
+            retries=self.request.retries,
+        ) as insight:
+            ai_json, usage = groq_ai_insight_prompt(
+                compiled_data, property_data, rating, breakdown
+            )
+            insight.record_usage(usage)
+
+        if usage is None:
+            logger.info("Groq GPT summary served from the insight cache")
+        else:
+            logger.info(
+                "[Groq GPT] Prompt Tokens: %s | Completion Tokens: %s | Total: %s",
+                usage.prompt_tokens,
+                usage.completion_tokens,
+                usage.total_tokens,
+            )
+            logger.info("Groq GPT summary generated successfully")
+
+        return {
+            "avg_market_price": avg_price,
+            "avg_price_per_sqft": avg_pps,
+            "avg_beds": avg_beds,
+            "avg_baths": avg_baths,
+            "investment_rating": rating,
+            "ai_insight_summary": ai_json,
+            "market_model": market_model,
+        }
+    except Exception as e:  # pylint: disable=W0718
+        logger.warning(
+            "Attempt %s/%s failed Groq Rate Limit/Error: %s. Retrying again",
+            self.request.retries,
+            self.max_retries,
+            e,
+        )
+        try:
+            self.retry(exc=e)
+        except MaxRetriesExceededError as err:
+            logger.error("Groq GPT Summary Error: %s", err)
+            ai_insight_summary = generate_mock_summary(compiled_data, property_data)
+            return {
+                "avg_market_price": avg_price,
+                "avg_price_per_sqft": avg_pps,
+                "avg_beds": avg_beds,
+                "avg_baths": avg_baths,
+                "investment_rating": rating,
+                "ai_insight_summary": ai_insight_summary,
+                "market_model": market_model,
+            }
+
+    return None
 
 
 @shared_task
@@ -320,47 +365,61 @@ def report_finalizer(analysis_result, compiled_data, report_id):
     """
     report = AIReport.objects.get(id=report_id)
 
-    try:  # pylint: disable=R1702
-        report.comparable_data = compiled_data
-
-        for key, value in analysis_result.items():
-            if hasattr(report, key) and key != "ai_insight_summary":
-                setattr(report, key, value)
-            else:
-                if key == "ai_insight_summary":
-                    if isinstance(value, dict):
-                        insight = analysis_result["ai_insight_summary"]
-
-                        summary_text = (
-                            f"{insight.get('investment_summary', '')}\n\n"
-                            f"SCORE BREAKDOWN:\n{insight.get('weighted_analysis', '')}\n\n"
-                            "PROS:\n- "
-                            + "\n- ".join(insight.get("pros", []))
-                            + "\n\nCONS:\n- "
-                            + "\n- ".join(insight.get("cons", []))
-                        )
-                        report.ai_insight_summary = summary_text
-                        report.status = AIReport.Status.COMPLETED
-                    else:
-                        report.ai_insight_summary = value
-                        report.status = AIReport.Status.FAILED
-
-        report.save()
-
-        logger.info("Report %s fully finalized.", report_id)
-        return f"Report {report_id} Success"
-    except Exception as e:  # pylint: disable=W0718
-        logger.error("Finalizer failed: %s", e)
-        report.status = AIReport.Status.FAILED
-        report.ai_insight_summary = "Report analysis failed"
-        report.save()
-        return f"Report {report_id} Failed"
+    with span(PipelineSpan.Stage.FINALIZE, report_id=report_id) as finalize:
+        try:  # pylint: disable=R1702
+            compiled_data = load_payload(compiled_data)
+            report.comparable_data = compiled_data
+
+            # Chat queries only evaluate the stored model. The live analysis
+            # passes the model it rated with, otherwise it is fitted here.
+            if "market_model" not in analysis_result:
+                try:
+                    with span(PipelineSpan.Stage.REGRESSION, report_id=report_id):
+                        report.market_model = MarketModelFitter().fit(compiled_data)
+                except Exception as e:  # pylint: disable=W0718
+                    logger.warning("Market model fit failed: %s", e)
+                    report.market_model = None
+
+            for key, value in analysis_result.items():
+                if hasattr(report, key) and key != "ai_insight_summary":
+                    setattr(report, key, value)
+                else:
+                    if key == "ai_insight_summary":
+                        if isinstance(value, dict):
+                            insight = analysis_result["ai_insight_summary"]
+
+                            summary_text = (
+                                f"{insight.get('investment_summary', '')}\n\n"
+                                f"SCORE BREAKDOWN:\n{insight.get('weighted_analysis', '')}\n\n"
+                                "PROS:\n- "
+                                + "\n- ".join(insight.get("pros", []))
+                                + "\n\nCONS:\n- "
+                                + "\n- ".join(insight.get("cons", []))
+                            )
+                            report.ai_insight_summary = summary_text
+                            report.status = AIReport.Status.COMPLETED
+                        else:
+                            report.ai_insight_summary = value
+                            report.status = AIReport.Status.FAILED
+
+            report.save()
+
+            logger.info("Report %s fully finalized.", report_id)
+            return f"Report {report_id} Success"
+        except Exception as e:  # pylint: disable=W0718
+            logger.error("Finalizer failed: %s", e)
+            finalize.succeeded = False
+            report.status = AIReport.Status.FAILED
+            report.ai_insight_summary = "Report analysis failed"
+            report.save()
+            return f"Report {report_id} Failed"
 
 
 @shared_task
 def analysis(compiled_data, report_id, property_data):
+    analysis_task = report_analysis_live if settings.AI_AGENTS_LIVE else report_analysis
     return chain(
-        report_analysis.s(
+        analysis_task.s(
             compiled_data=compiled_data,
             report_id=report_id,
             property_data=property_data,
@@ -381,13 +440,16 @@ def parallel_report_generator(report_id, property_data):
     report.update(status=AIReport.Status.PROCESSING)
 
     # Define 4 parallel chunks (25 properties each = 100 total)
+    search_task = (
+        search_properties_live if settings.AI_AGENTS_LIVE else search_properties
+    )
     search_tasks = [
-        search_properties.s(report_id, property_data, 25, i).set(countdown=i * 20)
+        search_task.s(report_id, property_data, 25, i).set(countdown=i * 20)
         for i in range(4)
     ]
 
     # Define the callback that merges the data
-    finalizer = compile_search_data.s(property_data=property_data)
+    finalizer = compile_search_data.s(property_data=property_data, report_id=report_id)
 
     # Linking the tasks so that search_tasks ends then callback is called
     workflow_result = chord(search_tasks)(
@@ -395,3 +457,28 @@ def parallel_report_generator(report_id, property_data):
     )
 
     return workflow_result.id
+
+
+@shared_task
+def rescore_report_batch(report_ids):
+    """Re-scores one batch of reports from their stored comparables."""
+    updated = save_scores(rescore_rows(load_report_rows(report_ids)))
+    logger.info("Re-scored %s reports.", updated)
+    return updated
+
+
+@shared_task
+def rescore_all_reports(batch_size=200):
+    """
+    Re-scores every completed report without any LLM calls.
+    Each batch of report ids becomes its own task so the workers share the load.
+    """
+    batches = [
+        rescore_report_batch.s(report_ids)
+        for report_ids in report_id_batches(rescorable_reports(), batch_size)
+    ]
+    if not batches:
+        return None
+
+    logger.info("Dispatching %s re-scoring batches.", len(batches))
+    return group(batches).apply_async().id
@@ -0,0 +1,54 @@
+import json
+from io import StringIO
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from core_db_ai.models import User, Property, AIReport
+from report_api.benchmark import BENCH_PREFIX, percentiles
+
+LOCMEM_CACHE = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+
+
+@override_settings(CACHES=LOCMEM_CACHE)
+class BenchmarkReportsTest(TestCase):
+    def run_benchmark(self, *args):
+        out = StringIO()
+        call_command("benchmark_reports", "--eager", *args, stdout=out)
+        return json.loads(out.getvalue())
+
+    def test_eager_run_reports_throughput_and_stages(self):
+        """Test that an eager run completes every report and reports its stages."""
+        result = self.run_benchmark("--reports", "2", "--concurrency", "1")
+
+        self.assertEqual(result["submitted"], 2)
+        self.assertEqual(result["completed"], 2)
+        self.assertEqual(result["timed_out"], 0)
+        self.assertGreater(result["reports_per_minute"], 0)
+        self.assertIsNotNone(result["end_to_end"]["p95_ms"])
+        self.assertGreater(result["db_queries"], 0)
+
+        stages = {row["stage"]: row for row in result["stages"]}
+        self.assertEqual(stages["search"]["count"], 8)
+        for stage in ("compile", "insight", "finalize"):
+            self.assertEqual(stages[stage]["count"], 2)
+
+    def test_seeded_data_is_removed(self):
+        """Test that the seeded properties and their reports are cleaned up."""
+        self.run_benchmark("--reports", "1", "--concurrency", "1")
+        self.run_benchmark("--reports", "1", "--concurrency", "1")
+
+        self.assertEqual(User.objects.filter(slug=BENCH_PREFIX).count(), 1)
+        self.assertFalse(Property.objects.exists())
+        self.assertFalse(AIReport.objects.exists())
+
+    def test_keep_leaves_reports_for_inspection(self):
+        """Test that --keep leaves the seeded data and reports in place."""
+        self.run_benchmark("--reports", "1", "--concurrency", "1", "--keep")
+
+        self.assertEqual(
+            AIReport.objects.filter(status=AIReport.Status.COMPLETED).count(), 1
+        )
+
+    def test_percentiles(self):
+        """Test that percentiles are reported in milliseconds."""
+        self.assertEqual(percentiles([0.1, 0.2, 0.3])["p50_ms"], 200.0)
+        self.assertIsNone(percentiles([])["p95_ms"])
@@ -0,0 +1,65 @@
+from unittest.mock import patch
+from django.core.cache import cache
+from django.test import SimpleTestCase, override_settings
+from backend_ai.claim_check import (
+    ClaimCheckExpired,
+    is_claim_check,
+    load_payload,
+    store_payload,
+)
+from report_api.tasks import compile_search_data
+from report_api.tests.test_regression_model import make_comparables
+
+LOCMEM_CACHE = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+
+
+@override_settings(CACHES=LOCMEM_CACHE, CLAIM_CHECK_MIN_BYTES=1024)
+class ClaimCheckTest(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_large_payload_is_passed_by_reference(self):
+        """Test that large payloads are stored once and resolved back."""
+        comparables = make_comparables(0, count=100, missing=0)
+
+        reference = store_payload(comparables)
+
+        self.assertTrue(is_claim_check(reference))
+        self.assertEqual(store_payload(comparables), reference)
+        self.assertEqual(load_payload(reference), comparables)
+
+    def test_small_payload_is_passed_inline(self):
+        """Test that small payloads and plain values pass through unchanged."""
+        comparables = make_comparables(0, count=2, missing=0)
+
+        self.assertEqual(store_payload(comparables), comparables)
+        self.assertEqual(load_payload(comparables), comparables)
+        self.assertEqual(load_payload([]), [])
+
+    def test_expired_reference(self):
+        """Test that a reference without a payload raises."""
+        with self.assertRaises(ClaimCheckExpired):
+            load_payload({"claim_check": "claim_check_missing"})
+
+    def test_unavailable_cache_sends_payload_inline(self):
+        """Test that a Redis error falls back to passing the data itself."""
+        comparables = make_comparables(0, count=100, missing=0)
+
+        with patch("backend_ai.claim_check.cache") as broken_cache:
+            broken_cache.add.side_effect = ConnectionError("Redis down")
+            self.assertEqual(store_payload(comparables), comparables)
+
+    def test_compiled_search_data_is_claim_checked(self):
+        """Test that the compiled comparables leave the chord as a reference."""
+        property_data = {"area_sqft": 1500, "beds": 3, "baths": 2}
+        results = [
+            [
+                {"price": 400000 + i, "area_sqft": 1500, "beds": 3, "baths": 2}
+                for i in range(100)
+            ]
+        ]
+
+        reference = compile_search_data(results, property_data)
+
+        self.assertTrue(is_claim_check(reference))
+        self.assertEqual(len(load_payload(reference)), 100)
@@ -0,0 +1,65 @@
+from django.test import SimpleTestCase
+from report_api.utils import clean_properties_batch
+
+PROPERTY_DATA = {"area_sqft": 1500, "beds": 3, "baths": 2}
+
+
+class CleanPropertiesBatchTest(SimpleTestCase):
+    def test_parses_raw_llm_values(self):
+        """Test that currency strings, commas and decimals are parsed."""
+        results = [
+            [
+                {
+                    "price": "$612,000.50",
+                    "area_sqft": "1,450",
+                    "beds": "3",
+                    "baths": 2.0,
+                }
+            ]
+        ]
+        self.assertEqual(
+            clean_properties_batch(results, PROPERTY_DATA),
+            [{"price": 612000, "area_sqft": 1450, "beds": 3, "baths": 2}],
+        )
+
+    def test_drops_invalid_and_out_of_window_rows(self):
+        """Test that unparsable values and the variance window are applied."""
+        results = [
+            [
+                {"price": "unknown", "area_sqft": 1500, "beds": 3, "baths": 2},
+                {"price": 9000, "area_sqft": 1500, "beds": 3, "baths": 2},
+                {"price": 500000, "area_sqft": 2000, "beds": 3, "baths": 2},
+                {"price": 500000, "area_sqft": 1500, "beds": 5, "baths": 2},
+                {"price": 500000, "area_sqft": 1500, "beds": 3, "baths": None},
+                {"price": 500000, "area_sqft": 1500, "beds": 3},
+                "not a property",
+            ],
+            None,
+            [{"price": 480000, "area_sqft": 1200, "beds": 2, "baths": 3}],
+        ]
+        self.assertEqual(
+            clean_properties_batch(results, PROPERTY_DATA),
+            [{"price": 480000, "area_sqft": 1200, "beds": 2, "baths": 3}],
+        )
+
+    def test_dedupes_across_forks_keeping_first_seen_order(self):
+        """Test that duplicates across forks are removed in order."""
+        first = {"price": 500000, "area_sqft": 1500, "beds": 3, "baths": 2}
+        second = {"price": 450000, "area_sqft": 1400, "beds": 3, "baths": 2}
+        results = [
+            [first, second],
+            [{"price": "$500,000", "area_sqft": "1,500", "beds": 3, "baths": 2}],
+        ]
+        self.assertEqual(
+            clean_properties_batch(results, PROPERTY_DATA), [first, second]
+        )
+
+    def test_returns_native_ints(self):
+        """Test that the output stays JSON serializable for Celery."""
+        results = [[{"price": 500000.9, "area_sqft": 1500.4, "beds": 3, "baths": 2}]]
+        compiled = clean_properties_batch(results, PROPERTY_DATA)
+        for value in compiled[0].values():
+            self.assertIs(type(value), int)
+
+    def test_empty_results(self):
+        self.assertEqual(clean_properties_batch([None, []], PROPERTY_DATA), [])
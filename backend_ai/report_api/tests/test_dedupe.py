@@ -0,0 +1,66 @@
+from django.core.cache import cache
+from django.test import SimpleTestCase, override_settings
+from report_api.dedupe import drop_duplicate_snippets, minhash_signature
+from report_api.utils import clean_context
+
+LOCMEM_CACHE = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+
+LISTING = (
+    "Recently sold: 42 Oak Street, Springfield. 3 beds, 2 baths, 1,540 sqft "
+    "single family home sold for $452,000 on March 3. Built in 1998 with a "
+    "renovated kitchen, hardwood floors and a two car garage."
+)
+LISTING_COPY = LISTING + " Listed by Acme Realty."
+OTHER_LISTING = (
+    "Sold: 7 Pine Avenue, Springfield. 4 beds, 3 baths, 2,210 sqft townhouse "
+    "closed at $615,500 in January after 12 days on the market."
+)
+
+
+@override_settings(CACHES=LOCMEM_CACHE)
+class SnippetDedupeTest(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_signature_is_stable(self):
+        """Test that every worker computes the same signature."""
+        self.assertEqual(
+            minhash_signature(LISTING).tolist(), minhash_signature(LISTING).tolist()
+        )
+
+    def test_near_duplicates_are_dropped(self):
+        """Test that exact and near copies of a listing are dropped."""
+        snippets = [LISTING, OTHER_LISTING, LISTING, LISTING_COPY]
+
+        self.assertEqual(drop_duplicate_snippets(snippets), [LISTING, OTHER_LISTING])
+
+    def test_duplicates_across_forks_are_dropped(self):
+        """Test that a listing kept by one fork is dropped by the others."""
+        first = drop_duplicate_snippets([LISTING], report_id=1, fork=0)
+        second = drop_duplicate_snippets(
+            [LISTING_COPY, OTHER_LISTING], report_id=1, fork=1
+        )
+        # A retry of the first fork keeps its own snippets
+        retry = drop_duplicate_snippets([LISTING], report_id=1, fork=0)
+        other_report = drop_duplicate_snippets([LISTING], report_id=2, fork=1)
+
+        self.assertEqual(first, [LISTING])
+        self.assertEqual(second, [OTHER_LISTING])
+        self.assertEqual(retry, [LISTING])
+        self.assertEqual(other_report, [LISTING])
+
+
+class CleanContextTest(SimpleTestCase):
+    def test_html_and_boilerplate_are_stripped(self):
+        """Test that HTML remnants, links and junk phrases are removed."""
+        text = (
+            "<div class='card'>3 beds &amp; 2 baths</div>\n\n\n"
+            "Click to see more  $450,000 [Zillow](https://zillow.com) "
+            "![photo](a.png)<script>track();</script>\n---\n"
+            "Source: b\nContent: price < 500k Save this home Sign in"
+        )
+
+        self.assertEqual(
+            clean_context(text),
+            "3 beds & 2 baths\n$450,000 Zillow\n---\nSource: b\nContent: price < 500k",
+        )
@@ -0,0 +1,74 @@
+import json
+from io import StringIO
+from pathlib import Path
+from django.conf import settings
+from django.core.management import call_command
+from django.test import SimpleTestCase
+from report_api.extractors import evaluate_extraction, extract_listings
+
+FIXTURES = Path(__file__).parent / "fixtures" / "listing_chunks.json"
+
+
+class ExtractListingsTest(SimpleTestCase):
+    def test_parses_listing_card(self):
+        """Test that a listing card is parsed with full confidence."""
+        properties, confidence = extract_listings(
+            "42 Oak St $612,000 · 3 bds · 2 ba · 1,850 sqft"
+        )
+        self.assertEqual(
+            properties, [{"price": 612000, "area_sqft": 1850, "beds": 3, "baths": 2}]
+        )
+        self.assertEqual(confidence, 1.0)
+
+    def test_parses_short_prices_and_half_baths(self):
+        """Test that $525K / $1.2M prices and half baths are parsed."""
+        properties, _ = extract_listings(
+            "$525K 4 Beds 2.5 Baths 2,340 Sq Ft\n$1.2M 5 Beds 4 Baths 3,900 Sq Ft"
+        )
+        self.assertEqual(
+            properties,
+            [
+                {"price": 525000, "area_sqft": 2340, "beds": 4, "baths": 2.5},
+                {"price": 1200000, "area_sqft": 3900, "beds": 5, "baths": 4},
+            ],
+        )
+
+    def test_ignores_rents_and_lot_sizes(self):
+        """Test that rents are not listings and lot sizes are not living area."""
+        rent, confidence = extract_listings("$2,450/mo 2 bds 1 ba 950 sqft")
+        self.assertEqual((rent, confidence), ([], 0.0))
+
+        properties, _ = extract_listings(
+            "3 bds | 2 ba | 1,700 sqft | 6,098 sqft lot | $455,000"
+        )
+        self.assertEqual(properties[0]["area_sqft"], 1700)
+
+    def test_stray_price_lowers_confidence(self):
+        """Test that price mentions without a listing send the chunk to the LLM."""
+        _, confidence = extract_listings(
+            "Median sold price $405,000. 12 Cedar Ct $415,000 3 bds 2 ba 1,600 sqft"
+        )
+        self.assertLess(confidence, settings.EXTRACTOR_MIN_CONFIDENCE)
+
+    def test_implausible_values_are_rejected(self):
+        """Test that a listing with an impossible area is not extracted."""
+        properties, confidence = extract_listings("$450,000 3 bds 2 ba 15 sqft")
+        self.assertEqual((properties, confidence), ([], 0.0))
+
+
+class ExtractorAccuracyTest(SimpleTestCase):
+    def setUp(self):
+        self.cases = json.loads(FIXTURES.read_text())
+
+    def test_confident_chunks_are_exact(self):
+        """Test that chunks skipping the LLM are extracted without mistakes."""
+        metrics = evaluate_extraction(self.cases, settings.EXTRACTOR_MIN_CONFIDENCE)
+
+        self.assertEqual(metrics["precision"], 1.0)
+        self.assertGreaterEqual(metrics["llm_call_reduction"], 0.5)
+
+    def test_benchmark_command(self):
+        """Test that the benchmark reports LLM calls saved on the fixtures."""
+        out = StringIO()
+        call_command("benchmark_extractor", stdout=out)
+        self.assertIn("LLM calls saved", out.getvalue())
@@ -0,0 +1,106 @@
+import json
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+from django.core.cache import cache
+from django.test import SimpleTestCase, override_settings
+from report_api.agents import groq_ai_insight_prompt
+from report_api.insight_cache import evict_insights
+
+LOCMEM_CACHE = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+INSIGHT = {
+    "weighted_analysis": "+1.0 Price-to-Value Gap",
+    "investment_summary": "Solid buy.",
+    "pros": ["Price"],
+    "cons": ["Size"],
+}
+PROPERTY_DATA = {
+    "title": "Modern Condo",
+    "price": 450000.0,
+    "area_sqft": 1400,
+    "beds": 3,
+    "baths": 2,
+}
+COMPS = [{"price": 500000, "area_sqft": 1500, "beds": 3, "baths": 2}]
+
+
+def completion():
+    return SimpleNamespace(
+        choices=[SimpleNamespace(message=SimpleNamespace(content=json.dumps(INSIGHT)))],
+        usage=SimpleNamespace(prompt_tokens=10, completion_tokens=5, total_tokens=15),
+    )
+
+
+@override_settings(CACHES=LOCMEM_CACHE)
+@patch("report_api.agents.openai")
+class InsightCacheTest(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_identical_inputs_skip_the_llm(self, openai):
+        """Test that a repeated prompt is served from the cache."""
+        openai.chat.completions.create.return_value = completion()
+        breakdown = {"predicted_price": 512345.6789, "price_score": 1.0}
+
+        first = groq_ai_insight_prompt(COMPS, PROPERTY_DATA, 3.5, breakdown)
+        # Float noise below the rounding precision still hits
+        breakdown["predicted_price"] = 512345.6791
+        second = groq_ai_insight_prompt(COMPS, PROPERTY_DATA, 3.5, breakdown)
+
+        self.assertEqual(openai.chat.completions.create.call_count, 1)
+        self.assertEqual(first[0], INSIGHT)
+        self.assertEqual(second, (INSIGHT, None))
+
+    def test_different_inputs_miss(self, openai):
+        """Test that another model or other numbers generate a new insight."""
+        openai.chat.completions.create.return_value = completion()
+        breakdown = {"price_score": 1.0}
+
+        groq_ai_insight_prompt(COMPS, PROPERTY_DATA, 3.5, breakdown)
+        groq_ai_insight_prompt(COMPS, PROPERTY_DATA, 3.5, breakdown, "Qwen")
+        groq_ai_insight_prompt(COMPS, PROPERTY_DATA, 4.0, breakdown)
+
+        self.assertEqual(openai.chat.completions.create.call_count, 3)
+
+    def test_cached_insight_is_streamed(self, openai):
+        """Test that a cache hit pushes the whole answer to the stream."""
+        openai.chat.completions.create.return_value = completion()
+        groq_ai_insight_prompt(COMPS, PROPERTY_DATA, 3.5, {}, "Qwen")
+
+        on_delta = MagicMock()
+        insight, usage = groq_ai_insight_prompt(
+            COMPS, PROPERTY_DATA, 3.5, {}, "Qwen", on_delta=on_delta
+        )
+
+        self.assertEqual((insight, usage), (INSIGHT, None))
+        on_delta.assert_called_once_with(json.dumps(INSIGHT))
+
+    def test_cache_errors_fail_open(self, openai):
+        """Test that an unavailable cache falls back to the LLM."""
+        openai.chat.completions.create.return_value = completion()
+
+        with patch("report_api.insight_cache.cache") as broken_cache:
+            broken_cache.get.side_effect = ConnectionError("Redis down")
+            broken_cache.set.side_effect = ConnectionError("Redis down")
+            insight, usage = groq_ai_insight_prompt(COMPS, PROPERTY_DATA, 3.5, {})
+
+        self.assertEqual(insight, INSIGHT)
+        self.assertIsNotNone(usage)
+
+
+@override_settings(LLM_INSIGHT_CACHE_MAX_ENTRIES=2)
+class InsightEvictionTest(SimpleTestCase):
+    @patch("report_api.insight_cache.get_redis_connection")
+    def test_oldest_insights_are_evicted(self, get_redis_connection):
+        """Test that insights past the size limit are deleted oldest first."""
+        redis = get_redis_connection.return_value
+        redis.pipeline.return_value.execute.return_value = [1, 0, 4]
+        redis.zpopmin.return_value = [
+            (b":1:llm_insight_a", 1.0),
+            (b":1:llm_insight_b", 2.0),
+        ]
+
+        evict_insights("llm_insight_d")
+
+        redis.zpopmin.assert_called_once()
+        self.assertEqual(redis.zpopmin.call_args.args[1], 2)
+        redis.delete.assert_called_once_with(b":1:llm_insight_a", b":1:llm_insight_b")
@@ -0,0 +1,68 @@
+from django.test import SimpleTestCase, override_settings
+from report_api.packing import (
+    SOURCE_SEPARATOR,
+    count_tokens,
+    nearest_comps,
+    pack_comps,
+    split_context_tokens,
+)
+
+PROPERTY_DATA = {"price": 450000, "area_sqft": 1500, "beds": 3, "baths": 2}
+
+
+@override_settings(LLM_CONTEXT_TOKEN_BUDGETS={"test-model": 60})
+class SplitContextTokensTest(SimpleTestCase):
+    def test_sources_are_packed_within_budget(self):
+        """Test that whole sources are packed up to the token budget."""
+        sources = [f"Listing {i}: 3 beds 2 baths 1,500 sqft sold" for i in range(20)]
+
+        chunks = split_context_tokens(SOURCE_SEPARATOR.join(sources), "test-model")
+
+        self.assertLess(len(chunks), len(sources))
+        for chunk in chunks:
+            self.assertLessEqual(count_tokens(chunk), 60)
+        # No source is cut in half
+        packed = [part for chunk in chunks for part in chunk.split(SOURCE_SEPARATOR)]
+        self.assertEqual(packed, sources)
+
+    def test_oversized_source_is_split(self):
+        """Test that a single source above the budget is hard split."""
+        chunks = split_context_tokens("word " * 500, "test-model")
+
+        self.assertGreater(len(chunks), 1)
+        for chunk in chunks:
+            self.assertLessEqual(count_tokens(chunk), 60)
+
+    def test_empty_text(self):
+        """Test that empty text gives no chunks."""
+        self.assertEqual(split_context_tokens("", "test-model"), [])
+
+
+class PackCompsTest(SimpleTestCase):
+    def test_nearest_comps_first(self):
+        """Test that comps are ordered by similarity to the subject."""
+        comps = [
+            {"price": 900000, "area_sqft": 3200, "beds": 5, "baths": 4},
+            {"price": 300000, "area_sqft": 900, "beds": 1, "baths": 1},
+            {"price": 460000, "area_sqft": 1480, "beds": 3, "baths": 2},
+            {"price": 470000, "area_sqft": None, "beds": 3, "baths": 2},
+        ]
+
+        ordered = nearest_comps(comps, PROPERTY_DATA)
+
+        self.assertEqual(ordered[0], comps[2])
+        self.assertEqual(ordered[-1], comps[3])
+
+    @override_settings(LLM_CONTEXT_TOKEN_BUDGETS={"test-model": 40})
+    def test_comps_fill_the_budget(self):
+        """Test that only the nearest comps that fit the budget are packed."""
+        comps = [
+            {"price": 400000 + i, "area_sqft": 1500 + i * 10, "beds": 3, "baths": 2}
+            for i in range(50)
+        ]
+
+        packed = pack_comps(comps, PROPERTY_DATA, "test-model")
+
+        self.assertGreater(len(packed), 0)
+        self.assertLess(len(packed), len(comps))
+        self.assertEqual(packed, comps[: len(packed)])
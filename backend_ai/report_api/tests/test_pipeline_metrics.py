@@ -0,0 +1,152 @@
+from types import SimpleNamespace
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+from core_db_ai.models import User, Agent, Property, AIReport, PipelineSpan
+from backend_ai.tracing import span, stage_metrics
+from report_api.tasks import report_finalizer
+
+METRICS_URL = reverse("report-pipeline-metrics")
+
+
+class PipelineSpanTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email="test@example.com",
+            username="testuser",
+            password="password123",
+            first_name="John",
+            last_name="Doe",
+            slug="john-doe",
+        )
+        agent = Agent.objects.create(
+            user=self.user, company_name="Dream Realty", bio="Expert in urban lofts"
+        )
+        property_obj = Property.objects.create(
+            agent=agent,
+            title="Modern Condo",
+            description="A beautiful condo in the city center",
+            beds=2,
+            baths=2,
+            price=500000.00,
+            area_sqft=1200,
+            address="123 Main St",
+            slug="modern-condo",
+        )
+        self.report = AIReport.objects.create(property=property_obj, user=self.user)
+
+    def test_span_records_tokens_and_retries(self):
+        """Test that a span stores its latency, token usage and retries."""
+        usage = SimpleNamespace(prompt_tokens=120, completion_tokens=30)
+        with span(
+            PipelineSpan.Stage.INSIGHT, report_id=self.report.id, retries=2
+        ) as current:
+            current.record_usage(usage)
+
+        stored = PipelineSpan.objects.get(report=self.report)
+        self.assertEqual(stored.stage, PipelineSpan.Stage.INSIGHT)
+        self.assertEqual((stored.prompt_tokens, stored.completion_tokens), (120, 30))
+        self.assertEqual(stored.retries, 2)
+        self.assertFalse(stored.cache_hit)
+        self.assertTrue(stored.succeeded)
+        self.assertGreaterEqual(stored.duration_ms, 0)
+
+    def test_span_records_cache_hits_and_failures(self):
+        """Test that cached answers and raised errors are recorded."""
+        with self.assertRaises(ValueError):
+            with span(PipelineSpan.Stage.INSIGHT, report_id=self.report.id) as current:
+                current.record_usage(None)
+                raise ValueError("Groq 429")
+
+        stored = PipelineSpan.objects.get(report=self.report)
+        self.assertTrue(stored.cache_hit)
+        self.assertFalse(stored.succeeded)
+
+    def test_finalizer_records_regression_and_finalize(self):
+        """Test that the report finalizer is traced stage by stage."""
+        report_finalizer(
+            {"ai_insight_summary": {"investment_summary": "Solid"}}, [], self.report.id
+        )
+
+        stages = set(
+            PipelineSpan.objects.filter(report=self.report).values_list(
+                "stage", flat=True
+            )
+        )
+        self.assertEqual(
+            stages, {PipelineSpan.Stage.REGRESSION, PipelineSpan.Stage.FINALIZE}
+        )
+
+    def test_stage_metrics_percentiles(self):
+        """Test that p50 / p95 are computed per stage."""
+        PipelineSpan.objects.bulk_create(
+            PipelineSpan(stage=PipelineSpan.Stage.SEARCH, duration_ms=ms)
+            for ms in range(1, 101)
+        )
+        PipelineSpan.objects.create(
+            stage=PipelineSpan.Stage.INSIGHT,
+            duration_ms=900,
+            prompt_tokens=100,
+            completion_tokens=50,
+            cache_hit=True,
+        )
+
+        metrics = {row["stage"]: row for row in stage_metrics()}
+
+        self.assertEqual(metrics["search"]["count"], 100)
+        self.assertEqual(metrics["search"]["p50_ms"], 50.5)
+        self.assertEqual(metrics["search"]["p95_ms"], 95.0)
+        self.assertEqual(metrics["insight"]["prompt_tokens"], 100)
+        self.assertEqual(metrics["insight"]["cache_hit_rate"], 1.0)
+
+
+class PipelineMetricsViewTest(TestCase):
+    def setUp(self):
+        self.staff = User.objects.create_user(
+            email="staff@example.com",
+            username="staffuser",
+            password="password123",
+            first_name="Jane",
+            last_name="Doe",
+            slug="jane-doe",
+            is_staff=True,
+        )
+        self.user = User.objects.create_user(
+            email="test@example.com",
+            username="testuser",
+            password="password123",
+            first_name="John",
+            last_name="Doe",
+            slug="john-doe",
+        )
+        self.client = APIClient()
+        PipelineSpan.objects.create(stage=PipelineSpan.Stage.COMPILE, duration_ms=12)
+
+    def test_staff_gets_stage_metrics(self):
+        """Test that staff users get aggregates per stage."""
+        self.client.force_authenticate(user=self.staff)
+
+        response = self.client.get(METRICS_URL, {"days": 1})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data[0]["stage"], "compile")
+        self.assertEqual(response.data[0]["p95_ms"], 12.0)
+
+    def test_non_staff_is_forbidden(self):
+        """Test that non-staff users cannot read pipeline metrics."""
+        self.client.force_authenticate(user=self.user)
+
+        response = self.client.get(METRICS_URL)
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_invalid_days(self):
+        """Test that days outside 1 to 90 are rejected."""
+        self.client.force_authenticate(user=self.staff)
+
+        for days in ("0", "91", "1000000", "week"):
+            with self.subTest(days=days):
+                response = self.client.get(METRICS_URL, {"days": days})
+
+                self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
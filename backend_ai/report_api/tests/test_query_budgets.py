@@ -0,0 +1,103 @@
+from unittest.mock import patch
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework.test import APIClient
+from backend_ai.query_inspection import QueryBudgetMixin
+from core_db_ai.models import User, Agent, Property, AIReport
+
+REPORT_LIST_URL = reverse("report-list")
+MY_REPORTS_URL = reverse("report-my-reports")
+METRICS_URL = reverse("report-pipeline-metrics")
+REPORT_DETAIL_URL = lambda pk: reverse("report-detail", kwargs={"pk": pk})
+
+
+# Budgets are the queries of each endpoint today. Requests use
+# force_authenticate, so the JWT user lookup is not part of them.
+class ReportQueryBudgetTest(QueryBudgetMixin, TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            email="test@example.com",
+            username="testuser",
+            password="password123",
+            first_name="John",
+            last_name="Doe",
+            slug="john-doe",
+        )
+        self.staff = User.objects.create_user(
+            email="staff@example.com",
+            username="staffuser",
+            password="password123",
+            first_name="Jane",
+            last_name="Doe",
+            slug="jane-doe",
+            is_staff=True,
+        )
+        agent = Agent.objects.create(
+            user=self.staff, company_name="Dream Realty", bio="Expert in urban lofts"
+        )
+        self.properties = Property.objects.bulk_create(
+            Property(
+                agent=agent,
+                title=f"Modern Condo {i}",
+                description="A beautiful condo in the city center",
+                beds=2,
+                baths=2,
+                price=500000.00,
+                area_sqft=1200,
+                address="area=Midtown, city=Austin",
+                slug=f"modern-condo-{i}",
+            )
+            for i in range(6)
+        )
+        # Several reports, so per-row queries would show up as repeats
+        self.reports = AIReport.objects.bulk_create(
+            AIReport(property=prop, user=self.user, status=AIReport.Status.COMPLETED)
+            for prop in self.properties[:5]
+        )
+
+    def test_list_budget(self):
+        """Test that the staff report list stays within its query budget."""
+        self.client.force_authenticate(user=self.staff)
+        with self.assertQueryBudget(2, max_repeats=1):
+            response = self.client.get(REPORT_LIST_URL)
+        self.assertEqual(response.status_code, 200)
+
+    def test_my_reports_budget(self):
+        """Test that my-reports stays within its query budget."""
+        self.client.force_authenticate(user=self.user)
+        with self.assertQueryBudget(2, max_repeats=1):
+            response = self.client.get(MY_REPORTS_URL)
+        self.assertEqual(response.status_code, 200)
+
+    def test_retrieve_budget(self):
+        """Test that retrieving a report stays within its query budget."""
+        self.client.force_authenticate(user=self.user)
+        with self.assertQueryBudget(1):
+            response = self.client.get(REPORT_DETAIL_URL(self.reports[0].id))
+        self.assertEqual(response.status_code, 200)
+
+    def test_pipeline_metrics_budget(self):
+        """Test that pipeline metrics stay within their query budget."""
+        self.client.force_authenticate(user=self.staff)
+        with self.assertQueryBudget(1):
+            response = self.client.get(METRICS_URL)
+        self.assertEqual(response.status_code, 200)
+
+    @patch("report_api.views.parallel_report_generator.delay")
+    def test_create_budget(self, delay):
+        """Test that creating a report stays within its query budget."""
+        self.client.force_authenticate(user=self.user)
+        with self.assertQueryBudget(7):
+            response = self.client.post(
+                REPORT_LIST_URL, {"property_id": self.properties[5].id}, format="json"
+            )
+        self.assertEqual(response.status_code, 202)
+        delay.assert_called_once()
+
+    def test_destroy_budget(self):
+        """Test that deleting a report stays within its query budget."""
+        self.client.force_authenticate(user=self.user)
+        with self.assertQueryBudget(4):
+            response = self.client.delete(REPORT_DETAIL_URL(self.reports[0].id))
+        self.assertEqual(response.status_code, 200)
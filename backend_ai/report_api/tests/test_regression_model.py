@@ -0,0 +1,161 @@
+import json
+import numpy as np
+from django.test import SimpleTestCase
+from report_api.regression_model import (
+    InvestmentRegressor,
+    MarketModelFitter,
+    fit_least_squares,
+)
+
+AVERAGES = {
+    "avg_price": 520000.0,
+    "avg_pps": 350.0,
+    "avg_beds": 3.0,
+    "avg_baths": 2.0,
+}
+
+
+def make_comparables(seed, count=40, missing=0.1):
+    """Random neighbourhood with some missing prices and features."""
+    rng = np.random.default_rng(seed)
+    comparables = []
+    for _ in range(count):
+        beds = int(rng.integers(1, 6))
+        baths = int(rng.integers(1, 4))
+        area_sqft = int(rng.normal(1500, 350))
+        price = int(area_sqft * rng.normal(350, 40) + beds * 15000)
+        item = {"price": price, "area_sqft": area_sqft, "beds": beds, "baths": baths}
+        for key in item:
+            if rng.random() < missing:
+                item[key] = None
+        comparables.append(item)
+    return comparables
+
+
+class InvestmentRegressorParityTest(SimpleTestCase):
+    def assert_same_rating(self, compiled_data, property_data):
+        numpy_rating, numpy_breakdown = InvestmentRegressor(
+            **AVERAGES, engine="numpy"
+        ).calculate_rating(compiled_data, property_data)
+        sklearn_rating, sklearn_breakdown = InvestmentRegressor(
+            **AVERAGES, engine="sklearn"
+        ).calculate_rating(compiled_data, property_data)
+
+        self.assertEqual(numpy_rating, sklearn_rating)
+        self.assertEqual(numpy_breakdown.keys(), sklearn_breakdown.keys())
+        for key, value in sklearn_breakdown.items():
+            if isinstance(value, str):
+                self.assertEqual(numpy_breakdown[key], value, key)
+            else:
+                np.testing.assert_allclose(
+                    numpy_breakdown[key], value, rtol=1e-9, err_msg=key
+                )
+
+    def test_least_squares_matches_linear_regression(self):
+        """Test that the closed-form fit matches sklearn's coefficients."""
+        from sklearn.linear_model import (  # pylint: disable=C0415
+            LinearRegression,
+        )
+
+        rng = np.random.default_rng(7)
+        X = rng.normal(1500, 300, size=(50, 3))
+        y = X @ np.array([320.0, 12000.0, 8000.0]) + rng.normal(0, 20000, 50)
+
+        intercept, coef = fit_least_squares(X, y)
+        model = LinearRegression().fit(X, y)
+
+        np.testing.assert_allclose(coef, model.coef_, rtol=1e-9)
+        np.testing.assert_allclose(intercept, model.intercept_, rtol=1e-9)
+
+    def test_regression_branch_parity(self):
+        """Test that both engines rate typical properties the same."""
+        subjects = [
+            {"price": 450000, "area_sqft": 1400, "beds": 3, "baths": 2},
+            {"price": 700000, "area_sqft": 1600, "beds": 2, "baths": 1},
+            {"price": 300000, "area_sqft": 1100, "beds": 4, "baths": 3},
+        ]
+        for seed in range(20):
+            compiled_data = make_comparables(seed)
+            for property_data in subjects:
+                with self.subTest(seed=seed, property_data=property_data):
+                    self.assert_same_rating(compiled_data, property_data)
+
+    def test_market_adjustment_branch_parity(self):
+        """Test that both engines rate oversized properties the same."""
+        property_data = {"price": 900000, "area_sqft": 2600, "beds": 5, "baths": 3}
+        for seed in range(20):
+            with self.subTest(seed=seed):
+                self.assert_same_rating(make_comparables(seed), property_data)
+
+    def test_single_bedroom_tier_parity(self):
+        """Test the bed premium fallback when every comparable has the same beds."""
+        compiled_data = make_comparables(3, missing=0)
+        for item in compiled_data:
+            item["beds"] = 3
+        property_data = {"price": 900000, "area_sqft": 2600, "beds": 5, "baths": 3}
+        self.assert_same_rating(compiled_data, property_data)
+
+    def test_too_few_samples(self):
+        """Test that the neutral rating is returned below min_samples."""
+        compiled_data = make_comparables(1, count=5, missing=0)
+        property_data = {"price": 450000, "area_sqft": 1400, "beds": 3, "baths": 2}
+        for engine in ("numpy", "sklearn"):
+            regressor = InvestmentRegressor(**AVERAGES, engine=engine)
+            self.assertEqual(
+                regressor.calculate_rating(compiled_data, property_data), (2.5, {})
+            )
+
+    def test_unknown_engine(self):
+        """Test that an unknown engine is rejected."""
+        with self.assertRaises(ValueError):
+            InvestmentRegressor(**AVERAGES, engine="torch")
+
+
+class MarketModelTest(SimpleTestCase):
+    def test_score_matches_calculate_rating(self):
+        """Test that scoring the stored model matches a full refit."""
+        subjects = [
+            {"price": 450000, "area_sqft": 1400, "beds": 3, "baths": 2},
+            {"price": 900000, "area_sqft": 2600, "beds": 5, "baths": 3},
+        ]
+        for seed in range(5):
+            compiled_data = make_comparables(seed)
+            market_model = json.loads(
+                json.dumps(MarketModelFitter().fit(compiled_data), allow_nan=False)
+            )
+            for property_data in subjects:
+                with self.subTest(seed=seed, property_data=property_data):
+                    self.assertEqual(
+                        InvestmentRegressor(**AVERAGES).score(
+                            market_model, property_data
+                        ),
+                        InvestmentRegressor(**AVERAGES).calculate_rating(
+                            compiled_data, property_data
+                        ),
+                    )
+
+    def test_model_is_compact_json(self):
+        """Test that the model only holds plain JSON values."""
+        compiled_data = make_comparables(2, missing=0)
+        for item in compiled_data:
+            item["beds"] = 3
+        compiled_data[0]["price"] = None
+        compiled_data = compiled_data[:11]
+
+        market_model = MarketModelFitter().fit(compiled_data)
+
+        self.assertEqual(market_model["n"], 10)
+        self.assertEqual(len(market_model["coef"]), 3)
+        self.assertEqual(len(market_model["medians"]), 3)
+        json.dumps(market_model, allow_nan=False)
+
+    def test_too_few_samples(self):
+        """Test that no model is fitted below min_samples."""
+        self.assertIsNone(MarketModelFitter().fit(make_comparables(1, count=5)))
+        self.assertIsNone(MarketModelFitter().fit([]))
+        self.assertEqual(
+            InvestmentRegressor(**AVERAGES).score(
+                None, {"price": 450000, "area_sqft": 1400, "beds": 3, "baths": 2}
+            ),
+            (2.5, {}),
+        )
@@ -0,0 +1,77 @@
+from unittest.mock import patch
+from django.test import TestCase
+from core_db_ai.models import User, Agent, Property, AIReport
+from report_api.regression_model import MarketModelFitter
+from report_api.tasks import report_finalizer
+from report_api.tests.test_regression_model import make_comparables
+
+
+class ReportFinalizerTest(TestCase):
+    def setUp(self):
+        user = User.objects.create_user(
+            email="test@example.com",
+            username="testuser",
+            password="password123",
+            first_name="John",
+            last_name="Doe",
+            slug="john-doe",
+        )
+        agent = Agent.objects.create(
+            user=user, company_name="Dream Realty", bio="Expert in urban lofts"
+        )
+        property_obj = Property.objects.create(
+            agent=agent,
+            title="Modern Condo",
+            description="A beautiful condo in the city center",
+            beds=2,
+            baths=2,
+            price=500000.00,
+            area_sqft=1200,
+            address="123 Main St",
+            slug="modern-condo",
+        )
+        self.report = AIReport.objects.create(property=property_obj, user=user)
+        self.analysis_result = {
+            "avg_market_price": 520000,
+            "avg_price_per_sqft": 350,
+            "avg_beds": 3,
+            "avg_baths": 2,
+            "investment_rating": 3.5,
+            "ai_insight_summary": {
+                "investment_summary": "Fair price",
+                "weighted_analysis": "Balanced",
+                "pros": ["Location"],
+                "cons": ["Small"],
+            },
+        }
+
+    def test_finalizer_stores_market_model(self):
+        """Test that the market model is fitted once and stored on the report."""
+        compiled_data = make_comparables(0)
+
+        report_finalizer(self.analysis_result, compiled_data, self.report.id)
+
+        self.report.refresh_from_db()
+        self.assertEqual(self.report.status, AIReport.Status.COMPLETED)
+        self.assertEqual(len(self.report.market_model["coef"]), 3)
+
+    def test_finalizer_without_enough_comparables(self):
+        """Test that the report completes without a model for sparse data."""
+        report_finalizer(self.analysis_result, make_comparables(0, 3), self.report.id)
+
+        self.report.refresh_from_db()
+        self.assertEqual(self.report.status, AIReport.Status.COMPLETED)
+        self.assertIsNone(self.report.market_model)
+
+    def test_finalizer_keeps_the_analysis_market_model(self):
+        """Test that a model fitted by the analysis is stored without a refit."""
+        compiled_data = make_comparables(0)
+        market_model = MarketModelFitter().fit(compiled_data)
+        analysis_result = {**self.analysis_result, "market_model": market_model}
+
+        with patch.object(MarketModelFitter, "fit") as fit:
+            report_finalizer(analysis_result, compiled_data, self.report.id)
+
+        fit.assert_not_called()
+        self.report.refresh_from_db()
+        self.assertEqual(self.report.market_model, market_model)
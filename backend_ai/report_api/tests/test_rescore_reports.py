@@ -0,0 +1,82 @@
+from decimal import Decimal
+from io import StringIO
+from django.core.management import call_command
+from django.test import TestCase
+from core_db_ai.models import User, Agent, Property, AIReport
+from report_api.tasks import rescore_report_batch
+from report_api.tests.test_regression_model import make_comparables
+
+
+class RescoreReportsTest(TestCase):
+    def setUp(self):
+        user = User.objects.create_user(
+            email="test@example.com",
+            username="testuser",
+            password="password123",
+            first_name="John",
+            last_name="Doe",
+            slug="john-doe",
+        )
+        agent = Agent.objects.create(
+            user=user, company_name="Dream Realty", bio="Expert in urban lofts"
+        )
+        property_obj = Property.objects.create(
+            agent=agent,
+            title="Modern Condo",
+            description="A beautiful condo in the city center",
+            beds=3,
+            baths=2,
+            price=450000.00,
+            area_sqft=1400,
+            address="123 Main St",
+            slug="modern-condo",
+        )
+        report_fields = {
+            "property": property_obj,
+            "user": user,
+            "avg_market_price": 520000,
+            "avg_price_per_sqft": 350,
+            "avg_beds": 3,
+            "avg_baths": 2,
+            "investment_rating": Decimal("0.0"),
+        }
+        self.reports = [
+            AIReport.objects.create(
+                status=AIReport.Status.COMPLETED,
+                comparable_data=make_comparables(seed),
+                **report_fields,
+            )
+            for seed in range(3)
+        ]
+        self.pending = AIReport.objects.create(
+            status=AIReport.Status.PENDING,
+            comparable_data=make_comparables(9),
+            **report_fields,
+        )
+
+    def assert_rescored(self):
+        for report in self.reports:
+            report.refresh_from_db()
+            self.assertGreater(report.investment_rating, 0)
+            self.assertEqual(len(report.market_model["coef"]), 3)
+
+        self.pending.refresh_from_db()
+        self.assertEqual(self.pending.investment_rating, 0)
+        self.assertIsNone(self.pending.market_model)
+
+    def test_command_rescores_completed_reports(self):
+        """Test that the command updates every completed report."""
+        out = StringIO()
+        call_command(
+            "rescore_reports", batch_size=2, workers=1, stdout=out, stderr=StringIO()
+        )
+
+        self.assertIn("Re-scored 3 reports", out.getvalue())
+        self.assert_rescored()
+
+    def test_batch_task_rescores_reports(self):
+        """Test that the Celery batch task updates the given reports."""
+        updated = rescore_report_batch([report.id for report in self.reports])
+
+        self.assertEqual(updated, 3)
+        self.assert_rescored()
@@ -0,0 +1,34 @@
+from django.conf import settings
+from django.test import SimpleTestCase
+from backend_ai.celery import app
+
+
+class TaskRoutesTest(SimpleTestCase):
+    def route(self, task_name):
+        options = app.amqp.router.route({}, task_name)
+        return options["queue"].name, options.get("priority")
+
+    def test_chat_tasks_have_own_queue(self):
+        """Test that chat tasks never wait behind report work."""
+        self.assertEqual(
+            self.route("chat_api.tasks.generate_ai_chat_response"),
+            ("chat", settings.CHAT_PRIORITY),
+        )
+
+    def test_report_tasks_split_by_workload(self):
+        """Test that I/O and CPU bound report tasks go to their own queues."""
+        self.assertEqual(
+            self.route("report_api.tasks.search_properties"),
+            ("report_io", settings.REPORT_PRIORITY),
+        )
+        self.assertEqual(
+            self.route("report_api.tasks.report_finalizer"),
+            ("report_cpu", settings.REPORT_PRIORITY),
+        )
+
+    def test_batch_rescoring_has_lowest_priority(self):
+        """Test that re-scoring batches yield to user requested reports."""
+        self.assertEqual(
+            self.route("report_api.tasks.rescore_report_batch"),
+            ("report_cpu", settings.BATCH_PRIORITY),
+        )
@@ -0,0 +1,57 @@
+from unittest.mock import patch
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from rest_framework.test import APIClient
+from core_db_ai.models import User
+
+REPORT_LIST_URL = reverse("report-list")
+MY_REPORTS_URL = reverse("report-my-reports")
+
+
+@override_settings(THROTTLE_ENABLED=True)
+@patch("backend_ai.throttling.get_redis_connection")
+class ReportThrottlingTest(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            email="test@example.com",
+            username="testuser",
+            password="password123",
+            first_name="John",
+            last_name="Doe",
+            slug="john-doe",
+        )
+        self.client.force_authenticate(user=self.user)
+
+    def test_report_creation_is_limited_per_user_and_ip(self, get_redis_connection):
+        """Test that creating a report checks the user and the IP rate."""
+        evalsha = get_redis_connection.return_value.evalsha
+        evalsha.return_value = 0
+
+        response = self.client.post(REPORT_LIST_URL, {}, format="json")
+
+        self.assertEqual(response.status_code, 400)
+        user_call, ip_call = evalsha.call_args_list
+        self.assertTrue(
+            user_call.args[2].endswith(f"throttle_report_user_{self.user.pk}")
+        )
+        self.assertTrue(ip_call.args[2].endswith("throttle_report_ip_127.0.0.1"))
+        # 10/hour: one report every 6 minutes, an hour of burst
+        self.assertEqual(list(user_call.args[3:]), [360000, 3600000])
+
+    def test_throttled_report_sets_retry_after(self, get_redis_connection):
+        """Test that a throttled report request returns 429 with Retry-After."""
+        evalsha = get_redis_connection.return_value.evalsha
+        evalsha.return_value = 125400
+
+        response = self.client.post(REPORT_LIST_URL, {}, format="json")
+
+        self.assertEqual(response.status_code, 429)
+        self.assertEqual(response["Retry-After"], "126")
+
+    def test_reading_reports_is_not_throttled(self, get_redis_connection):
+        """Test that listing reports never runs the throttle."""
+        response = self.client.get(MY_REPORTS_URL)
+
+        self.assertEqual(response.status_code, 200)
+        get_redis_connection.assert_not_called()
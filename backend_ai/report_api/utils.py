@@ -1,4 +1,5 @@
 import re
+import html
 import random
 from decimal import Decimal, ROUND_DOWN
 import numpy as np
@@ -70,26 +71,42 @@ def extract_location(address_string):
     return location_data.get("area"), location_data.get("city")
 
 
+JUNK_PATTERN = re.compile(
+    r"Click to see more|View details|Read more|Find out why.*|Follow us on.*"
+    r"|Save this home|Terms and Conditions|Privacy Policy|Cookie (?:Policy|Settings)"
+    r"|Skip to (?:main )?content|Sign (?:in|up)|Share this (?:home|listing)"
+    r"|Request a tour|Contact (?:agent|us)|Get pre-approved|See all \d* ?photos"
+    r"|Back to (?:top|search)|Advertisement",
+    flags=re.IGNORECASE,
+)
+HTML_TAG = re.compile(
+    r"<(?:script|style)\b.*?</(?:script|style)>|<[a-zA-Z/!][^>]*>", re.DOTALL
+)
+MARKDOWN_IMAGE = re.compile(r"!\[[^\]]*\]\([^)]*\)")
+MARKDOWN_LINK = re.compile(r"\[([^\]]*)\]\([^)]*\)")
+BLANK_LINES = re.compile(r"\n\s*\n")
+SPACES = re.compile(r"[ \t\xa0]+")
+LINE_EDGES = re.compile(r" *\n *")
+
+
 def clean_context(text):
-    # Remove multiple newlines and extra spaces
+    """
+    Strips HTML remnants, markdown links and boilerplate phrases.
+    Patterns are compiled once, \n---\n source separators are kept.
+    """
     text = text.replace("\n---\n", "||SEP||")
 
-    junk_phrases = [
-        r"Click to see more",
-        r"View details",
-        r"Read more",
-        r"Find out why.*",
-        r"Follow us on.*",
-        r"Save this home",
-        r"Terms and Conditions",
-    ]
-    for pattern in junk_phrases:
-        text = re.sub(pattern, "", text, flags=re.IGNORECASE)
+    text = html.unescape(HTML_TAG.sub(" ", text))
+    text = MARKDOWN_IMAGE.sub("", text)
+    text = MARKDOWN_LINK.sub(r"\1", text)
+    text = JUNK_PATTERN.sub("", text)
 
-    text = re.sub(r"\n\s*\n", "\n", text)
-    text = re.sub(r" +", " ", text)
+    # Remove multiple newlines and extra spaces
+    text = BLANK_LINES.sub("\n", text)
+    text = SPACES.sub(" ", text)
 
     text = text.replace("||SEP||", "\n---\n")
+    text = LINE_EDGES.sub("\n", text)
     return text.strip()
 
 
@@ -128,40 +145,122 @@ def split_context(text, max_chars=10000):
     return chunks
 
 
-def clean_properties(item, property_data):
-    SQFT_VARIANCE = 0.20
-    BED_VARIANCE = 1
-    BATH_VARIANCE = 1
+COMPARABLE_FIELDS = ["price", "area_sqft", "beds", "baths"]
 
+
+def to_float(value):
+    """Converts a single value to float, NaN if it cannot be parsed."""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return np.nan
+
+
+INTEGER_PART = re.compile(r"\.[^\n]*")
+
+
+def parse_numeric_column(values, strip_chars="", integer_part=False):
+    """
+    Parses a column of raw LLM values (numbers or strings like "$612,000")
+    into floats at once. Anything that cannot be parsed becomes NaN.
+    """
+    # Fast path, plain JSON numbers and numeric strings convert in C
+    try:
+        return np.array(values, dtype=float)
+    except (TypeError, ValueError):
+        pass
+
+    # Clean the whole column as a single string instead of per value
+    text = "\n".join(map(str, values))
+    for char in strip_chars:
+        text = text.replace(char, "")
+    if integer_part:
+        text = INTEGER_PART.sub("", text)
+
+    lines = text.split("\n")
+    if len(lines) != len(values):
+        # A value contained a newline, clean each value separately
+        lines = [str(value) for value in values]
+        for char in strip_chars:
+            lines = [line.replace(char, "") for line in lines]
+        if integer_part:
+            lines = [line.split(".", maxsplit=1)[0] for line in lines]
+
+    try:
+        return np.array(lines, dtype=float)
+    except ValueError:
+        return np.array([to_float(line) for line in lines], dtype=float)
+
+
+# Window around the subject property comparables must fall in
+SQFT_VARIANCE = 0.20
+BED_VARIANCE = 1
+BATH_VARIANCE = 1
+
+
+def parse_comparable_matrix(items):
+    """
+    Integer (price, sqft, beds, baths) rows of the raw LLM items, rows with a
+    value that does not parse are dropped.
+    """
+    columns = {
+        field: [item.get(field, 0) for item in items] for field in COMPARABLE_FIELDS
+    }
+
+    matrix = np.column_stack(
+        [
+            parse_numeric_column(columns["price"], "$,", integer_part=True),
+            parse_numeric_column(columns["area_sqft"], ","),
+            parse_numeric_column(columns["beds"]),
+            parse_numeric_column(columns["baths"]),
+        ]
+    )
+    # Non finite or absurdly large values cannot be cast to int64 safely
+    parsed = (np.isfinite(matrix) & (np.abs(matrix) < 2**53)).all(axis=1)
+    return np.trunc(matrix[parsed]).astype(np.int64)
+
+
+def comparable_mask(matrix, property_data):
+    """Valid rows inside the sqft/bed/bath variance window of the property."""
     target_sqft = property_data.get("area_sqft")
     target_beds = property_data.get("beds")
     target_baths = property_data.get("baths")
+    price, sqft, beds, baths = matrix.T
 
-    price = int(
-        str(item.get("price", 0))
-        .replace("$", "")
-        .replace(",", "")
-        .split(".", maxsplit=1)[0]
+    mask = (price > 10000) & (sqft > 100) & (beds > 0) & (baths > 0)
+    mask &= (target_sqft * (1 - SQFT_VARIANCE) <= sqft) & (
+        sqft <= target_sqft * (1 + SQFT_VARIANCE)
     )
-    sqft = int(float(str(item.get("area_sqft", 0)).replace(",", "")))
-    beds = int(float(str(item.get("beds", 0))))
-    baths = int(float(str(item.get("baths", 0))))
+    mask &= (target_beds - BED_VARIANCE <= beds) & (beds <= target_beds + BED_VARIANCE)
+    mask &= (target_baths - BATH_VARIANCE <= baths) & (
+        baths <= target_baths + BATH_VARIANCE
+    )
+    return mask
+
+
+def clean_properties_batch(results, property_data):
+    """
+    Batch cleans every fork's raw properties at once.
+    Parses the columns, drops invalid rows and rows outside the sqft/bed/bath
+    variance window, then dedupes on the integer tuple keeping first seen order.
+    """
+    items = [
+        item for chunk in results if chunk for item in chunk if isinstance(item, dict)
+    ]
 
-    if price <= 10000 or sqft <= 100 or beds <= 0 or baths <= 0:
-        raise ValueError
+    if not items:
+        return []
 
-    if not (
-        target_sqft * (1 - SQFT_VARIANCE) <= sqft <= target_sqft * (1 + SQFT_VARIANCE)
-    ):
-        raise ValueError
+    matrix = parse_comparable_matrix(items)
+    matrix = matrix[comparable_mask(matrix, property_data)]
 
-    if not target_beds - BED_VARIANCE <= beds <= target_beds + BED_VARIANCE:
-        raise ValueError
+    if len(matrix) == 0:
+        return []
 
-    if not target_baths - BATH_VARIANCE <= baths <= target_baths + BATH_VARIANCE:
-        raise ValueError
+    _, first_index = np.unique(matrix, axis=0, return_index=True)
+    matrix = matrix[np.sort(first_index)]
 
-    return price, sqft, beds, baths
+    return [dict(zip(COMPARABLE_FIELDS, row)) for row in matrix.tolist()]
 
 
 def clamp_decimal(value, max_digits, decimal_places):
@@ -256,6 +355,50 @@ def calculate_market_adjustments(df):
     }
 
 
+def nan_median(values):
+    """Median ignoring NaN, NaN for an empty or all NaN column (pandas semantics)."""
+    values = values[~np.isnan(values)]
+    if len(values) == 0:
+        return np.nan
+    return np.median(values)
+
+
+def calculate_market_adjustments_np(prices, area_sqft, beds):
+    """
+    NumPy version of calculate_market_adjustments.
+    Works on the raw comparable columns, NaN marks a missing value.
+    """
+    # Average price jump between bedroom counts
+    bed_tiers = np.unique(beds[~np.isnan(beds)])
+    bed_medians = np.array([nan_median(prices[beds == tier]) for tier in bed_tiers])
+    bed_diffs = np.diff(bed_medians)
+    bed_diffs = bed_diffs[~np.isnan(bed_diffs)]
+
+    if len(bed_medians) > 1:
+        # Price difference between each tier (e.g., 4-bed median minus 3-bed median)
+        bed_premium = bed_diffs.mean() if len(bed_diffs) > 0 else np.nan
+    else:
+        # If no variation, an extra bed is typically worth ~10-12% of avg price
+        bed_premium = nan_median(prices) * 0.11
+
+    # Excess square footage is valued at 40% of the total PPS
+    avg_pps = nan_median(prices) / nan_median(area_sqft)
+    marginal_pps = avg_pps * 0.40
+
+    # House rarely sells for more than 2 SDs above the mean
+    known_prices = prices[~np.isnan(prices)]
+    price_mean = known_prices.mean() if len(known_prices) > 0 else np.nan
+    price_std = known_prices.std(ddof=1) if len(known_prices) > 1 else np.nan
+    market_ceiling = price_mean + (2 * price_std)
+
+    return {
+        "bed_premium": bed_premium,
+        "avg_pps": avg_pps,
+        "marginal_pps": marginal_pps,
+        "market_ceiling": market_ceiling,
+    }
+
+
 def generate_price_score(price, predicted_price):
     # Price ratio (20% discount = 2.0 | 30% premium = -2.0)
     diff_pct = (predicted_price - price) / predicted_price
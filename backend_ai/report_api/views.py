@@ -8,10 +8,13 @@ from drf_spectacular.utils import extend_schema, OpenApiExample, OpenApiResponse
 from django_filters.rest_framework import DjangoFilterBackend
 from backend_ai.mixins import http_method_mixin
 from backend_ai.renderers import ViewRenderer
+from backend_ai.throttling import IPRateThrottle, UserRateThrottle
 from backend_ai.schema_serializers import (
     AIReportRequestSerializer,
     ErrorResponseSerializer,
+    PipelineStageMetricSerializer,
 )
+from backend_ai.tracing import MAX_METRICS_DAYS, stage_metrics
 from core_db_ai.models import AIReport, Property
 from .serializers import (
     AIReportSerializer,
@@ -36,6 +39,14 @@ class AIReportViewSet(ModelViewSet):
     filterset_class = AIReportFilter
     pagination_class = AIReportPagination
     http_method_names = ["get", "post", "delete"]
+    throttle_classes = [UserRateThrottle, IPRateThrottle]
+    throttle_scope = "report"
+
+    def get_throttles(self):
+        """Only report creation is throttled, it queues the LLM pipeline."""
+        if self.action == "create":
+            return super().get_throttles()
+        return []
 
     def get_serializer_class(self):
         """Assign serializer based on action."""
@@ -160,6 +171,66 @@ class AIReportViewSet(ModelViewSet):
         serializer = self.get_serializer(filtered_queryset, many=True)
         return Response(serializer.data)
 
+    @extend_schema(
+        summary="Pipeline Stage Metrics",
+        description=(
+            "Returns p50 / p95 latency, tokens, retries and cache hits per "
+            "report and chat pipeline stage over the last `days` (default 7, "
+            "at most 90)."
+        ),
+        tags=["AI Reports"],
+        request=None,
+        responses={
+            status.HTTP_200_OK: PipelineStageMetricSerializer(many=True),
+            status.HTTP_400_BAD_REQUEST: ErrorResponseSerializer,
+            status.HTTP_401_UNAUTHORIZED: ErrorResponseSerializer,
+            status.HTTP_403_FORBIDDEN: OpenApiResponse(
+                response=ErrorResponseSerializer,
+                description="Forbidden. User is not a staff.",
+            ),
+        },
+        examples=[
+            OpenApiExample(
+                name="Invalid Days",
+                response_only=True,
+                status_codes=["400"],
+                value={"error": "days must be an integer from 1 to 90."},
+            ),
+            OpenApiExample(
+                name="Unauthorized Access",
+                response_only=True,
+                status_codes=["401"],
+                value={"error": "You are not authenticated."},
+            ),
+            OpenApiExample(
+                name="Forbidden Field Error",
+                response_only=True,
+                status_codes=["403"],
+                value={"error": "Only staff users can access this endpoint."},
+            ),
+        ],
+    )
+    @action(detail=False, methods=["GET"], url_path="pipeline-metrics")
+    def pipeline_metrics(self, request, *args, **kwargs):
+        """Latency percentiles per pipeline stage."""
+        if not request.user.is_staff:
+            return Response(
+                {"error": "Only staff users can access this endpoint."},
+                status=status.HTTP_403_FORBIDDEN,
+            )
+
+        try:
+            days = int(request.query_params.get("days", 7))
+            if not 1 <= days <= MAX_METRICS_DAYS:
+                raise ValueError
+        except ValueError:
+            return Response(
+                {"error": f"days must be an integer from 1 to {MAX_METRICS_DAYS}."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        return Response(stage_metrics(days), status=status.HTTP_200_OK)
+
     @extend_schema(
         summary="Retrieve Single Report Details",
         description="Returns the details of a specific report by ID.",
@@ -214,6 +285,13 @@ class AIReportViewSet(ModelViewSet):
                 response=ErrorResponseSerializer,
                 description="Forbidden. Report cannot be created by staffs.",
             ),
+            status.HTTP_429_TOO_MANY_REQUESTS: OpenApiResponse(
+                response=ErrorResponseSerializer,
+                description=(
+                    "Too many reports requested. Retry-After holds the seconds "
+                    "to wait."
+                ),
+            ),
             status.HTTP_500_INTERNAL_SERVER_ERROR: ErrorResponseSerializer,
         },
         examples=[
@@ -382,19 +460,20 @@ class AIReportViewSet(ModelViewSet):
         current_user = self.request.user
         report_to_delete = self.get_object()
 
-        if report_to_delete.user != current_user and not current_user.is_superuser:
+        if (
+            report_to_delete.user_id != current_user.id
+            and not current_user.is_superuser
+        ):
             return Response(
                 {"error": "You are not authorized to delete this report."},
                 status=status.HTTP_403_FORBIDDEN,
             )
 
         report_id = report_to_delete.id
-        response = super().destroy(request, *args, **kwargs)
+        # The report is already loaded, super().destroy would fetch it again
+        self.perform_destroy(report_to_delete)
 
-        if response.status_code == status.HTTP_204_NO_CONTENT:
-            return Response(
-                {"success": f"Report with ID {report_id} deleted successfully."},
-                status=status.HTTP_200_OK,
-            )
-
-        return response
+        return Response(
+            {"success": f"Report with ID {report_id} deleted successfully."},
+            status=status.HTTP_200_OK,
+        )
@@ -29,6 +29,9 @@ infisical run --path="/Real-Estate/backend-ai" -- sh -c '
     if [ "$DJANGO_ENV" = "production" ]; then
       # PRODUCTION: Gunicorn with Uvicorn workers
       echo "Starting Gunicorn with Uvicorn workers (ASGI Production)..."
+      # Per-worker metric files for /metrics, cleared so restarts start from zero
+      export PROMETHEUS_MULTIPROC_DIR=/tmp/prometheus
+      rm -rf "$PROMETHEUS_MULTIPROC_DIR" && mkdir -p "$PROMETHEUS_MULTIPROC_DIR"
       gunicorn backend_ai.asgi:application \
                --bind 0.0.0.0:8001 \
                --workers 4 \
@@ -39,6 +42,10 @@ infisical run --path="/Real-Estate/backend-ai" -- sh -c '
       echo "Starting Uvicorn development server..."
       uvicorn backend_ai.asgi:application --host 0.0.0.0 --port 8001 --reload
     fi
+  elif [ "$SERVICE_TYPE" = "ai-standin" ]; then
+    # Local Groq / Tavily stand-in for offline load tests, see ai_standin/app.py
+    echo "Starting AI provider stand-in on port 8010..."
+    uvicorn ai_standin.app:app --host 0.0.0.0 --port 8010
   else
     # Start AI workers
     echo "Waiting for AI-API to finish migrations..."
@@ -59,8 +66,48 @@ infisical run --path="/Real-Estate/backend-ai" -- sh -c '
       [ $attempt -gt $retries ] && echo "❌ Error: AI-API migrations timed out. Worker exiting..." && exit 1
     done
 
-    # Defaulting to 4 workers if not set
-    echo "Starting HPC Celery Workers (Concurrency: ${CELERY_WORKER_CONCURRENCY:-4})..."
-    celery -A backend_ai worker --loglevel=info --concurrency=${CELERY_WORKER_CONCURRENCY:-4}
+    # Chat: threads, I/O bound LLM calls that must answer fast
+    start_chat_worker() {
+      echo "Starting Chat Celery Worker (Threads: ${CELERY_CHAT_CONCURRENCY:-8})..."
+      exec celery -A backend_ai worker --loglevel=info -n chat@%h -Q chat \
+             --pool=threads --concurrency=${CELERY_CHAT_CONCURRENCY:-8}
+    }
+
+    # Report I/O: threads, search / LLM calls spend their time waiting
+    start_report_io_worker() {
+      echo "Starting Report I/O Celery Worker (Threads: ${CELERY_IO_CONCURRENCY:-16})..."
+      exec celery -A backend_ai worker --loglevel=info -n report_io@%h -Q report_io,celery \
+             --pool=threads --concurrency=${CELERY_IO_CONCURRENCY:-16}
+    }
+
+    # Report CPU: prefork, regression and re-scoring. Defaulting to 4 processes
+    start_report_cpu_worker() {
+      echo "Starting Report CPU Celery Worker (Concurrency: ${CELERY_WORKER_CONCURRENCY:-4})..."
+      exec celery -A backend_ai worker --loglevel=info -n report_cpu@%h -Q report_cpu \
+             --pool=prefork --concurrency=${CELERY_WORKER_CONCURRENCY:-4}
+    }
+
+    case "$SERVICE_TYPE" in
+      ai-chat-worker) start_chat_worker ;;
+      ai-report-io-worker) start_report_io_worker ;;
+      ai-report-cpu-worker) start_report_cpu_worker ;;
+      *)
+        # ai-workers: every pool in one container. When one pool dies the
+        # others are stopped and the container exits, instead of running on
+        # without that queue consumer
+        start_chat_worker & chat_pid=$!
+        start_report_io_worker & io_pid=$!
+        start_report_cpu_worker & cpu_pid=$!
+        trap "kill $chat_pid $io_pid $cpu_pid 2>/dev/null" TERM INT
+        while kill -0 $chat_pid 2>/dev/null && kill -0 $io_pid 2>/dev/null \
+              && kill -0 $cpu_pid 2>/dev/null; do
+          sleep 5
+        done
+        echo "❌ A Celery worker exited, stopping the other pools..."
+        kill $chat_pid $io_pid $cpu_pid 2>/dev/null
+        wait
+        exit 1
+        ;;
+    esac
   fi
 '
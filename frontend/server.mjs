@@ -0,0 +1,21 @@
+import { createServer } from "node:http";
+import next from "next";
+
+const dev = process.env.NODE_ENV !== "production";
+const port = parseInt(process.env.PORT || "3000", 10);
+const hostname = process.env.HOSTNAME || "0.0.0.0";
+
+// Same as next start, but records the socket address of every request so
+// getClientIp can forward it when no trusted proxy sits in front of Next.
+// Any client supplied value is overwritten.
+const app = next({ dev, hostname, port });
+const handle = app.getRequestHandler();
+
+await app.prepare();
+
+createServer((req, res) => {
+  req.headers["x-remote-address"] = req.socket.remoteAddress || "";
+  handle(req, res);
+}).listen(port, hostname, () => {
+  console.log(`> Ready on http://${hostname}:${port}`);
+});
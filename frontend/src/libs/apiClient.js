@@ -1,6 +1,27 @@
+import { headers } from "next/headers";
 import { getAccessTokenFromSession } from "./cookie";
 
 const HTTPS = process.env.HTTPS === "true";
+// Set when exactly one reverse proxy (e.g. Nginx) sits in front of Next,
+// without it X-Forwarded-For comes straight from the client and is ignored
+const TRUSTED_PROXY = process.env.TRUSTED_PROXY === "true";
+
+// The backends throttle per client IP, so forward the one this server saw.
+// Behind the trusted proxy that is the last X-Forwarded-For entry, otherwise
+// the socket address recorded by server.mjs.
+const getClientIp = async () => {
+  try {
+    const requestHeaders = await headers();
+    if (TRUSTED_PROXY) {
+      const forwardedFor = requestHeaders.get("x-forwarded-for");
+      return forwardedFor ? forwardedFor.split(",").pop().trim() : null;
+    }
+    return requestHeaders.get("x-remote-address") || null;
+  } catch {
+    // Outside of a request there is no client to forward
+    return null;
+  }
+};
 
 export class ApiClient {
   constructor(baseURL) {
@@ -83,6 +104,7 @@ export class ApiClient {
     isMultipart = false,
   ) {
     const accessToken = await getAccessTokenFromSession();
+    const clientIp = await getClientIp();
     const url = `${this.baseURL}${endpoint}`;
 
     let cookieHeader = "";
@@ -94,6 +116,7 @@ export class ApiClient {
         ...(cookieHeader && { Cookie: cookieHeader.trim() }),
         ...(accessToken && { Authorization: `Bearer ${accessToken}` }),
         "NEXT-X-API-KEY": process.env.NEXT_PUBLIC_API_SECRET_KEY,
+        ...(clientIp && { "X-Forwarded-For": clientIp }),
         ...(HTTPS && { Referer: process.env.NEXT_PUBLIC_BASE_HTTPS_URL }),
       },
       credentials: "include",